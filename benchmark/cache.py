@@ -0,0 +1,233 @@
+"""
+Revenue Bench Cache - Persistent on-disk key/value cache
+
+SQLite-backed (WAL mode) so many workers, threads or processes can share one
+cache file safely. Entries expire after a TTL and the least recently used
+entries are evicted once the cache grows past its size limit.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import get_setting, sqlite_journal_mode
+
+
+class DiskCache:
+    """Persistent JSON cache with TTL and size-bounded LRU eviction"""
+    
+    EVICT_RESYNC_WRITES = 100
+    EVICT_TO_FRACTION = 0.9  # evict down to 90% of max_bytes, so evictions are rare
+    
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        name: str = "cache"
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(f"PRAGMA journal_mode={sqlite_journal_mode()}")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_created ON entries (created_at)")
+        self._conn.commit()
+        
+        # Running total of entry sizes, so writes do not re-sum the table.
+        # Other processes sharing the file also write, so it is re-read now
+        # and then (every EVICT_RESYNC_WRITES writes) and before evicting.
+        self._total_bytes = self._sum_sizes()
+        self._writes_since_sync = 0
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash JSON-serializable parts into a stable cache key"""
+        encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        
+        return json.loads(value)
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and evict least recently used entries if over the size limit"""
+        encoded = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded), now, now)
+            )
+            self._total_bytes += len(encoded) - (previous[0] if previous else 0)
+            self.writes += 1
+            self._evict()
+            self._conn.commit()
+    
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() in a worker thread, so a busy cache file never blocks the event loop"""
+        import asyncio  # Not at module level: the CLI's startup path imports this module
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, value: Any) -> None:
+        """set() in a worker thread, so a busy cache file never blocks the event loop"""
+        import asyncio
+        await asyncio.to_thread(self.set, key, value)
+    
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+            self._total_bytes -= row[0] if row else 0
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._total_bytes = 0
+    
+    def _sum_sizes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then LRU entries once over max_bytes (lock held)"""
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            if cursor.rowcount > 0:
+                self.evictions += cursor.rowcount
+                self._total_bytes = self._sum_sizes()
+        
+        if self.max_bytes is None:
+            return
+        
+        self._writes_since_sync += 1
+        if self._writes_since_sync >= self.EVICT_RESYNC_WRITES:
+            self._total_bytes = self._sum_sizes()
+            self._writes_since_sync = 0
+        if self._total_bytes <= self.max_bytes:
+            return
+        
+        # Confirm against the file before deleting anything
+        self._total_bytes = self._sum_sizes()
+        self._writes_since_sync = 0
+        if self._total_bytes <= self.max_bytes:
+            return
+        excess = self._total_bytes - int(self.max_bytes * self.EVICT_TO_FRACTION)
+        
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            doomed.append((key,))
+            excess -= size
+            self._total_bytes -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus current cache size"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size
+        }
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Caches opened in this process, by name
+_caches: Dict[str, DiskCache] = {}
+
+
+def open_cache(name: str) -> Optional[DiskCache]:
+    """Open the named cache configured under `cache.<name>` in config.yaml
+    
+    Returns None when the cache is disabled.
+    """
+    if name in _caches:
+        return _caches[name]
+    
+    settings = get_setting(f"cache.{name}", {}) or {}
+    if not settings.get("enabled", True):
+        return None
+    
+    cache_dir = Path(get_setting("cache.dir", ".cache"))
+    if not cache_dir.is_absolute():
+        cache_dir = Path(__file__).parent.parent / cache_dir
+    
+    ttl_hours = settings.get("ttl_hours")
+    max_mb = settings.get("max_mb")
+    cache = DiskCache(
+        cache_dir / f"{name}.sqlite",
+        ttl_seconds=ttl_hours * 3600 if ttl_hours is not None else None,
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb is not None else None,
+        name=name
+    )
+    _caches[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every cache used in this process"""
+    return {name: cache.stats() for name, cache in _caches.items()}
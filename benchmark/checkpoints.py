@@ -0,0 +1,225 @@
+"""
+Checkpoints - Durable per-evaluation progress so interrupted runs can resume
+
+Every finished generation (the sample's full message history and output) and
+every finished judge call is written to a SQLite checkpoint store as soon as
+it completes. With --resume, run_evaluation.py restores them instead of paying
+for them again: a run that died while judging only re-runs the judges that had
+not finished, and evaluations that were fully recorded are skipped.
+
+Generations are keyed by (model, task, prompt hash, sample, epoch); judge
+calls by that generation plus the judge panel, the judge model and the exact
+judge prompt; completed evaluations by (model, task, prompt hash, panel,
+judge mode and, for multi-epoch runs, the epoch count). Once an evaluation is complete its generations and judge calls
+are pruned: only the completion marker is needed to skip it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from inspect_ai.model import ChatMessage, ModelOutput
+from inspect_ai.solver import TaskState
+from pydantic import TypeAdapter
+
+from .cache import DiskCache
+from .config import sqlite_journal_mode
+
+DEFAULT_CHECKPOINT_PATH = Path(__file__).parent.parent / "results" / "checkpoints.sqlite"
+
+CHECKPOINT_PATH_ENV = "REVENUE_BENCH_CHECKPOINTS"
+CHECKPOINT_RESUME_ENV = "REVENUE_BENCH_RESUME"
+
+# Sample metadata field carrying the generation checkpoint key to the scorer
+CHECKPOINT_KEY_METADATA = "checkpoint_key"
+
+_messages_adapter = TypeAdapter(List[ChatMessage])
+
+
+class CheckpointStore:
+    """SQLite store of completed generations, judge calls and evaluations"""
+    
+    def __init__(self, path: Path = DEFAULT_CHECKPOINT_PATH, resume: bool = False):
+        self.path = Path(path)
+        self.resume = resume
+        self.restored_generations = 0
+        self.restored_judgements = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(f"PRAGMA journal_mode={sqlite_journal_mode()}")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS generations ("
+                " key TEXT PRIMARY KEY, model TEXT NOT NULL, task TEXT NOT NULL,"
+                " messages TEXT NOT NULL, output TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS judgements ("
+                " key TEXT PRIMARY KEY, generation_key TEXT NOT NULL, judge_model TEXT NOT NULL,"
+                " completion TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                " key TEXT PRIMARY KEY, model TEXT NOT NULL, task TEXT NOT NULL,"
+                " prompt_hash TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            # Generations record their evaluation's prompt hash so they can be pruned with it
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(generations)")}
+            if "prompt_hash" not in columns:
+                self._conn.execute("ALTER TABLE generations ADD COLUMN prompt_hash TEXT NOT NULL DEFAULT ''")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS generations_evaluation ON generations (model, task, prompt_hash)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS judgements_generation ON judgements (generation_key)"
+            )
+    
+    @staticmethod
+    def generation_key(model: str, task: str, prompt_hash: str, sample_id: Any, epoch: int = 1) -> str:
+        return DiskCache.make_key("generation", model, task, prompt_hash, str(sample_id), epoch)
+    
+    @staticmethod
+    def judge_key(generation_key: str, judge_panel: List[str], judge_model: str, judge_prompt: str) -> str:
+        return DiskCache.make_key("judge", generation_key, sorted(judge_panel), judge_model, judge_prompt)
+    
+    @staticmethod
+    def evaluation_key(
+        model: str, task: str, prompt_hash: str, judge_panel: List[str], judge_mode: str, epochs: int = 1
+    ) -> str:
+        parts = ["evaluation", model, task, prompt_hash, sorted(judge_panel), judge_mode]
+        if epochs > 1:
+            parts.append(f"epochs={epochs}")  # A multi-epoch evaluation is a different result
+        return DiskCache.make_key(*parts)
+    
+    def _fetch(self, query: str, params: tuple) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()
+    
+    def _write(self, query: str, params: tuple) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute(query, params)
+    
+    def save_generation(self, key: str, model: str, task: str, state: TaskState, prompt_hash: str = "") -> None:
+        """Checkpoint a finished generation (message history and final output)
+        
+        ``prompt_hash`` is the evaluation's (task) prompt hash, used to prune it.
+        """
+        messages = json.dumps([message.model_dump(mode="json") for message in state.messages])
+        output = state.output.model_dump_json()
+        self._write(
+            "INSERT OR REPLACE INTO generations (key, model, task, prompt_hash, messages, output, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, model, task, prompt_hash, messages, output, time.time())
+        )
+    
+    def restore_generation(self, key: str, state: TaskState) -> bool:
+        """Load a checkpointed generation into state; False if there is none"""
+        row = self._fetch("SELECT messages, output FROM generations WHERE key = ?", (key,))
+        if row is None:
+            return False
+        state.messages = _messages_adapter.validate_json(row[0])
+        state.output = ModelOutput.model_validate_json(row[1])
+        self.restored_generations += 1
+        return True
+    
+    def save_judgement(self, key: str, generation_key: str, judge_model: str, completion: str) -> None:
+        """Checkpoint a judge's raw completion once it has parsed successfully"""
+        self._write(
+            "INSERT OR REPLACE INTO judgements (key, generation_key, judge_model, completion, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, generation_key, judge_model, completion, time.time())
+        )
+    
+    def restore_judgement(self, key: str) -> Optional[str]:
+        """The checkpointed judge completion, or None"""
+        row = self._fetch("SELECT completion FROM judgements WHERE key = ?", (key,))
+        if row is None:
+            return None
+        self.restored_judgements += 1
+        return row[0]
+    
+    def mark_complete(self, key: str, model: str, task: str, prompt_hash: str) -> None:
+        """Record that an evaluation was scored and written to the results store, and prune its checkpoints"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO evaluations (key, model, task, prompt_hash, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, model, task, prompt_hash, time.time())
+                )
+                evaluation = (model, task, prompt_hash)
+                self._conn.execute(
+                    "DELETE FROM judgements WHERE generation_key IN ("
+                    " SELECT key FROM generations WHERE model = ? AND task = ? AND prompt_hash = ?)",
+                    evaluation
+                )
+                self._conn.execute(
+                    "DELETE FROM generations WHERE model = ? AND task = ? AND prompt_hash = ?", evaluation
+                )
+    
+    def is_complete(self, key: str) -> bool:
+        return self._fetch("SELECT 1 FROM evaluations WHERE key = ?", (key,)) is not None
+    
+    def stats(self) -> Dict[str, int]:
+        """Row counts plus what this process restored instead of recomputing"""
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("generations", "judgements", "evaluations")
+            }
+        counts["restored_generations"] = self.restored_generations
+        counts["restored_judgements"] = self.restored_judgements
+        return counts
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_checkpoints: Optional[CheckpointStore] = None
+
+
+def configure_checkpoints(
+    path: Optional[Path] = DEFAULT_CHECKPOINT_PATH,
+    resume: bool = False
+) -> Optional[CheckpointStore]:
+    """Activate checkpointing for this process (and for subprocesses via env vars)"""
+    global _checkpoints
+    
+    close_checkpoints()
+    if not path:
+        os.environ.pop(CHECKPOINT_PATH_ENV, None)
+        os.environ.pop(CHECKPOINT_RESUME_ENV, None)
+        return None
+    
+    _checkpoints = CheckpointStore(Path(path), resume=resume)
+    os.environ[CHECKPOINT_PATH_ENV] = str(path)
+    os.environ[CHECKPOINT_RESUME_ENV] = "1" if resume else "0"
+    return _checkpoints
+
+
+def active_checkpoints() -> Optional[CheckpointStore]:
+    """The active checkpoint store, opened from the environment on first use"""
+    global _checkpoints
+    
+    if _checkpoints is None and os.getenv(CHECKPOINT_PATH_ENV):
+        _checkpoints = CheckpointStore(
+            Path(os.environ[CHECKPOINT_PATH_ENV]),
+            resume=os.getenv(CHECKPOINT_RESUME_ENV) == "1"
+        )
+    return _checkpoints
+
+
+def close_checkpoints() -> None:
+    """Close the active checkpoint store"""
+    global _checkpoints
+    
+    if _checkpoints is not None:
+        _checkpoints.close()
+        _checkpoints = None
@@ -0,0 +1,44 @@
+"""
+Revenue Bench Config - Shared access to config.yaml
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
+_config_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load configuration from config.yaml (cached per path)"""
+    path = Path(config_path or CONFIG_PATH)
+    key = str(path.resolve())
+    if key not in _config_cache:
+        config = {}
+        if path.exists():
+            import yaml
+            with open(path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+        _config_cache[key] = config
+    return _config_cache[key]
+
+
+def get_setting(path: str, default: Any = None, config: Optional[Dict[str, Any]] = None) -> Any:
+    """Look up a dotted key such as 'api.tavily.timeout' in the config"""
+    node: Any = load_config() if config is None else config
+    for part in path.split('.'):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def sqlite_journal_mode() -> str:
+    """Journal mode of the SQLite stores (results, checkpoints, caches, work queue)
+    
+    WAL (the default) keeps readers and writers apart but needs shared memory,
+    so it only works for processes on one host. DELETE (a rollback journal)
+    also works for processes on several hosts sharing a network filesystem.
+    """
+    return str(get_setting("storage.journal_mode", "WAL")).upper()
@@ -0,0 +1,197 @@
+"""
+Multi-Epoch Evaluation - Bootstrap confidence intervals and adaptive early stopping
+
+With ``--epochs N`` every model is run repeatedly (each epoch is one full
+pass over the prospect samples, at ``evaluation.temperature``). Epochs run
+in rounds: every model first runs ``epochs.min`` epochs, then models still
+sampling get ``epochs.round`` more per round, up to N. After each round a
+model stops early when
+
+    - its bootstrap confidence interval is narrow enough
+      (half-width <= ``epochs.target_half_width``), or
+    - its interval no longer overlaps the intervals of the models ranked
+      directly above and below it (its rank is settled). Neighbours are the
+      other models of this run plus the leaderboard's multi-epoch results
+      for the same prompt, whose intervals come from the results store.
+
+The interval is a percentile bootstrap of the mean epoch score.
+"""
+
+import json
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_setting
+
+DEFAULT_MIN_EPOCHS = 5
+DEFAULT_ROUND_EPOCHS = 2
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_TARGET_HALF_WIDTH = 0.02  # ±2 points of task score
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+
+STOP_NARROW = "interval narrow enough"
+STOP_SEPARATED = "separated from neighbours"
+STOP_MAX_EPOCHS = "max epochs reached"
+STOP_FAILED = "evaluation failed"
+
+
+def epoch_scores(log: Any, epoch_offset: int = 0) -> Dict[int, float]:
+    """Mean sample score of each epoch in an Inspect eval log, keyed by epoch number"""
+    
+    by_epoch: Dict[int, List[float]] = {}
+    for sample in getattr(log, "samples", None) or []:
+        if not sample.scores:
+            continue
+        value = next(iter(sample.scores.values())).value
+        if isinstance(value, (int, float)):
+            epoch = getattr(sample, "epoch", 1) + epoch_offset
+            by_epoch.setdefault(epoch, []).append(float(value))
+    return {epoch: sum(values) / len(values) for epoch, values in sorted(by_epoch.items())}
+
+
+def bootstrap_ci(
+    values: List[float],
+    confidence: float = DEFAULT_CONFIDENCE,
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int = 0
+) -> Tuple[float, float]:
+    """Percentile bootstrap confidence interval of the mean"""
+    
+    if not values:
+        return 0.0, 0.0
+    if len(values) == 1:
+        return values[0], values[0]
+    
+    rng = random.Random(seed)
+    count = len(values)
+    means = sorted(
+        sum(rng.choice(values) for _ in range(count)) / count
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    low = means[int(tail * (resamples - 1))]
+    high = means[int(round((1 - tail) * (resamples - 1)))]
+    return low, high
+
+
+def leaderboard_intervals(rows: List[Dict[str, Any]]) -> Dict[str, Tuple[float, float, float]]:
+    """(mean, low, high) of the results-store rows that carry a multi-epoch confidence interval"""
+    
+    intervals = {}
+    for row in rows:
+        metadata = json.loads(row["metadata"]) if row.get("metadata") else {}
+        if "ci" in metadata:
+            low, high = metadata["ci"]
+            intervals[row["model"]] = (row["score"], low, high)
+    return intervals
+
+
+class EpochTracker:
+    """Epoch scores per model, their intervals and the stopping rule
+    
+    ``reference`` holds fixed (mean, low, high) intervals of models outside
+    this run (leaderboard neighbours): they are ranked against, never sampled.
+    """
+    
+    def __init__(
+        self,
+        models: List[str],
+        max_epochs: int,
+        min_epochs: Optional[int] = None,
+        round_epochs: Optional[int] = None,
+        confidence: Optional[float] = None,
+        target_half_width: Optional[float] = None,
+        resamples: Optional[int] = None,
+        early_stop: bool = True,
+        reference: Optional[Dict[str, Tuple[float, float, float]]] = None
+    ):
+        self.models = list(models)
+        self.max_epochs = max_epochs
+        self.min_epochs = min(max_epochs, min_epochs or get_setting("epochs.min", DEFAULT_MIN_EPOCHS))
+        self.round_epochs = max(1, round_epochs or get_setting("epochs.round", DEFAULT_ROUND_EPOCHS))
+        self.confidence = confidence or get_setting("epochs.confidence", DEFAULT_CONFIDENCE)
+        self.target_half_width = (
+            target_half_width if target_half_width is not None
+            else get_setting("epochs.target_half_width", DEFAULT_TARGET_HALF_WIDTH)
+        )
+        self.resamples = resamples or get_setting("epochs.bootstrap_resamples", DEFAULT_BOOTSTRAP_RESAMPLES)
+        self.early_stop = early_stop
+        self.reference = {
+            model: interval for model, interval in (reference or {}).items() if model not in self.models
+        }
+        
+        self.epochs_run = 0
+        self.scores: Dict[str, List[float]] = {model: [] for model in self.models}
+        self.stopped: Dict[str, str] = {}
+    
+    def active(self) -> List[str]:
+        """Models still sampling"""
+        return [model for model in self.models if model not in self.stopped]
+    
+    def next_round(self) -> int:
+        """Epochs to run in the next round (0 when every model has stopped)"""
+        if not self.active() or self.epochs_run >= self.max_epochs:
+            return 0
+        size = self.min_epochs if self.epochs_run == 0 else self.round_epochs
+        if not self.early_stop:
+            size = self.max_epochs
+        return min(size, self.max_epochs - self.epochs_run)
+    
+    def add(self, model: str, scores: List[float]) -> None:
+        """Record one round's epoch scores for a model (none means it failed)"""
+        if not scores:
+            self.stopped.setdefault(model, STOP_FAILED)
+            return
+        self.scores[model].extend(scores)
+    
+    def interval(self, model: str) -> Tuple[float, float, float]:
+        """Mean and confidence interval of a model's epoch scores"""
+        values = self.scores[model]
+        if not values:
+            return 0.0, 0.0, 0.0
+        low, high = bootstrap_ci(values, self.confidence, self.resamples)
+        return sum(values) / len(values), low, high
+    
+    @staticmethod
+    def neighbours(model: str, intervals: Dict[str, Tuple[float, float, float]]) -> List[str]:
+        """Models ranked directly above and below, by mean score"""
+        ranked = sorted(intervals, key=lambda m: intervals[m][0], reverse=True)
+        position = ranked.index(model)
+        return ranked[max(0, position - 1):position] + ranked[position + 1:position + 2]
+    
+    def finish_round(self, epochs: int) -> Dict[str, str]:
+        """Apply the stopping rule after a round; returns the models stopped by it"""
+        
+        self.epochs_run += epochs
+        intervals = dict(self.reference)
+        intervals.update({model: self.interval(model) for model in self.models if self.scores[model]})
+        newly_stopped = {}
+        for model in self.active():
+            reason = None
+            if self.epochs_run >= self.max_epochs:
+                reason = STOP_MAX_EPOCHS
+            elif self.early_stop and self.epochs_run >= self.min_epochs:
+                mean, low, high = intervals[model]
+                neighbours = self.neighbours(model, intervals)
+                if (high - low) / 2 <= self.target_half_width:
+                    reason = STOP_NARROW
+                elif neighbours and all(
+                    high < intervals[other][1] or low > intervals[other][2] for other in neighbours
+                ):
+                    reason = STOP_SEPARATED
+            if reason:
+                newly_stopped[model] = reason
+        self.stopped.update(newly_stopped)
+        return newly_stopped
+    
+    def summary(self, model: str) -> Dict[str, Any]:
+        """Headline statistics for a model"""
+        mean, low, high = self.interval(model)
+        return {
+            "final_score": mean,
+            "ci": [low, high],
+            "confidence": self.confidence,
+            "epochs": len(self.scores[model]),
+            "epoch_scores": self.scores[model],
+            "stop_reason": self.stopped.get(model)
+        }
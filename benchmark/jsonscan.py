@@ -0,0 +1,132 @@
+"""
+JSON Scanner - Find JSON objects embedded in model completions in linear time
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import re
+
+
+# A JSON object opens with a key or closes immediately
+_OBJECT_START = re.compile(r'\{\s*["}]')
+
+
+def _escaped(text: str, pos: int) -> bool:
+    """True if the character at pos is escaped by an odd run of backslashes"""
+    backslashes = 0
+    while pos > 0 and text[pos - 1] == "\\":
+        backslashes += 1
+        pos -= 1
+    return backslashes % 2 == 1
+
+
+def find_object_groups(text: str) -> Iterator[List[Tuple[int, int]]]:
+    """Yield the (start, end) spans of balanced {...} runs, last run first.
+    
+    The scan walks backwards from the end of the text, where the final answer
+    of a completion lives, jumping between braces and quotes with rfind. Each
+    group holds an outermost span plus every span nested inside it. Braces are
+    only counted outside JSON strings, and strings are only tracked inside an
+    object, so quotes in surrounding prose never derail the scan. Every rfind
+    covers text no earlier rfind for the same character did, keeping the whole
+    scan linear however the completion is shaped.
+    """
+    
+    end = text.rfind("}")
+    next_open = next_quote = len(text)
+    
+    while end != -1:
+        # Stray '{' and quotes between this run and the previous one are prose
+        if next_open > end:
+            next_open = text.rfind("{", 0, end)
+        if next_quote > end:
+            next_quote = text.rfind('"', 0, end)
+        next_close = text.rfind("}", 0, end)
+        
+        spans = []
+        open_braces = [end]
+        while open_braces:
+            pos = max(next_open, next_close, next_quote)
+            if pos == -1:
+                # Unbalanced: nothing earlier can open this run
+                if spans:
+                    yield spans
+                return
+            
+            if pos == next_close:
+                open_braces.append(pos)
+                next_close = text.rfind("}", 0, pos)
+            elif pos == next_open:
+                spans.append((pos, open_braces.pop() + 1))
+                next_open = text.rfind("{", 0, pos)
+            else:
+                # Closing quote of a string: jump to its opening quote
+                opening = text.rfind('"', 0, pos)
+                while opening != -1 and _escaped(text, opening):
+                    opening = text.rfind('"', 0, opening)
+                if opening == -1:
+                    if spans:
+                        yield spans
+                    return
+                next_quote = text.rfind('"', 0, opening)
+                if next_open > opening:
+                    next_open = text.rfind("{", 0, opening)
+                if next_close > opening:
+                    next_close = text.rfind("}", 0, opening)
+        
+        yield spans
+        end = next_close
+
+
+def iter_json_objects(text: str) -> Iterator[Dict[str, Any]]:
+    """Yield the JSON objects embedded in text, last run of braces first.
+    
+    Each candidate span is parsed at most once. When an outer span parses, the
+    spans nested inside it are skipped; when it does not, they are tried next
+    (unless it failed by nesting too deep to parse at all).
+    """
+    
+    for spans in find_object_groups(text):
+        parsed_until = -1
+        for start, end in sorted(spans, key=lambda span: (span[0], -span[1])):
+            if start < parsed_until or not _OBJECT_START.match(text, start):
+                continue
+            try:
+                value = json.loads(text[start:end])
+            except RecursionError:
+                # Nested past the parser's recursion limit: so are the spans
+                # inside it, and retrying each of them would be quadratic
+                parsed_until = end
+                continue
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                parsed_until = end
+                yield value
+
+
+def extract_json_object(text: str, prefer_key: Optional[str] = None) -> Optional[Any]:
+    """Extract the JSON payload from a completion.
+    
+    The whole text is tried first (plain JSON responses). Otherwise the last
+    embedded object containing prefer_key is returned - completions put their
+    final answer after any drafts - falling back to the last object at all.
+    """
+    
+    if not text:
+        return None
+    
+    stripped = text.strip()
+    if stripped[:1] in ("{", "["):
+        try:
+            return json.loads(stripped)
+        except (ValueError, RecursionError):
+            pass
+    
+    fallback = None
+    for value in iter_json_objects(text):
+        if prefer_key is None or prefer_key in value:
+            return value
+        if fallback is None:
+            fallback = value
+    return fallback
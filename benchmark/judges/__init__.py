@@ -2,6 +2,21 @@
 Revenue Bench Judges - Multi-judge evaluation system
 """
 
-from .multi_judge_scorer import multi_judge_scorer_batch_verified, MultiJudgeScorer
+import importlib
 
-__all__ = ["multi_judge_scorer_batch_verified", "MultiJudgeScorer"]
\ No newline at end of file
+# Exports are imported on first access (PEP 562), so importing a light
+# submodule such as benchmark.judges.verification does not load inspect_ai
+_EXPORTS = {
+    "multi_judge_scorer_batch_verified": ".multi_judge_scorer",
+    "MultiJudgeScorer": ".multi_judge_scorer",
+}
+
+__all__ = ["multi_judge_scorer_batch_verified", "MultiJudgeScorer"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,63 +3,135 @@ Multi-Judge Scorer - Evaluate AI responses using multiple judge models
 """
 
 from inspect_ai.scorer import scorer, Score, accuracy, stderr
-from inspect_ai.model import get_model, ChatMessageUser
+from inspect_ai.model import get_model, ChatMessageSystem, ChatMessageUser, GenerateConfig, Model
 from inspect_ai.solver import TaskState
-from typing import List, Dict, Any, Set
-from urllib.parse import urlparse
+from inspect_ai.util import concurrency
+from typing import List, Dict, Any, Optional, Set, Union
+import asyncio
 import json
-import re
+import time
+
+from ..cache import DiskCache, open_cache
+from ..config import get_setting
+from ..checkpoints import CHECKPOINT_KEY_METADATA, CheckpointStore, active_checkpoints
+from ..jsonscan import extract_json_object
+from ..ratelimit import call_with_backoff, exception_throttle, get_rate_limiter
+from ..replay import active_cassette, cassette_model
+from ..telemetry import evaluation_label, get_telemetry, note_queue_wait, span
+from .verification import VerificationIndex
+
+
+DEFAULT_JUDGE_MODELS = [
+    "openrouter/google/gemini-2.5-pro",
+    "openrouter/moonshotai/kimi-k2",
+    "openrouter/openai/gpt-5-mini",
+    "openrouter/anthropic/claude-opus-4.1"
+]
+
+# Max judge calls in flight at once (shared by all samples in the process)
+DEFAULT_JUDGE_CONCURRENCY = 4
+
+# Seconds before a judge call is abandoned, throttling retries and backoff included
+DEFAULT_JUDGE_TIMEOUT = 180.0
+
+# Judge response cache modes: "use" reads and writes, "refresh" re-calls the
+# judge and overwrites the cached response, "bypass" ignores the cache entirely
+JUDGE_CACHE_MODES = ("use", "refresh", "bypass")
+
+# Judge panel modes: "panel" asks every judge, "escalate" asks the cheap
+# judges first and the rest only when the cheap verdict is contested
+JUDGE_MODES = ("panel", "escalate")
+
+# Escalation defaults (overridable under judging.escalation in config.yaml)
+DEFAULT_CHEAP_JUDGES = [
+    "openrouter/moonshotai/kimi-k2",
+    "openrouter/openai/gpt-5-mini"
+]
+DEFAULT_DISAGREEMENT_THRESHOLD = 6.0     # Spread of cheap judges' totals (out of 40)
+DEFAULT_RANK_BOUNDARIES = [0.6, 0.7, 0.8]  # Task scores where leaderboard tiers split
+DEFAULT_BOUNDARY_MARGIN = 0.02
+
+# Prospects asked for when a sample does not say (the original three-prospect task)
+EXPECTED_PROSPECT_NAMES = ["Matthew Christy", "Isaac Reback", "Tiffany Porter"]
+
+# Sample metadata field listing the prospects a sample asks for, in prompt order
+PROSPECT_NAMES_METADATA = "prospect_names"
+
+# First lines that are the prompt's template echoed back, not an answer
+PLACEHOLDER_FIRST_LINES = {
+    "<personalized message>",
+    "your personalized first line here (max 35 words)",
+    "[no response provided]",
+}
+
+# Judge model handles, reused across samples instead of rebuilt per score call
+_judge_model_handles: Dict[str, Model] = {}
 
 
 def extract_json(text: str) -> Dict[str, Any]:
     """Extract JSON from text, handling various formats."""
     
-    if not text:
-        return None
-    
-    # Try direct JSON parsing
-    try:
-        return json.loads(text)
-    except:
-        pass
-    
-    # Try extracting from markdown code blocks
-    patterns = [
-        r'```json\s*(.*?)\s*```',
-        r'```\s*(.*?)\s*```',
-        r'\{.*\}',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-        for match in matches:
-            try:
-                return json.loads(match)
-            except:
-                continue
-    
-    return None
+    # Single pass over the text; prefers the object holding the prospects
+    return extract_json_object(text, prefer_key="prospects")
 
 
-def create_empty_response() -> Dict[str, Any]:
+def create_empty_response(prospect_names: Optional[List[str]] = None) -> Dict[str, Any]:
     """Create an empty response structure for failed extractions."""
     return {
         "prospects": [
-            {"name": "Matthew Christy", "first_line": "", "evidence_url": "", "evidence_quote": ""},
-            {"name": "Isaac Reback", "first_line": "", "evidence_url": "", "evidence_quote": ""},
-            {"name": "Tiffany Porter", "first_line": "", "evidence_url": "", "evidence_quote": ""}
+            {"name": name, "first_line": "", "evidence_url": "", "evidence_quote": ""}
+            for name in (prospect_names or EXPECTED_PROSPECT_NAMES)
         ]
     }
 
 
-def extract_tool_usage_from_state(state: TaskState) -> Dict[str, Any]:
-    """Extract which tools were used and what URLs were visited from message history."""
+def triage_prospect(prospect: Any) -> Optional[str]:
+    """Return why a prospect can be scored without judges, or None if it has content.
     
-    tool_usage = {
+    Structurally empty prospects (missing, not an object, blank first line, or
+    the prompt's placeholder echoed back) always score zero, so they are scored
+    deterministically instead of being sent to the judge panel.
+    """
+    
+    if prospect is None:
+        return "missing"
+    if not isinstance(prospect, dict):
+        return "malformed"
+    first_line = prospect.get("first_line")
+    if not isinstance(first_line, str) or not first_line.strip():
+        return "empty first line"
+    if first_line.strip().lower() in PLACEHOLDER_FIRST_LINES:
+        return "placeholder first line"
+    return None
+
+
+def new_tool_usage() -> Dict[str, Any]:
+    """Empty tool usage record, filled by record_tool_call"""
+    return {
         "tavily_search": [],
         "tavily_extract": [],
-        "all_visited_urls": set()
+        "all_visited_urls": set(),
+        "verification_index": VerificationIndex()
     }
+
+
+def record_tool_call(tool_usage: Dict[str, Any], tool_name: str, arguments: Dict[str, Any]) -> None:
+    """Add one tavily_search / tavily_extract call to a tool usage record"""
+    
+    if tool_name == "tavily_search":
+        tool_usage["tavily_search"].append(arguments.get('query', ''))
+    elif tool_name == "tavily_extract":
+        url = arguments.get('url', '')
+        if url:
+            tool_usage["tavily_extract"].append(url)
+            tool_usage["all_visited_urls"].add(url.lower())
+            tool_usage["verification_index"].add(url)
+
+
+def extract_tool_usage_from_state(state: TaskState) -> Dict[str, Any]:
+    """Extract which tools were used and what URLs were visited from message history."""
+    
+    tool_usage = new_tool_usage()
     
     # Scan all messages for tool calls
     if hasattr(state, 'messages'):
@@ -67,55 +139,240 @@ def extract_tool_usage_from_state(state: TaskState) -> Dict[str, Any]:
             if hasattr(message, 'tool_calls') and message.tool_calls:
                 for tool_call in message.tool_calls:
                     tool_name = tool_call.function if hasattr(tool_call, 'function') else None
-                    
-                    if tool_name:
-                        if tool_name == "tavily_search":
-                            if hasattr(tool_call, 'arguments'):
-                                query = tool_call.arguments.get('query', '')
-                                tool_usage["tavily_search"].append(query)
-                                
-                        elif tool_name == "tavily_extract":
-                            if hasattr(tool_call, 'arguments'):
-                                url = tool_call.arguments.get('url', '')
-                                if url:
-                                    tool_usage["tavily_extract"].append(url)
-                                    tool_usage["all_visited_urls"].add(url.lower())
+                    if tool_name and hasattr(tool_call, 'arguments'):
+                        record_tool_call(tool_usage, tool_name, tool_call.arguments or {})
     
     return tool_usage
 
 
-def check_url_verified(evidence_url: str, visited_urls: Set[str]) -> bool:
-    """Check if an evidence URL was actually visited by tavily_extract."""
+def check_url_verified(
+    evidence_url: str,
+    visited: Union[VerificationIndex, Set[str]]
+) -> bool:
+    """Check if an evidence URL was actually visited by tavily_extract.
+    
+    Matches on the canonical URL (scheme, www, trailing slash and tracking
+    parameters ignored) or, failing that, on the registrable domain.
+    """
     
     if not evidence_url:
         return False
     
-    # Normalize URL for comparison
-    normalized_url = evidence_url.lower().strip()
+    if not isinstance(visited, VerificationIndex):
+        visited = VerificationIndex(visited)
+    return visited.verified(evidence_url)
+
+
+def get_judge_model(judge_model: str) -> Model:
+    """Return a cached model handle for a judge."""
     
-    # Check exact match
-    if normalized_url in visited_urls:
-        return True
+    # Routed through the cassette provider when recording or replaying
+    handle_name = cassette_model(judge_model)
+    model = _judge_model_handles.get(handle_name)
+    if model is None:
+        # Hint providers to cache the rubric prefix every call of this judge shares
+        model = get_model(handle_name, config=GenerateConfig(cache_prompt=prompt_cache_enabled()))
+        _judge_model_handles[handle_name] = model
+    return model
+
+
+def prompt_cache_enabled() -> bool:
+    """Whether to send provider prompt-cache hints (prompt_cache.enabled in config.yaml)"""
+    return bool(get_setting("prompt_cache.enabled", True))
+
+
+def judge_cache_key(judge_model: str, model: Model, judge_prompt: str) -> str:
+    """Content address of a judge call: model id, rendered prompt and generation config"""
+    # The prompt-cache hint changes cost, never the response
+    config = model.config.model_dump(exclude_none=True, exclude={"cache_prompt"}) if model.config else {}
+    return DiskCache.make_key("judge", judge_model, judge_prompt, config)
+
+
+def parse_judge_scores(judge_score_text: str) -> Dict[str, Any]:
+    """Parse a judge's JSON scores, handling markdown code blocks."""
+    
+    judge_scores = extract_json_object(judge_score_text, prefer_key="prospects")
+    if not isinstance(judge_scores, dict):
+        raise ValueError("No JSON object found in judge response")
+    return judge_scores
+
+
+def apply_verification_penalty(
+    judge_scores: Dict[str, Any],
+    verification_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Cap the insight score of unverified prospects and recalculate totals.
     
-    # Check if any visited URL contains the domain of the evidence URL
-    try:
-        evidence_domain = urlparse(evidence_url).netloc.lower()
-        for visited in visited_urls:
-            visited_domain = urlparse(visited).netloc.lower()
-            if evidence_domain and visited_domain and evidence_domain == visited_domain:
-                return True
-    except:
-        pass
+    Prospects whose verification is unknown (``verified`` is None) are not capped.
+    """
     
-    return False
+    for i, prospect_score in enumerate(judge_scores.get("prospects", [])):
+        if i < len(verification_results) and verification_results[i]["verified"] is False:
+            # Penalize insight score if not verified
+            prospect_score["insight_score"] = min(2, prospect_score.get("insight_score", 0))
+            # Recalculate total
+            prospect_score["total"] = sum([
+                prospect_score.get("pain_score", 0),
+                prospect_score.get("insight_score", 0),
+                prospect_score.get("fit_score", 0),
+                prospect_score.get("reply_score", 0)
+            ])
+    return judge_scores
 
 
-# Judge prompt template
-JUDGE_PROMPT_TEMPLATE = """
-You're evaluating personalized first lines for {company} prospects.
+def median(values: List[float]) -> float:
+    """Median of a non-empty list (mean of the middle pair for even lengths)"""
+    sorted_values = sorted(values)
+    middle = len(sorted_values) // 2
+    if len(sorted_values) % 2 == 0:
+        return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+    return sorted_values[middle]
 
-VERIFICATION STATUS FROM SYSTEM:
-{verification_report}
+
+def prospect_totals(all_judge_scores: List[Dict[str, Any]], prospect_count: int) -> List[List[float]]:
+    """Each judged prospect's totals across the judges that answered"""
+    totals = [[] for _ in range(prospect_count)]
+    for judge_result in all_judge_scores:
+        if "scores" in judge_result and "prospects" in judge_result["scores"]:
+            for position, prospect_score in enumerate(judge_result["scores"]["prospects"][:prospect_count]):
+                totals[position].append(prospect_score.get("total", 0))
+    return totals
+
+
+def escalation_reason(
+    all_judge_scores: List[Dict[str, Any]],
+    prospect_count: int,
+    slots: int,
+    disagreement_threshold: float = DEFAULT_DISAGREEMENT_THRESHOLD,
+    rank_boundaries: Optional[List[float]] = None,
+    boundary_margin: float = DEFAULT_BOUNDARY_MARGIN
+) -> Optional[str]:
+    """Why the cheap judges' verdict needs the expensive judges, or None if it stands.
+    
+    Escalates when fewer than two cheap judges answered, when their totals for
+    any prospect spread more than ``disagreement_threshold`` points, or when the
+    provisional task score lands within ``boundary_margin`` of a rank boundary.
+    """
+    
+    answered = sum(1 for judge_result in all_judge_scores if "scores" in judge_result)
+    if answered < 2:
+        return f"only {answered} cheap judge(s) answered"
+    
+    totals = prospect_totals(all_judge_scores, prospect_count)
+    for position, scores in enumerate(totals):
+        if not scores:
+            return f"no cheap score for prospect {position+1}"
+        spread = max(scores) - min(scores)
+        if spread > disagreement_threshold:
+            return f"judges disagree by {spread:g} points on prospect {position+1}"
+    
+    # Triaged prospects count as zeros in the task average
+    provisional = sum(median(scores) / 40.0 for scores in totals) / slots
+    for boundary in rank_boundaries if rank_boundaries is not None else DEFAULT_RANK_BOUNDARIES:
+        if abs(provisional - boundary) <= boundary_margin:
+            return f"score {provisional:.3f} is near rank boundary {boundary:g}"
+    return None
+
+
+async def run_judge(
+    judge_model: str,
+    judge_prompt: str,
+    verification_results: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_JUDGE_CONCURRENCY,
+    timeout: Optional[float] = DEFAULT_JUDGE_TIMEOUT,
+    cache_mode: str = "use",
+    checkpoint_key: Optional[str] = None,
+    judge_panel: Optional[List[str]] = None,
+    judge_rubric: Optional[str] = None
+) -> Dict[str, Any]:
+    """Run a single judge, isolating its failure from the rest of the panel.
+    
+    ``judge_rubric`` is sent as a system message ahead of ``judge_prompt``, so
+    the part every call shares forms a cacheable prompt prefix. ``timeout``
+    bounds the whole call, rate-limit retries and their backoff included
+    (not the wait for a judge concurrency slot).
+    """
+    
+    with span("judge", judge_model) as judge_span:
+        try:
+            model = get_judge_model(judge_model)
+            messages = [ChatMessageUser(content=judge_prompt)]
+            if judge_rubric:
+                messages.insert(0, ChatMessageSystem(content=judge_rubric))
+            # Cache and checkpoint keys cover the whole prompt, rubric included
+            full_prompt = f"{judge_rubric}\n{judge_prompt}" if judge_rubric else judge_prompt
+            
+            # A resumed run reuses the judge calls its checkpointed generation finished
+            checkpoints = active_checkpoints() if checkpoint_key else None
+            judge_key = CheckpointStore.judge_key(
+                checkpoint_key, judge_panel or [judge_model], judge_model, full_prompt
+            ) if checkpoints else None
+            judge_score_text = checkpoints.restore_judgement(judge_key) if checkpoints and checkpoints.resume else None
+            resumed = judge_score_text is not None
+            
+            # Identical judge calls are served from the judge response cache
+            # (skipped under a cassette so every judge call is recorded/replayed)
+            if active_cassette() is not None:
+                cache_mode = "bypass"
+            cache = open_cache("judge") if cache_mode != "bypass" and not resumed else None
+            cache_key = judge_cache_key(judge_model, model, full_prompt) if cache else None
+            if cache and cache_mode == "use":
+                judge_score_text = await cache.aget(cache_key)
+            cached = judge_score_text is not None and not resumed
+            
+            if judge_score_text is None:
+                # Generate judge response, bounded by the shared judge concurrency cap
+                # and the provider's rate limiter (throttled calls back off and retry)
+                wait_start = time.monotonic()
+                async with concurrency("judges", max_concurrency):
+                    note_queue_wait(time.monotonic() - wait_start)
+                    judge_response = await asyncio.wait_for(
+                        call_with_backoff(
+                            get_rate_limiter(judge_model.split("/")[0]),
+                            lambda: model.generate(messages),
+                            exception_throttle
+                        ),
+                        timeout=timeout
+                    )
+                judge_score_text = judge_response.completion
+                judge_span.add_usage(judge_model, judge_response.usage)
+            judge_span.cached = cached or resumed
+            
+            # Parse judge scores and apply penalty for unverified claims
+            judge_scores = parse_judge_scores(judge_score_text)
+            if cache and not cached:
+                await cache.aset(cache_key, judge_score_text)
+            if checkpoints and not resumed:
+                checkpoints.save_judgement(judge_key, checkpoint_key, judge_model, judge_score_text)
+            judge_scores = apply_verification_penalty(judge_scores, verification_results)
+            
+            return {
+                "model": judge_model,
+                "scores": judge_scores,
+                "cached": cached,
+                "resumed": resumed
+            }
+        
+        except asyncio.TimeoutError:
+            print(f"Judge {judge_model} timed out after {timeout}s")
+            judge_span.error = "timeout"
+            return {
+                "model": judge_model,
+                "error": f"Timed out after {timeout}s"
+            }
+        except Exception as e:
+            print(f"Judge {judge_model} failed: {str(e)}")
+            judge_span.error = str(e)
+            return {
+                "model": judge_model,
+                "error": str(e)
+            }
+
+
+# Judge rubric: the same for every judge call of a task, so it is sent first
+# (as the system message) and providers can serve it from their prompt cache
+JUDGE_RUBRIC_TEMPLATE = """
+You're evaluating personalized first lines for {company} prospects.
 
 Scoring Criteria:
 1. {pain_recognition} (35%) - Does it hit a real pain point?
@@ -127,59 +384,116 @@ IMPORTANT:
 - If a URL was NOT verified (model didn't use tavily_extract), heavily penalize the insight score
 - Only give high scores to claims backed by VERIFIED evidence
 
-Evaluate ALL 3 prospects below:
+Each request gives the verification status from the system, the prospects to
+evaluate and the JSON to return. Score every prospect listed, in order.
+"""
+
+# Judge prompt template: the per-sample part, after the rubric
+JUDGE_PROMPT_TEMPLATE = """
+VERIFICATION STATUS FROM SYSTEM:
+{verification_report}
+
+Evaluate ALL {prospect_count} prospects below:
 
 {prospects_details}
 
-Output JSON only with scores for all 3 prospects:
-{{
-  "prospects": [
-    {{
-      "name": "{prospect1_name}",
-      "pain_score": 0-10,
-      "insight_score": 0-10,
-      "fit_score": 0-10,
-      "reply_score": 0-10,
-      "total": 0-40,
-      "rationale": "Brief explanation"
-    }},
-    {{
-      "name": "{prospect2_name}",
-      "pain_score": 0-10,
-      "insight_score": 0-10,
-      "fit_score": 0-10,
-      "reply_score": 0-10,
-      "total": 0-40,
-      "rationale": "Brief explanation"
-    }},
-    {{
-      "name": "{prospect3_name}",
+Output JSON only with scores for all {prospect_count} prospects:
+{output_schema}
+"""
+
+
+# One prospect entry of the judge output schema
+JUDGE_OUTPUT_ENTRY = """    {{
+      "name": "{name}",
       "pain_score": 0-10,
       "insight_score": 0-10,
       "fit_score": 0-10,
       "reply_score": 0-10,
       "total": 0-40,
       "rationale": "Brief explanation"
-    }}
-  ]
-}}
-"""
+    }}"""
 
 
-@scorer(metrics=[accuracy(), stderr()])
-def multi_judge_scorer_batch_verified(
-    judge_models: List[str] = None,
-    company_context: Dict[str, str] = None
-):
-    """Multi-judge scoring with verification tracking from tool usage"""
+def judge_output_schema(prospect_names: List[str]) -> str:
+    """The JSON shape judges must return, one entry per judged prospect"""
+    entries = ",\n".join(JUDGE_OUTPUT_ENTRY.format(name=name) for name in prospect_names)
+    return '{\n  "prospects": [\n' + entries + '\n  ]\n}'
+
+
+# Criteria each judge scores 0-10, with their display names
+CRITERIA = {
+    "pain_score": "Engineering Pain",
+    "insight_score": "Prospect Insight",
+    "fit_score": "Product Fit",
+    "reply_score": "Reply Probability"
+}
+
+
+def resolve_judging(
+    judge_models: Optional[List[str]] = None,
+    judge_cache: str = "use",
+    judge_mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """Validate judging options and split the panel into cheap and expensive judges"""
+    
+    if judge_cache not in JUDGE_CACHE_MODES:
+        raise ValueError(f"judge_cache must be one of {JUDGE_CACHE_MODES}, got {judge_cache!r}")
+    
+    if judge_mode is None:
+        judge_mode = get_setting("judging.mode", "panel")
+    if judge_mode not in JUDGE_MODES:
+        raise ValueError(f"judge_mode must be one of {JUDGE_MODES}, got {judge_mode!r}")
     
     if judge_models is None:
-        judge_models = [
-            "openrouter/google/gemini-2.5-pro",
-            "openrouter/moonshotai/kimi-k2",
-            "openrouter/openai/gpt-5-mini",
-            "openrouter/anthropic/claude-opus-4.1"
-        ]
+        judge_models = list(DEFAULT_JUDGE_MODELS)
+    
+    escalation = get_setting("judging.escalation", {}) or {}
+    cheap_judges = [m for m in judge_models if m in escalation.get("cheap_judges", DEFAULT_CHEAP_JUDGES)]
+    expensive_judges = [m for m in judge_models if m not in cheap_judges]
+    if judge_mode == "escalate" and not cheap_judges:
+        # Nothing cheap on this panel: escalation degenerates to the full panel
+        judge_mode = "panel"
+    
+    return {
+        "judge_models": judge_models,
+        "judge_mode": judge_mode,
+        "cheap_judges": cheap_judges,
+        "expensive_judges": expensive_judges,
+        "escalation": escalation
+    }
+
+
+async def score_response(
+    response_text: str,
+    tool_usage: Optional[Dict[str, Any]],
+    judge_models: List[str] = None,
+    company_context: Dict[str, str] = None,
+    max_concurrency: int = DEFAULT_JUDGE_CONCURRENCY,
+    judge_timeout: Optional[float] = DEFAULT_JUDGE_TIMEOUT,
+    judge_cache: str = "use",
+    judge_mode: Optional[str] = None,
+    checkpoint_key: Optional[str] = None,
+    expected_names: Optional[List[str]] = None
+) -> Score:
+    """Judge one model response against the tool calls it made.
+    
+    Shared by the Inspect scorer and offline re-scoring of stored responses
+    (benchmark/rescore.py). ``tool_usage`` is built with new_tool_usage and
+    record_tool_call, so verification is rebuilt the same way in both. A
+    ``tool_usage`` of None means the tool calls were never recorded (legacy
+    stored responses): every prospect's verification is then unknown
+    (``verified`` None, no insight cap) and the verification rate is None.
+    ``expected_names`` are the prospects the sample asked for (default:
+    EXPECTED_PROSPECT_NAMES); each one is a slot in the task score.
+    """
+    
+    judging = resolve_judging(judge_models, judge_cache, judge_mode)
+    judge_models = judging["judge_models"]
+    judge_mode = judging["judge_mode"]
+    expected_names = expected_names or EXPECTED_PROSPECT_NAMES
+    cheap_judges = judging["cheap_judges"]
+    expensive_judges = judging["expensive_judges"]
+    escalation = judging["escalation"]
     
     if company_context is None:
         company_context = {
@@ -187,253 +501,449 @@ def multi_judge_scorer_batch_verified(
             "pain_focus": "Pain Recognition"
         }
     
-    async def score(state: TaskState, target: Any) -> Score:
-        """Score the model's response with real verification tracking."""
-        
-        # Extract actual tool usage from state
-        tool_usage = extract_tool_usage_from_state(state)
-        visited_urls = tool_usage["all_visited_urls"]
-        
-        # Parse model response
-        response_text = ""
-        if hasattr(state, 'output') and hasattr(state.output, 'completion'):
-            response_text = state.output.completion
+    verification_known = tool_usage is not None
+    if not verification_known:
+        tool_usage = new_tool_usage()
+    visited_urls = tool_usage["all_visited_urls"]
+    verification_index = tool_usage["verification_index"]
+    visited_url_list = list(visited_urls)
+    
+    # Use robust JSON extraction
+    response = extract_json(response_text)
+    
+    # If extraction failed, check if model used tools
+    if response is None:
+        if len(tool_usage.get("tavily_search", [])) > 0 or len(tool_usage.get("tavily_extract", [])) > 0:
+            response = create_empty_response(expected_names)
+            print(f"Warning: Model used tools but produced invalid JSON. Using empty response.")
         else:
-            response_text = str(state.messages[-1].content if state.messages else "")
-        
-        # Use robust JSON extraction
-        response = extract_json(response_text)
-        
-        # If extraction failed, check if model used tools
-        if response is None:
-            if len(tool_usage.get("tavily_search", [])) > 0 or len(tool_usage.get("tavily_extract", [])) > 0:
-                response = create_empty_response()
-                print(f"Warning: Model used tools but produced invalid JSON. Using empty response.")
-            else:
-                return Score(
-                    value=0.0,
-                    answer="",
-                    explanation=f"Invalid JSON output and no tool usage detected"
-                )
-        
-        # Verify structure
-        if "prospects" not in response or not isinstance(response["prospects"], list):
             return Score(
                 value=0.0,
                 answer="",
-                explanation="Response missing 'prospects' array"
+                explanation=f"Invalid JSON output and no tool usage detected"
             )
+    
+    # Verify structure
+    if "prospects" not in response or not isinstance(response["prospects"], list):
+        return Score(
+            value=0.0,
+            answer="",
+            explanation="Response missing 'prospects' array"
+        )
+    
+    # Check verification for each prospect
+    verification_results = []
+    verification_report_lines = []
+    
+    for i, prospect_response in enumerate(response.get("prospects", [])):
+        if not isinstance(prospect_response, dict):
+            prospect_response = {}
+        evidence_url = prospect_response.get("evidence_url", "")
+        prospect_name = prospect_response.get("name", f"Prospect {i+1}")
         
-        # Check verification for each prospect
-        verification_results = []
-        verification_report_lines = []
+        # Check if this URL was actually visited
+        was_verified = check_url_verified(evidence_url, verification_index) if verification_known else None
         
-        for i, prospect_response in enumerate(response.get("prospects", [])):
-            evidence_url = prospect_response.get("evidence_url", "")
-            prospect_name = prospect_response.get("name", f"Prospect {i+1}")
-            
-            # Check if this URL was actually visited
-            was_verified = check_url_verified(evidence_url, visited_urls)
-            
-            verification_result = {
-                "prospect": prospect_name,
-                "evidence_url": evidence_url,
-                "verified": was_verified,
-                "visited_urls": list(visited_urls)
-            }
-            verification_results.append(verification_result)
-            
-            # Build report for judges
-            if was_verified:
-                verification_report_lines.append(
-                    f"✅ {prospect_name}: URL VERIFIED (model used tavily_extract on {evidence_url})"
-                )
-            else:
-                verification_report_lines.append(
-                    f"❌ {prospect_name}: NOT VERIFIED (model did NOT use tavily_extract on {evidence_url})"
-                )
-        
-        verification_report = "\n".join(verification_report_lines)
+        verification_result = {
+            "prospect": prospect_name,
+            "evidence_url": evidence_url,
+            "verified": was_verified,
+            "visited_urls": visited_url_list
+        }
+        verification_results.append(verification_result)
         
-        # Add tool usage summary
-        verification_report += f"\n\nTool Usage Summary:"
+        # Build report for judges
+        if was_verified is None:
+            verification_report_lines.append(
+                f"❔ {prospect_name}: VERIFICATION UNKNOWN (the model's tool calls were not recorded)"
+            )
+        elif was_verified:
+            verification_report_lines.append(
+                f"✅ {prospect_name}: URL VERIFIED (model used tavily_extract on {evidence_url})"
+            )
+        else:
+            verification_report_lines.append(
+                f"❌ {prospect_name}: NOT VERIFIED (model did NOT use tavily_extract on {evidence_url})"
+            )
+    
+    # Triage: structurally empty prospects score zero without a judge call,
+    # only prospects with content go to the panel
+    response_prospects = response.get("prospects", [])
+    slots = len(expected_names)
+    prospect_names = []
+    triage = []
+    for i in range(slots):
+        prospect_response = response_prospects[i] if i < len(response_prospects) else None
+        default_name = expected_names[i]
+        if isinstance(prospect_response, dict):
+            prospect_names.append(prospect_response.get("name", default_name))
+        else:
+            prospect_names.append(default_name)
+        triage.append(triage_prospect(prospect_response))
+    judged_indices = [i for i in range(slots) if triage[i] is None]
+    judged_position = {i: position for position, i in enumerate(judged_indices)}
+    
+    verification_report = "\n".join(verification_report_lines[i] for i in judged_indices)
+    
+    # Add tool usage summary
+    verification_report += f"\n\nTool Usage Summary:"
+    all_url_verifications = tool_usage['tavily_extract']
+    if not verification_known:
+        verification_report += "\n- Not recorded: judge the evidence on its merits"
+    else:
         verification_report += f"\n- Tavily searches: {len(tool_usage['tavily_search'])}"
         verification_report += f"\n- Tavily extracts: {len(tool_usage['tavily_extract'])}"
-        all_url_verifications = tool_usage['tavily_extract']
         if all_url_verifications:
             verification_report += f"\n- URLs verified: {', '.join(all_url_verifications[:3])}..."
         else:
             verification_report += "\n- No URLs verified!"
+    
+    # Prepare prospects details for judges
+    prospects_details = ""
+    for position, i in enumerate(judged_indices):
+        prospect_response = response_prospects[i]
+        first_line = prospect_response.get("first_line", "")
+        evidence_url = prospect_response.get("evidence_url", "")
+        verification_status = {
+            True: '✅ VERIFIED', False: '❌ NOT VERIFIED', None: '❔ UNKNOWN'
+        }[verification_results[i]['verified']]
         
-        # Prepare prospects details for judges
-        prospects_details = ""
-        prospect_names = []
-        all_expected_names = ["Matthew Christy", "Isaac Reback", "Tiffany Porter"]
-        
-        for i in range(3):  # Always iterate through 3 prospects
-            if i < len(response.get("prospects", [])):
-                prospect_response = response.get("prospects", [])[i]
-                prospect_name = prospect_response.get("name", all_expected_names[i])
-                first_line = prospect_response.get("first_line", "")
-                evidence_url = prospect_response.get("evidence_url", "")
-                
-                # Check verification status
-                verification_status = "❌ NOT VERIFIED"
-                if i < len(verification_results):
-                    verification_status = verification_results[i]['verified'] and '✅ VERIFIED' or '❌ NOT VERIFIED'
-            else:
-                prospect_name = all_expected_names[i] if i < len(all_expected_names) else f"Prospect {i+1}"
-                first_line = "[NO RESPONSE PROVIDED]"
-                evidence_url = ""
-                verification_status = "❌ MISSING"
-            
-            prospect_names.append(prospect_name)
-            prospects_details += f"""
-Prospect {i+1}: {prospect_name}
+        prospects_details += f"""
+Prospect {position+1}: {prospect_names[i]}
 First Line: {first_line}
 Evidence URL: {evidence_url}
 VERIFICATION: {verification_status}
 
 """
+    
+    all_judge_scores = []
+    escalated_because = None
+    if judged_indices:
+        # Format judge prompt with verification status
+        judge_rubric = JUDGE_RUBRIC_TEMPLATE.format(
+            company=company_context.get("company", "the company"),
+            pain_recognition=company_context.get("pain_focus", "Pain Recognition")
+        )
+        judge_prompt = JUDGE_PROMPT_TEMPLATE.format(
+            verification_report=verification_report,
+            prospects_details=prospects_details,
+            prospect_count=len(judged_indices),
+            output_schema=judge_output_schema([prospect_names[i] for i in judged_indices])
+        )
         
-        # Collect judge scores
-        all_judge_scores = []
-        
-        for judge_model in judge_models:
-            try:
-                model = get_model(judge_model)
-                
-                # Format judge prompt with verification status
-                judge_prompt = JUDGE_PROMPT_TEMPLATE.format(
-                    company=company_context.get("company", "the company"),
-                    pain_recognition=company_context.get("pain_focus", "Pain Recognition"),
-                    verification_report=verification_report,
-                    prospects_details=prospects_details,
-                    prospect1_name=prospect_names[0],
-                    prospect2_name=prospect_names[1],
-                    prospect3_name=prospect_names[2]
-                )
-                
-                # Generate judge response
-                judge_response = await model.generate(
-                    [ChatMessageUser(content=judge_prompt)]
+        async def call_judges(models: List[str]) -> List[Dict[str, Any]]:
+            # Collect judge scores concurrently; each judge fails independently
+            return list(await asyncio.gather(*[
+                run_judge(
+                    judge_model,
+                    judge_prompt,
+                    [verification_results[i] for i in judged_indices],
+                    max_concurrency=max_concurrency,
+                    timeout=judge_timeout,
+                    cache_mode=judge_cache,
+                    checkpoint_key=checkpoint_key,
+                    judge_panel=judge_models,
+                    judge_rubric=judge_rubric
                 )
-                
-                # Parse judge scores
-                judge_score_text = judge_response.completion
-                
-                # Handle JSON in markdown blocks
-                json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', judge_score_text, re.DOTALL)
-                if json_match:
-                    judge_scores = json.loads(json_match.group(1))
-                else:
-                    judge_scores = json.loads(judge_score_text)
-                
-                # Apply penalty for unverified claims
-                for i, prospect_score in enumerate(judge_scores.get("prospects", [])):
-                    if i < len(verification_results) and not verification_results[i]["verified"]:
-                        # Penalize insight score if not verified
-                        prospect_score["insight_score"] = min(2, prospect_score.get("insight_score", 0))
-                        # Recalculate total
-                        prospect_score["total"] = sum([
-                            prospect_score.get("pain_score", 0),
-                            prospect_score.get("insight_score", 0),
-                            prospect_score.get("fit_score", 0),
-                            prospect_score.get("reply_score", 0)
-                        ])
-                
-                all_judge_scores.append({
-                    "model": judge_model,
-                    "scores": judge_scores
-                })
-                
-            except Exception as e:
-                print(f"Judge {judge_model} failed: {str(e)}")
-                all_judge_scores.append({
-                    "model": judge_model,
-                    "error": str(e)
-                })
+                for judge_model in models
+            ]))
         
-        # Calculate median scores for each prospect
-        prospect_scores = []
-        for i in range(len(prospect_names)):
-            scores_for_prospect = []
-            for judge_result in all_judge_scores:
-                if "scores" in judge_result and "prospects" in judge_result["scores"]:
-                    if i < len(judge_result["scores"]["prospects"]):
-                        scores_for_prospect.append(
-                            judge_result["scores"]["prospects"][i].get("total", 0)
-                        )
-            
-            if scores_for_prospect:
-                sorted_scores = sorted(scores_for_prospect)
-                median_idx = len(sorted_scores) // 2
-                if len(sorted_scores) % 2 == 0:
-                    median_score = (sorted_scores[median_idx-1] + sorted_scores[median_idx]) / 2
-                else:
-                    median_score = sorted_scores[median_idx]
-            else:
-                median_score = 0
-            
-            # Check verification
-            verified = False
-            if i < len(verification_results):
-                verified = verification_results[i]["verified"]
-            
+        if judge_mode == "escalate":
+            all_judge_scores = await call_judges(cheap_judges)
+            escalated_because = escalation_reason(
+                all_judge_scores,
+                len(judged_indices),
+                slots,
+                disagreement_threshold=escalation.get("disagreement_threshold", DEFAULT_DISAGREEMENT_THRESHOLD),
+                rank_boundaries=escalation.get("rank_boundaries", DEFAULT_RANK_BOUNDARIES),
+                boundary_margin=escalation.get("boundary_margin", DEFAULT_BOUNDARY_MARGIN)
+            )
+            if escalated_because and expensive_judges:
+                all_judge_scores += await call_judges(expensive_judges)
+        else:
+            all_judge_scores = await call_judges(judge_models)
+    
+    # Calculate median scores for each prospect
+    judged_totals = prospect_totals(all_judge_scores, len(judged_indices))
+    prospect_scores = []
+    for i in range(slots):
+        # Check verification
+        verified = False
+        if i < len(verification_results):
+            verified = verification_results[i]["verified"]
+        
+        if triage[i] is not None:
             prospect_scores.append({
                 "name": prospect_names[i],
-                "median_score": median_score,
-                "normalized": median_score / 40.0,
-                "verified": verified
+                "median_score": 0,
+                "normalized": 0.0,
+                "verified": verified,
+                "triaged": triage[i]
             })
+            continue
         
-        # Calculate overall score
-        task_average = sum(p["normalized"] for p in prospect_scores) / len(prospect_scores) if prospect_scores else 0
-        verification_rate = sum(1 for p in prospect_scores if p["verified"]) / len(prospect_scores) if prospect_scores else 0
+        scores_for_prospect = judged_totals[judged_position[i]]
+        median_score = median(scores_for_prospect) if scores_for_prospect else 0
         
-        return Score(
-            value=task_average,
-            answer=json.dumps(response.get("prospects", []), indent=2),
-            explanation=f"Score: {task_average:.3f}, Verification: {verification_rate:.1%} ({sum(1 for v in verification_results if v['verified'])}/3 verified)",
-            metadata={
-                "prospect_scores": prospect_scores,
-                "judge_responses": all_judge_scores,
-                "verification_results": verification_results,
-                "tool_usage": {
-                    "tavily_searches": len(tool_usage["tavily_search"]),
-                    "tavily_extracts": len(tool_usage["tavily_extract"]),
-                    "urls_verified": list(tool_usage["tavily_extract"])
-                },
-                "task_average": task_average,
-                "verification_rate": verification_rate
+        prospect_scores.append({
+            "name": prospect_names[i],
+            "median_score": median_score,
+            "normalized": median_score / 40.0,
+            "verified": verified
+        })
+    
+    # Calculate overall score
+    task_average = sum(p["normalized"] for p in prospect_scores) / len(prospect_scores) if prospect_scores else 0
+    verification_rate = sum(1 for p in prospect_scores if p["verified"]) / len(prospect_scores) if prospect_scores else 0
+    if verification_known:
+        verification_note = f"{verification_rate:.1%} ({sum(1 for p in prospect_scores if p['verified'])}/{len(prospect_scores)} verified)"
+    else:
+        verification_rate = None
+        verification_note = "unknown (tool calls not recorded)"
+    
+    return Score(
+        value=task_average,
+        answer=json.dumps(response.get("prospects", []), indent=2),
+        explanation=f"Score: {task_average:.3f}, Verification: {verification_note}",
+        metadata={
+            "prospect_scores": prospect_scores,
+            "judge_responses": all_judge_scores,
+            "verification_results": verification_results,
+            "tool_usage": {
+                "tavily_searches": len(tool_usage["tavily_search"]),
+                "tavily_extracts": len(tool_usage["tavily_extract"]),
+                "urls_verified": list(tool_usage["tavily_extract"])
+            },
+            "task_average": task_average,
+            "verification_rate": verification_rate,
+            "triaged_prospects": slots - len(judged_indices),
+            "judging": {
+                "mode": judge_mode,
+                "judges_called": [judge_result["model"] for judge_result in all_judge_scores],
+                "escalated": escalated_because is not None and bool(expensive_judges),
+                "escalation_reason": escalated_because
             }
+        }
+    )
+
+
+def criteria_breakdown(
+    prospect_scores: List[Dict[str, Any]],
+    judge_responses: List[Dict[str, Any]]
+) -> Dict[str, float]:
+    """Mean score (0-10) per criterion over all prospects, taking the median across judges.
+    
+    Triaged prospects count as zeros, as they do in the task score.
+    """
+    
+    judged = sum(1 for p in prospect_scores if "triaged" not in p)
+    breakdown = {}
+    for key, label in CRITERIA.items():
+        total = 0.0
+        for position in range(judged):
+            values = []
+            for judge_result in judge_responses:
+                prospects = judge_result.get("scores", {}).get("prospects", [])
+                value = prospects[position].get(key) if position < len(prospects) and isinstance(prospects[position], dict) else None
+                if isinstance(value, (int, float)):
+                    values.append(value)
+            total += median(values) if values else 0
+        breakdown[label] = total / len(prospect_scores) if prospect_scores else 0.0
+    return breakdown
+
+
+@scorer(metrics=[accuracy(), stderr()])
+def multi_judge_scorer_batch_verified(
+    judge_models: List[str] = None,
+    company_context: Dict[str, str] = None,
+    max_concurrency: int = DEFAULT_JUDGE_CONCURRENCY,
+    judge_timeout: Optional[float] = DEFAULT_JUDGE_TIMEOUT,
+    judge_cache: str = "use",
+    judge_mode: Optional[str] = None
+):
+    """Multi-judge scoring with verification tracking from tool usage
+    
+    Judges run concurrently, at most ``max_concurrency`` calls in flight
+    across all samples, and each call is abandoned after ``judge_timeout``
+    seconds. Judge responses are cached on disk by content (see
+    JUDGE_CACHE_MODES for ``judge_cache``). Prospects with no usable content
+    are triaged to a zero score up front and never reach the judges.
+    
+    With ``judge_mode="escalate"`` (default: judging.mode in config.yaml) the
+    cheap judges score first and the remaining judges are only called when
+    escalation_reason finds the cheap verdict contested.
+    """
+    
+    # Reject bad options when the task is built rather than at the first sample
+    resolve_judging(judge_models, judge_cache, judge_mode)
+    
+    async def score(state: TaskState, target: Any) -> Score:
+        """Score the model's response with real verification tracking."""
+        
+        # Parse model response
+        response_text = ""
+        if hasattr(state, 'output') and hasattr(state.output, 'completion'):
+            response_text = state.output.completion
+        else:
+            response_text = str(state.messages[-1].content if state.messages else "")
+        
+        return await score_response(
+            response_text,
+            extract_tool_usage_from_state(state),
+            judge_models=judge_models,
+            company_context=company_context,
+            max_concurrency=max_concurrency,
+            judge_timeout=judge_timeout,
+            judge_cache=judge_cache,
+            judge_mode=judge_mode,
+            checkpoint_key=(state.metadata or {}).get(CHECKPOINT_KEY_METADATA),
+            expected_names=(state.metadata or {}).get(PROSPECT_NAMES_METADATA)
         )
     
     return score
 
 
 class MultiJudgeScorer:
-    """Wrapper class for multi-judge scoring"""
-    
-    def __init__(self, judge_models: List[str] = None):
-        self.judge_models = judge_models or [
-            "openrouter/google/gemini-2.5-pro",
-            "openrouter/moonshotai/kimi-k2",
-            "openrouter/openai/gpt-5-mini",
-            "openrouter/anthropic/claude-opus-4.1"
-        ]
+    """Wrapper class for multi-judge scoring outside an Inspect task
+    
+    score() summarizes the panel's verdict from finished eval logs, and
+    score_response() judges a stored response again (see benchmark/rescore.py).
+    """
+    
+    def __init__(
+        self,
+        judge_models: List[str] = None,
+        company_context: Dict[str, str] = None,
+        max_concurrency: int = DEFAULT_JUDGE_CONCURRENCY,
+        judge_timeout: Optional[float] = DEFAULT_JUDGE_TIMEOUT,
+        judge_cache: str = "use",
+        judge_mode: Optional[str] = None
+    ):
+        judging = resolve_judging(judge_models, judge_cache, judge_mode)
+        self.judge_models = judging["judge_models"]
+        self.judge_mode = judging["judge_mode"]
+        self.judge_cache = judge_cache
+        self.company_context = company_context
+        self.max_concurrency = max_concurrency
+        self.judge_timeout = judge_timeout
+    
+    async def score_response(
+        self,
+        response_text: str,
+        tool_usage: Dict[str, Any],
+        checkpoint_key: Optional[str] = None,
+        expected_names: Optional[List[str]] = None
+    ) -> Score:
+        """Judge one response with this scorer's panel"""
+        return await score_response(
+            response_text,
+            tool_usage,
+            judge_models=self.judge_models,
+            company_context=self.company_context,
+            max_concurrency=self.max_concurrency,
+            judge_timeout=self.judge_timeout,
+            judge_cache=self.judge_cache,
+            judge_mode=self.judge_mode,
+            checkpoint_key=checkpoint_key,
+            expected_names=expected_names
+        )
+    
+    @staticmethod
+    def summarize(score: Score, costs: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Headline numbers from one multi-judge Score
+        
+        ``costs`` is the evaluation's cost per span kind plus its "total"
+        (``Telemetry.evaluation_costs``); without it the cost is unknown (0).
+        """
+        metadata = score.metadata or {}
+        prospect_scores = metadata.get("prospect_scores", [])
+        costs = dict(costs or {})
+        return {
+            "final_score": float(score.value) if isinstance(score.value, (int, float)) else 0.0,
+            "cost": costs.pop("total", 0.0),
+            "cost_breakdown": costs,
+            "breakdown": criteria_breakdown(prospect_scores, metadata.get("judge_responses", [])),
+            "verification_rate": metadata.get("verification_rate", 0.0),
+            "prospect_scores": prospect_scores,
+            "judging": metadata.get("judging", {})
+        }
     
     def score(self, result: Any, verbose: bool = False) -> Dict[str, Any]:
-        """Score a result using the multi-judge panel"""
-        # This would integrate with the scorer function above
-        # Placeholder for actual implementation
+        """Synchronous ascore() for callers without a running event loop"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ascore(result, verbose=verbose))
+        raise RuntimeError("MultiJudgeScorer.score() called inside an event loop - await ascore() instead")
+    
+    async def ascore(self, result: Any, verbose: bool = False) -> Dict[str, Any]:
+        """Summarize the multi-judge scores of an eval log (or the list run_eval returns)
+        
+        Samples the task already scored are read rather than judged again; a
+        sample with no score (scoring failed) is judged now, concurrently, from
+        its output and tool calls. Samples whose generation errored are not
+        scored: they are listed in ``failed_samples`` and left out of the
+        mean. Several samples (epochs) are averaged. The cost is the
+        evaluation's telemetry total: generation, judge and tool spans.
+        """
+        
+        logs = result if isinstance(result, list) else [result]
+        samples = []
+        failed = []
+        labels = set()
+        for log in logs:
+            model = getattr(getattr(log, "eval", None), "model", None)
+            if model:
+                labels.add(evaluation_label(str(model)))
+            for sample in getattr(log, "samples", None) or []:
+                error = getattr(sample, "error", None)
+                if error:
+                    failed.append({"id": sample.id, "error": getattr(error, "message", None) or str(error)})
+                    continue
+                samples.append(sample)
+        
+        # Samples the task could not score are judged now, concurrently, in the caller's loop
+        unscored = [sample for sample in samples if not sample.scores]
+        rejudged = await asyncio.gather(*[
+            self.score_response(
+                sample.output.completion if sample.output else "",
+                extract_tool_usage_from_state(sample),
+                expected_names=(sample.metadata or {}).get(PROSPECT_NAMES_METADATA)
+            )
+            for sample in unscored
+        ])
+        rejudged = dict(zip(map(id, unscored), rejudged))
+        
+        summaries = []
+        for sample in samples:
+            score = rejudged.get(id(sample)) or next(iter(sample.scores.values()))
+            if verbose:
+                print(f"  Sample {sample.id}: {score.explanation}")
+            summaries.append(self.summarize(score))
+        for sample in failed:
+            print(f"  ❌ Sample {sample['id']} failed, not scored: {sample['error']}")
+        
+        costs = {}
+        for label in labels:
+            for kind, cost in get_telemetry().evaluation_costs(label).items():
+                costs[kind] = costs.get(kind, 0.0) + cost
+        
+        if not summaries:
+            return {**self.summarize(Score(value=0.0), costs), "failed_samples": failed}
+        cost = costs.pop("total", 0.0)
+        if len(summaries) == 1:
+            return {**summaries[0], "cost": cost, "cost_breakdown": costs, "failed_samples": failed}
+        
+        count = len(summaries)
         return {
-            "final_score": 0.0,
-            "cost": 0.0,
+            "final_score": sum(s["final_score"] for s in summaries) / count,
+            "cost": cost,
+            "cost_breakdown": costs,
             "breakdown": {
-                "Engineering Pain": 0.0,
-                "Prospect Insight": 0.0,
-                "Product Fit": 0.0,
-                "Reply Probability": 0.0
-            }
-        }
\ No newline at end of file
+                label: sum(s["breakdown"][label] for s in summaries) / count
+                for label in CRITERIA.values()
+            },
+            "verification_rate": sum(s["verification_rate"] for s in summaries) / count,
+            "samples": summaries,
+            "failed_samples": failed
+        }
@@ -0,0 +1,116 @@
+"""
+Evidence Verification - Canonical URL index for checking evidence against visited pages
+"""
+
+from typing import Iterable, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+# Query parameters that only track the click, never change the page
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "msclkid", "ref", "ref_src"}
+
+# Public suffixes with two labels, so "bbc.co.uk" is registrable rather than "co.uk"
+MULTI_LABEL_SUFFIXES = {
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "com.au", "net.au", "org.au",
+    "co.nz", "co.jp", "co.in", "com.br", "com.mx", "co.za", "com.sg", "com.cn",
+}
+
+
+def _split(url: str):
+    """urlsplit that tolerates scheme-less URLs like 'www.example.com/page'"""
+    url = url.strip()
+    if "://" not in url:
+        url = "//" + url
+    return urlsplit(url)
+
+
+def _host(parts) -> str:
+    """Lowercased host without credentials, port or a leading 'www.'"""
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """Canonical form of a URL for equality checks.
+    
+    Drops the scheme, 'www.', default ports, fragments, trailing slashes and
+    tracking parameters (utm_* and friends), and sorts what is left of the query.
+    """
+    
+    if not url:
+        return None
+    try:
+        parts = _split(url)
+    except ValueError:
+        return None
+    
+    host = _host(parts)
+    if not host:
+        return None
+    
+    path = parts.path.rstrip("/")
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    canonical = host + path
+    if query:
+        canonical += "?" + urlencode(sorted(query))
+    return canonical
+
+
+def registrable_domain(url: str) -> Optional[str]:
+    """Registrable domain of a URL ('news.bbc.co.uk' -> 'bbc.co.uk')"""
+    
+    if not url:
+        return None
+    try:
+        host = _host(_split(url))
+    except ValueError:
+        return None
+    
+    labels = [label for label in host.split(".") if label]
+    if len(labels) < 2:
+        return host or None
+    keep = 3 if ".".join(labels[-2:]) in MULTI_LABEL_SUFFIXES else 2
+    return ".".join(labels[-keep:])
+
+
+class VerificationIndex:
+    """Hash sets of canonical URLs and registrable domains for visited pages
+    
+    Built once per sample, so each evidence URL is checked with two set
+    lookups no matter how many pages were visited or prospects returned.
+    """
+    
+    def __init__(self, visited_urls: Iterable[str] = ()):
+        self.urls: Set[str] = set()
+        self.domains: Set[str] = set()
+        for url in visited_urls:
+            self.add(url)
+    
+    def add(self, url: str):
+        """Index one visited URL"""
+        canonical = canonicalize_url(url)
+        if canonical:
+            self.urls.add(canonical)
+        domain = registrable_domain(url)
+        if domain:
+            self.domains.add(domain)
+    
+    def exact(self, evidence_url: str) -> bool:
+        """True if this exact page (after canonicalization) was visited"""
+        canonical = canonicalize_url(evidence_url)
+        return canonical is not None and canonical in self.urls
+    
+    def verified(self, evidence_url: str) -> bool:
+        """True if the evidence page, or another page on its site, was visited"""
+        if self.exact(evidence_url):
+            return True
+        domain = registrable_domain(evidence_url)
+        return domain is not None and domain in self.domains
+    
+    def __len__(self) -> int:
+        return len(self.urls)
@@ -0,0 +1,291 @@
+"""
+Evaluation Outputs - Append-only JSONL stream of per-evaluation records
+
+Each evaluation is appended to outputs/evaluations.jsonl as one line. A
+small sidecar index (evaluations.jsonl.idx: model, byte offset, length per
+line) lets a single model's records be read by seeking straight to them,
+and iter_outputs() streams records lazily without loading the whole file.
+
+The stream is generated, not committed: on first use it is seeded from the
+committed legacy files (complete_outputs_all.json and friends), which stay
+the source of record for results from before the stream existed.
+"""
+
+import argparse
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+OUTPUTS_DIR = Path(__file__).parent.parent / "outputs"
+DEFAULT_OUTPUTS_PATH = OUTPUTS_DIR / "evaluations.jsonl"
+
+# Monolithic files written before the JSONL stream existed (most complete first)
+LEGACY_OUTPUT_FILES = [
+    "complete_outputs_all.json",
+    "all_models_outputs.json",
+    "complete_outputs.json",
+    "all_outputs.json",
+]
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+@contextmanager
+def _locked(f):
+    """Exclusive advisory lock so concurrent writers append whole records"""
+    try:
+        import fcntl
+    except ImportError:  # Windows: appends are still line-buffered
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def ensure_outputs(path: Path = DEFAULT_OUTPUTS_PATH) -> None:
+    """Seed the default outputs stream from the legacy files the first time it is used"""
+    path = Path(path)
+    if path.exists() or path != DEFAULT_OUTPUTS_PATH:
+        return
+    
+    # Build the seed aside and link it into place, so concurrent first users
+    # cannot both seed (os.link fails if another process got there first)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Not mkstemp: its 0600 mode would stick to the shared file; "x" gives the umask default
+    tmp_path = path.parent / f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    open(tmp_path, "x").close()
+    try:
+        migrate_legacy_outputs(path.parent, tmp_path)
+        os.link(tmp_path, path)
+        rebuild_index(path)
+    except FileExistsError:
+        pass
+    finally:
+        tmp_path.unlink()
+        _index_path(tmp_path).unlink(missing_ok=True)
+
+
+def record_model(record: Dict[str, Any]) -> str:
+    """Index key of a record: the full model id"""
+    return record.get("full_model") or record.get("model", "")
+
+
+def append_output(record: Dict[str, Any], path: Path = DEFAULT_OUTPUTS_PATH) -> int:
+    """Append one evaluation record and index it; returns its byte offset"""
+    path = Path(path)
+    ensure_outputs(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    
+    with open(path, "ab") as f, _locked(f):
+        f.seek(0, 2)
+        offset = f.tell()
+        f.write(line)
+        f.flush()
+        if offset and not _index_path(path).exists():
+            rebuild_index(path)  # Index lost: cover the earlier records too
+        else:
+            with open(_index_path(path), "a") as index:
+                index.write(f"{record_model(record)}\t{offset}\t{len(line)}\n")
+    return offset
+
+
+def rebuild_index(path: Path = DEFAULT_OUTPUTS_PATH) -> None:
+    """Regenerate the offset index by scanning the JSONL file once"""
+    path = Path(path)
+    entries = []
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                entries.append(f"{record_model(json.loads(line))}\t{offset}\t{len(line)}\n")
+            offset += len(line)
+    with open(_index_path(path), "w") as index:
+        index.writelines(entries)
+
+
+def load_index(path: Path = DEFAULT_OUTPUTS_PATH) -> Dict[str, List[Tuple[int, int]]]:
+    """Map of model -> [(offset, length), ...] in file order"""
+    path = Path(path)
+    ensure_outputs(path)
+    index_path = _index_path(path)
+    if not path.exists():
+        return {}
+    
+    # Rebuild if the index is missing or does not cover the whole file
+    covered = 0
+    if index_path.exists():
+        with open(index_path, "r") as index:
+            lines = index.read().splitlines()
+        if lines:
+            _, offset, length = lines[-1].rsplit("\t", 2)
+            covered = int(offset) + int(length)
+    if not index_path.exists() or covered != path.stat().st_size:
+        rebuild_index(path)
+        with open(index_path, "r") as index:
+            lines = index.read().splitlines()
+    
+    positions: Dict[str, List[Tuple[int, int]]] = {}
+    for line in lines:
+        model, offset, length = line.rsplit("\t", 2)
+        positions.setdefault(model, []).append((int(offset), int(length)))
+    return positions
+
+
+def iter_outputs(path: Path = DEFAULT_OUTPUTS_PATH, model: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily yield records, optionally only one model's (via the index)"""
+    path = Path(path)
+    ensure_outputs(path)
+    if not path.exists():
+        return
+    
+    if model is None:
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    
+    positions = load_index(path).get(model, [])
+    with open(path, "rb") as f:
+        for offset, length in positions:
+            f.seek(offset)
+            yield json.loads(f.read(length))
+
+
+def get_output(model: str, path: Path = DEFAULT_OUTPUTS_PATH) -> Optional[Dict[str, Any]]:
+    """Most recently appended record for a model, or None"""
+    latest = None
+    for record in iter_outputs(path, model=model):
+        latest = record
+    return latest
+
+
+def record_from_eval_log(
+    model: str,
+    task: str,
+    log: Any,
+    prompt_hash: str = "",
+    timestamp: Optional[str] = None,
+    epoch_offset: int = 0
+) -> Dict[str, Any]:
+    """Build an outputs record from an Inspect eval log
+    
+    ``epoch_offset`` is added to sample epochs (later rounds of a multi-epoch run).
+    """
+    
+    record: Dict[str, Any] = {
+        "model": model.split("/")[-1],
+        "full_model": model,
+        "task": task,
+        "prompt_hash": prompt_hash,
+        "timestamp": timestamp,
+        "status": getattr(log, "status", "unknown"),
+        "score": 0.0,
+        "cost": 0.0,
+    }
+    
+    results = getattr(log, "results", None)
+    if results and results.scores and "accuracy" in results.scores[0].metrics:
+        record["score"] = results.scores[0].metrics["accuracy"].value
+    
+    stats = getattr(log, "stats", None)
+    if stats and stats.model_usage:
+        record["total_tokens"] = sum(usage.total_tokens for usage in stats.model_usage.values())
+    
+    sample_records = [
+        sample_record(sample, epoch_offset) for sample in getattr(log, "samples", None) or []
+        if sample.scores
+    ]
+    return add_sample_records(record, sample_records)
+
+
+def sample_record(sample: Any, epoch_offset: int = 0) -> Dict[str, Any]:
+    """Outputs entry for one scored sample (prospect batch) of an eval log"""
+    score = next(iter(sample.scores.values()))
+    try:
+        response = {"prospects": json.loads(score.answer or "[]")}
+    except json.JSONDecodeError:
+        response = score.answer
+    metadata = score.metadata or {}
+    return {
+        "id": sample.id,
+        "epoch": getattr(sample, "epoch", 1) + epoch_offset,
+        "prospect_names": (sample.metadata or {}).get("prospect_names"),
+        "score": score.value,
+        "model_response": response,
+        "tool_usage": metadata.get("tool_usage", {}),
+        "prospect_scores": metadata.get("prospect_scores", [])
+    }
+
+
+def add_sample_records(record: Dict[str, Any], sample_records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Attach sample entries to an evaluation record"""
+    if len(sample_records) == 1:
+        only = sample_records[0]
+        for field in ("prospect_names", "model_response", "tool_usage", "prospect_scores"):
+            record[field] = only[field]
+    elif sample_records:
+        # One sample per batch of prospects: keep each batch, plus the prospects merged
+        record["samples"] = sample_records
+        record["model_response"] = {"prospects": [
+            prospect for s in sample_records
+            if isinstance(s["model_response"], dict)
+            for prospect in s["model_response"].get("prospects", [])
+        ]}
+        record["prospect_scores"] = [p for s in sample_records for p in s["prospect_scores"]]
+    
+    return record
+
+
+def migrate_legacy_outputs(
+    outputs_dir: Path = OUTPUTS_DIR,
+    path: Path = DEFAULT_OUTPUTS_PATH
+) -> int:
+    """Append records from the legacy monolithic JSON files (skipping duplicates)"""
+    seen = {(record_model(r), r.get("timestamp")) for r in iter_outputs(path)}
+    migrated = 0
+    for name in LEGACY_OUTPUT_FILES:
+        source = Path(outputs_dir) / name
+        if not source.exists():
+            continue
+        with open(source, "r") as f:
+            records = json.load(f)
+        for record in records:
+            key = (record_model(record), record.get("timestamp"))
+            if key in seen:
+                continue
+            seen.add(key)
+            append_output(record, path)
+            migrated += 1
+    return migrated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Revenue Bench evaluation outputs (JSONL)")
+    parser.add_argument("--path", default=str(DEFAULT_OUTPUTS_PATH), help="JSONL outputs file")
+    parser.add_argument("--migrate", action="store_true", help="Import legacy outputs/*.json files")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the offset index")
+    parser.add_argument("--model", help="Print the latest record for a model")
+    args = parser.parse_args()
+    
+    path = Path(args.path)
+    if args.migrate:
+        print(f"✅ Migrated {migrate_legacy_outputs(path=path)} records into {path}")
+    if args.reindex:
+        rebuild_index(path)
+        print(f"✅ Rebuilt index for {path}")
+    if args.model:
+        print(json.dumps(get_output(args.model, path), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Rate Limiting - Per-provider token buckets with adaptive concurrency
+
+Each provider (Tavily, OpenRouter) gets one shared limiter. Calls wait for a
+token and a concurrency slot; throttled calls (HTTP 429) are retried with
+jittered exponential backoff, honoring Retry-After. Concurrency is halved
+whenever the provider throttles us and grows back one slot at a time after
+a run of successful calls.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .config import get_setting
+from .telemetry import note_queue_wait, note_retry
+
+T = TypeVar("T")
+
+# Exception types provider SDKs raise for rate limits (openai, anthropic, google)
+RATE_LIMIT_ERROR_TYPES = {"RateLimitError", "ResourceExhausted", "TooManyRequests"}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """Token bucket plus additive-increase/multiplicative-decrease concurrency limit"""
+    
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        increase_after: int = 5
+    ):
+        self.name = name
+        self.rate = requests_per_second
+        self.burst = burst or max(1, int(requests_per_second or 1))
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.increase_after = increase_after
+        
+        self.limit = float(max_concurrency)
+        self.active = 0
+        self.tokens = float(self.burst)
+        self.throttled = 0
+        self.retries = 0
+        self._successes = 0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Callers waiting for a slot, in arrival order, and the timer that
+        # wakes the queue when the next token is due
+        self._waiters: deque = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _refill(self, now: float) -> None:
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _wait_time(self, now: float) -> float:
+        """0 when a call may start now, else seconds until it might (inf: until a slot frees)"""
+        wait = self._paused_until - now
+        if wait > 0:
+            return wait
+        self._refill(now)
+        if self.active >= int(self.limit):
+            return math.inf
+        if self.rate and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0.0
+    
+    def _take(self) -> None:
+        if self.rate:
+            self.tokens -= 1
+        self.active += 1
+    
+    async def _acquire(self) -> None:
+        if not self._waiters and self._wait_time(time.monotonic()) == 0:
+            self._take()
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # Granted just as the caller was cancelled
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+    
+    def _release(self) -> None:
+        self.active -= 1
+        self._dispatch()
+    
+    def _dispatch(self) -> None:
+        """Hand slots to waiters in arrival order; sleep until the next token or pause ends"""
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.done() or waiter.get_loop().is_closed():
+                self._waiters.popleft()
+                continue
+            wait = self._wait_time(time.monotonic())
+            if wait > 0:
+                if wait != math.inf:
+                    self._wake_in(wait)
+                return  # A released slot dispatches again
+            self._waiters.popleft()
+            self._take()
+            waiter.set_result(None)
+    
+    def _wake_in(self, delay: float) -> None:
+        """Run _dispatch after ``delay`` seconds (one timer, the earliest wins)"""
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._timer is not None and self._timer_loop is loop:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._on_timer)
+        self._timer_loop = loop
+    
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of a call"""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+    
+    def on_success(self) -> None:
+        """Grow concurrency back after a run of unthrottled calls"""
+        self._successes += 1
+        if self._successes >= self.increase_after and self.limit < self.max_concurrency:
+            self.limit = min(self.max_concurrency, self.limit + 1)
+            self._successes = 0
+            self._dispatch()
+    
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Halve concurrency and pause all callers for Retry-After, if given"""
+        self.throttled += 1
+        self._successes = 0
+        self.limit = max(self.min_concurrency, self.limit / 2)
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+    
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Retry-After when the provider sent one, else full-jitter exponential backoff"""
+        if retry_after:
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": int(self.limit),
+            "throttled": self.throttled,
+            "retries": self.retries
+        }
+
+
+async def call_with_backoff(
+    limiter: AdaptiveRateLimiter,
+    send: Callable[[], Awaitable[T]],
+    throttle_of: Callable[[Any], Optional[float]]
+) -> T:
+    """Call ``send()`` under the limiter, retrying throttled calls
+    
+    ``throttle_of`` receives the result (or the raised exception) and returns
+    None when the call was not throttled, otherwise the Retry-After hint in
+    seconds (0 when the provider gave none). Once retries run out the last
+    throttled result is returned (or its exception raised).
+    """
+    attempt = 0
+    while True:
+        error: Optional[Exception] = None
+        result: Any = None
+        wait_start = time.monotonic()
+        async with limiter.slot():
+            note_queue_wait(time.monotonic() - wait_start)
+            try:
+                result = await send()
+            except Exception as e:
+                error = e
+        
+        retry_after = throttle_of(error if error is not None else result)
+        if retry_after is None:
+            if error is not None:
+                raise error
+            limiter.on_success()
+            return result
+        
+        limiter.on_throttle(retry_after)
+        if attempt >= limiter.max_retries:
+            if error is not None:
+                raise error
+            return result
+        
+        delay = limiter.backoff_delay(attempt, retry_after)
+        attempt += 1
+        limiter.retries += 1
+        note_retry()
+        print(f"Warning: {limiter.name} rate limited, retrying in {delay:.1f}s "
+              f"(attempt {attempt}/{limiter.max_retries})")
+        await asyncio.sleep(delay)
+        note_queue_wait(delay)
+
+
+def response_throttle(response: Any) -> Optional[float]:
+    """throttle_of for HTTP responses: 429 means throttled"""
+    if getattr(response, "status_code", None) != 429:
+        return None
+    return parse_retry_after(response.headers.get("retry-after")) or 0.0
+
+
+def exception_throttle(error: Any) -> Optional[float]:
+    """throttle_of for provider SDK errors that signal a rate limit
+    
+    Only an HTTP 429 status or an SDK rate-limit error type counts; the
+    message text is not inspected (request ids and token counts contain "429").
+    """
+    if not isinstance(error, Exception):
+        return None
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    rate_limit_type = any(cls.__name__ in RATE_LIMIT_ERROR_TYPES for cls in type(error).__mro__)
+    if status != 429 and not rate_limit_type:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("retry-after")) or 0.0
+
+
+# One limiter per provider for the whole process
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> AdaptiveRateLimiter:
+    """Shared limiter for a provider, configured from rate_limits.<provider>"""
+    if provider not in _limiters:
+        settings = get_setting(f"rate_limits.{provider}", {}) or {}
+        _limiters[provider] = AdaptiveRateLimiter(
+            provider,
+            requests_per_second=settings.get("requests_per_second"),
+            burst=settings.get("burst"),
+            max_concurrency=settings.get("max_concurrency", 8),
+            min_concurrency=settings.get("min_concurrency", 1),
+            max_retries=settings.get("max_retries", get_setting(f"api.{provider}.max_retries", 3)),
+            base_delay=settings.get("base_delay", 1.0),
+            max_delay=settings.get("max_delay", 60.0)
+        )
+    return _limiters[provider]
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Throttling stats for every limiter used in this process"""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -0,0 +1,231 @@
+"""
+Record/Replay - Capture model, judge and Tavily traffic in a cassette
+
+In record mode every candidate generation, judge generation, tavily_search
+result and tavily_extract result is appended to a gzipped JSONL cassette. In
+replay mode the same calls are answered from the cassette in memory, so the
+whole pipeline runs offline and deterministically.
+
+Models are routed through the ``cassette/`` model provider, e.g.
+``cassette/openrouter/openai/gpt-5``; run_evaluation.py does this for you
+with --record/--replay. For ``inspect eval``, set REVENUE_BENCH_CASSETTE and
+REVENUE_BENCH_CASSETTE_MODE and prefix the model with ``cassette/``.
+"""
+
+import gzip
+import json
+import os
+import threading
+import zlib
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from inspect_ai.model import (
+    ChatMessage,
+    GenerateConfig,
+    Model,
+    ModelAPI,
+    ModelOutput,
+    get_model,
+    modelapi,
+)
+from inspect_ai.tool import ToolChoice, ToolInfo
+
+from .cache import DiskCache
+
+CASSETTE_MODES = ("record", "replay")
+
+CASSETTE_PATH_ENV = "REVENUE_BENCH_CASSETTE"
+CASSETTE_MODE_ENV = "REVENUE_BENCH_CASSETTE_MODE"
+
+
+class CassetteMiss(RuntimeError):
+    """A replayed run made a call that was never recorded"""
+
+
+class Cassette:
+    """Append-only store of recorded responses, keyed by request content"""
+    
+    def __init__(self, path: Path, mode: str):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Cassette mode must be one of {CASSETTE_MODES}, got {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._responses: Dict[str, Deque[Any]] = defaultdict(deque)
+        self._last: Dict[str, Any] = {}
+        
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+    
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+    
+    def _load(self) -> None:
+        """Read every interaction into memory"""
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[entry["key"]].append(entry["response"])
+        except (EOFError, zlib.error):
+            # Recording was interrupted mid-write; keep what was read
+            pass
+    
+    def record(self, kind: str, request: Any, response: Any) -> None:
+        """Append one interaction"""
+        if self._file is None:
+            return
+        line = json.dumps({
+            "kind": kind,
+            "key": DiskCache.make_key(kind, request),
+            "response": response
+        }, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.recorded += 1
+    
+    def replay(self, kind: str, request: Any) -> Any:
+        """Return the next recorded response for this request
+        
+        Repeated identical requests get the recorded responses in order;
+        once they run out the last one is served again.
+        """
+        key = DiskCache.make_key(kind, request)
+        with self._lock:
+            queue = self._responses.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            if key not in self._last:
+                raise CassetteMiss(f"No recorded {kind} response in {self.path} for request {key[:12]}")
+            self.replayed += 1
+            return self._last[key]
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_cassette: Optional[Cassette] = None
+
+
+def configure_cassette(path: Optional[str], mode: Optional[str]) -> Optional[Cassette]:
+    """Activate a cassette for this process (and for subprocesses via env vars)"""
+    global _cassette
+    
+    close_cassette()
+    if not path:
+        os.environ.pop(CASSETTE_PATH_ENV, None)
+        os.environ.pop(CASSETTE_MODE_ENV, None)
+        return None
+    
+    _cassette = Cassette(Path(path), mode or "replay")
+    os.environ[CASSETTE_PATH_ENV] = str(path)
+    os.environ[CASSETTE_MODE_ENV] = _cassette.mode
+    return _cassette
+
+
+def active_cassette() -> Optional[Cassette]:
+    """The active cassette, opened from the environment on first use"""
+    global _cassette
+    
+    if _cassette is None and os.getenv(CASSETTE_PATH_ENV):
+        _cassette = Cassette(
+            Path(os.environ[CASSETTE_PATH_ENV]),
+            os.getenv(CASSETTE_MODE_ENV, "replay")
+        )
+    return _cassette
+
+
+def close_cassette() -> None:
+    """Flush and close the active cassette"""
+    global _cassette
+    
+    if _cassette is not None:
+        _cassette.close()
+        _cassette = None
+
+
+def cassette_model(model: Optional[str]) -> Optional[str]:
+    """Route a model through the cassette provider when a cassette is active"""
+    if model and active_cassette() is not None and not model.startswith("cassette/"):
+        return f"cassette/{model}"
+    return model
+
+
+def _message_key(message: ChatMessage) -> Dict[str, Any]:
+    """Message content without per-run random ids"""
+    return message.model_dump(mode="json", exclude={"id", "source", "metadata"}, exclude_none=True)
+
+
+def _config_key(config: GenerateConfig) -> Dict[str, Any]:
+    """Generation settings that affect the output (not connection tuning or cache hints)"""
+    return config.model_dump(
+        mode="json",
+        exclude={"max_connections", "max_retries", "timeout", "attempt_timeout", "cache_prompt"},
+        exclude_none=True
+    )
+
+
+class CassetteModelAPI(ModelAPI):
+    """Model provider that records or replays another model's generations"""
+    
+    def __init__(
+        self,
+        model_name: str,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        config: GenerateConfig = GenerateConfig(),
+        **model_args: Any
+    ):
+        super().__init__(model_name=model_name, base_url=base_url, api_key=api_key, config=config)
+        self._inner: Optional[Model] = None
+    
+    def _inner_model(self) -> Model:
+        if self._inner is None:
+            self._inner = get_model(self.model_name)
+        return self._inner
+    
+    async def generate(
+        self,
+        input: List[ChatMessage],
+        tools: List[ToolInfo],
+        tool_choice: ToolChoice,
+        config: GenerateConfig
+    ) -> ModelOutput:
+        cassette = active_cassette()
+        request = {
+            "model": self.model_name,
+            "input": [_message_key(message) for message in input],
+            "tools": [tool.model_dump(mode="json") for tool in tools],
+            "config": _config_key(config)
+        }
+        
+        if cassette is not None and cassette.replaying:
+            return ModelOutput.model_validate(cassette.replay("model", request))
+        
+        output = await self._inner_model().generate(
+            input, tools=tools, tool_choice=tool_choice, config=config
+        )
+        if cassette is not None:
+            cassette.record("model", request, output.model_dump(mode="json"))
+        return output
+
+
+@modelapi(name="cassette")
+def cassette():
+    return CassetteModelAPI
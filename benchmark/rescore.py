@@ -0,0 +1,306 @@
+"""
+Offline Re-scoring - Judge stored model responses again without regenerating them
+
+Streams stored responses (outputs/evaluations.jsonl, the legacy
+outputs/*.json files or outputs/model_responses/*.json), rebuilds each
+response's verification report from its recorded tool usage, and sends them
+all through the judge panel concurrently. Judge calls share the process-wide
+judge concurrency budget; at most ``max_responses`` responses are held in
+memory at once. Each new score is appended to outputs/rescored.jsonl as soon
+as it is ready, so an interrupted run picks up where it left off.
+
+    python -m benchmark.rescore
+    python -m benchmark.rescore outputs/model_responses --judge-mode escalate
+    python -m benchmark.rescore --judges openrouter/openai/gpt-5-mini --max-concurrency 16
+
+Changing the judge panel, the judge mode or the judge prompt changes the
+rescore key, so a new rubric is scored from scratch while a repeated run only
+judges what is missing. A response no judge could score is not written, so the
+next run tries it again.
+
+Legacy records (saved before tool usage was stored, such as those seeded from
+outputs/complete_outputs_all.json) have no visited URLs. They are judged with
+every prospect's verification "unknown" (no unverified-evidence cap, a
+verification rate of None), and their rows are marked
+``"leaderboard_eligible": false`` because they were judged differently.
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .cache import DiskCache
+from .judges.multi_judge_scorer import (
+    DEFAULT_JUDGE_CONCURRENCY,
+    JUDGE_PROMPT_TEMPLATE,
+    JUDGE_RUBRIC_TEMPLATE,
+    MultiJudgeScorer,
+    new_tool_usage,
+    record_tool_call,
+)
+from .outputs import DEFAULT_OUTPUTS_PATH, OUTPUTS_DIR, append_output, iter_outputs
+from .telemetry import bind_evaluation, get_telemetry
+
+DEFAULT_RESCORE_PATH = OUTPUTS_DIR / "rescored.jsonl"
+
+# Responses held in memory (and judged) at once
+DEFAULT_MAX_RESPONSES = 16
+
+
+def _load_json_records(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        yield data
+
+
+def iter_stored_responses(sources: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Stream stored evaluation records from JSONL files, JSON files or directories of them
+    
+    Records seen in an earlier source (same model and timestamp) are skipped.
+    """
+    
+    seen = set()
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            paths = sorted(source.glob("*.json")) + sorted(source.glob("*.jsonl"))
+        else:
+            paths = [source]
+        
+        for path in paths:
+            records = iter_outputs(path) if path.suffix == ".jsonl" else _load_json_records(path)
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                record.setdefault("full_model", record.get("model", ""))
+                key = (record["full_model"], record.get("timestamp"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                record["source"] = str(path)
+                yield record
+
+
+def response_text_from_record(record: Dict[str, Any]) -> str:
+    """The candidate's answer as text, whether it was stored parsed or raw"""
+    response = record.get("model_response", record.get("response", ""))
+    if isinstance(response, str):
+        return response
+    return json.dumps(response)
+
+
+def tool_usage_from_record(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Rebuild a tool usage record from a stored one, or None if none was stored
+    
+    Records written by run_evaluation.py keep the URLs passed to tavily_extract
+    (``tool_usage.urls_verified``); search queries are only kept as a count.
+    """
+    
+    stored = record.get("tool_usage")
+    if not isinstance(stored, dict):
+        return None
+    
+    tool_usage = new_tool_usage()
+    for _ in range(stored.get("tavily_searches", 0)):
+        record_tool_call(tool_usage, "tavily_search", {"query": ""})
+    for url in stored.get("urls_verified", []):
+        record_tool_call(tool_usage, "tavily_extract", {"url": url})
+    return tool_usage
+
+
+def rescore_key(record: Dict[str, Any], scorer: MultiJudgeScorer) -> str:
+    """Identity of one re-scoring: the stored response plus the panel and rubric judging it"""
+    return DiskCache.make_key(
+        "rescore",
+        record["full_model"],
+        record.get("timestamp"),
+        response_text_from_record(record),
+        sorted(scorer.judge_models),
+        scorer.judge_mode,
+        JUDGE_RUBRIC_TEMPLATE,
+        JUDGE_PROMPT_TEMPLATE
+    )
+
+
+async def rescore_sample(sample: Dict[str, Any], scorer: MultiJudgeScorer) -> Dict[str, Any]:
+    """Judge one stored sample (one batch of prospects) again"""
+    
+    tool_usage = tool_usage_from_record(sample)
+    score = await scorer.score_response(
+        response_text_from_record(sample),
+        tool_usage,
+        expected_names=sample.get("prospect_names")
+    )
+    
+    # Judges were needed but none returned scores: a 0% here would be an outage, not a score
+    metadata = score.metadata or {}
+    judged = sum(1 for p in metadata.get("prospect_scores", []) if "triaged" not in p)
+    responses = metadata.get("judge_responses", [])
+    if judged and not any("scores" in r for r in responses):
+        errors = [r.get("error", "no scores") for r in responses]
+        raise RuntimeError(f"no judge returned a score ({errors[0] if errors else 'no judges called'})")
+    
+    return {
+        "id": sample.get("id"),
+        "tool_usage_recorded": tool_usage is not None,
+        "explanation": score.explanation,
+        **scorer.summarize(score)
+    }
+
+
+async def rescore_record(record: Dict[str, Any], scorer: MultiJudgeScorer, key: str) -> Dict[str, Any]:
+    """Judge one stored evaluation (every sample of it) and build its rescored record"""
+    
+    bind_evaluation(record["full_model"])
+    samples = record.get("samples") or [record]
+    results = await asyncio.gather(*[rescore_sample(sample, scorer) for sample in samples])
+    count = len(results)
+    verification_rates = [r["verification_rate"] for r in results if r["verification_rate"] is not None]
+    
+    rescored = {
+        "model": record.get("model", record["full_model"].split("/")[-1]),
+        "full_model": record["full_model"],
+        "timestamp": record.get("timestamp"),
+        "source": record.get("source"),
+        "rescore_key": key,
+        "rescored_at": datetime.now().isoformat(),
+        "judge_panel": scorer.judge_models,
+        "judge_mode": scorer.judge_mode,
+        "previous_score": record.get("score"),
+        "score": sum(r["final_score"] for r in results) / count,
+        "breakdown": {
+            label: sum(r["breakdown"][label] for r in results) / count
+            for label in results[0]["breakdown"]
+        },
+        "verification_rate": (
+            sum(verification_rates) / len(verification_rates) if verification_rates else None
+        ),
+        "tool_usage_recorded": all(r["tool_usage_recorded"] for r in results),
+        "leaderboard_eligible": all(r["tool_usage_recorded"] for r in results),
+        "prospect_scores": [p for r in results for p in r["prospect_scores"]],
+        "judging": [r["judging"] for r in results] if count > 1 else results[0]["judging"],
+        "explanation": results[0]["explanation"] if count == 1 else f"Mean of {count} samples"
+    }
+    if count > 1:
+        rescored["samples"] = [
+            {"id": r["id"], "score": r["final_score"], "explanation": r["explanation"]}
+            for r in results
+        ]
+    return rescored
+
+
+async def rescore(
+    sources: List[Path],
+    scorer: MultiJudgeScorer,
+    output_path: Path = DEFAULT_RESCORE_PATH,
+    max_responses: int = DEFAULT_MAX_RESPONSES,
+    limit: Optional[int] = None,
+    force: bool = False
+) -> Dict[str, int]:
+    """Re-score stored responses, appending each result to ``output_path`` as it finishes
+    
+    Responses already rescored with the same panel and rubric are skipped
+    unless ``force`` is set.
+    """
+    
+    output_path = Path(output_path)
+    done = set() if force else {r.get("rescore_key") for r in iter_outputs(output_path)}
+    stats = {"rescored": 0, "skipped": 0, "failed": 0, "without_tool_usage": 0}
+    
+    slots = asyncio.Semaphore(max_responses)
+    pending = set()
+    
+    async def run(record: Dict[str, Any], key: str):
+        try:
+            rescored = await rescore_record(record, scorer, key)
+            append_output(rescored, output_path)
+            stats["rescored"] += 1
+            if not rescored["tool_usage_recorded"]:
+                stats["without_tool_usage"] += 1
+            previous = rescored["previous_score"]
+            change = f" (was {previous:.1%})" if isinstance(previous, (int, float)) else ""
+            print(f"  ✅ {rescored['full_model']}: {rescored['score']:.1%}{change}")
+        except Exception as e:
+            stats["failed"] += 1
+            print(f"  ❌ {record['full_model']}: {e}")
+        finally:
+            slots.release()
+    
+    queued = 0
+    for record in iter_stored_responses(sources):
+        if limit is not None and queued >= limit:
+            break
+        key = rescore_key(record, scorer)
+        if key in done:
+            stats["skipped"] += 1
+            continue
+        done.add(key)
+        queued += 1
+        
+        # Backpressure: read the next record only once a slot frees up
+        await slots.acquire()
+        task = asyncio.create_task(run(record, key))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    
+    if pending:
+        await asyncio.gather(*pending)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score stored model responses with the judge panel")
+    parser.add_argument("sources", nargs="*", default=[str(DEFAULT_OUTPUTS_PATH)],
+                        help="JSONL/JSON files or directories of stored responses "
+                        "(default: outputs/evaluations.jsonl)")
+    parser.add_argument("--output", default=str(DEFAULT_RESCORE_PATH), help="JSONL file rescored records are appended to")
+    parser.add_argument("--judges", nargs="+", help="Judge panel (default: the standard panel)")
+    parser.add_argument("--judge-mode", choices=["panel", "escalate"], default=None,
+                        help="panel or escalate (default: judging.mode)")
+    parser.add_argument("--judge-cache", choices=["use", "refresh", "bypass"], default="use",
+                        help="Judge response cache mode")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_JUDGE_CONCURRENCY,
+                        help="Judge calls in flight at once, across all responses")
+    parser.add_argument("--max-responses", type=int, default=DEFAULT_MAX_RESPONSES,
+                        help="Responses being judged at once")
+    parser.add_argument("--limit", type=int, help="Re-score at most this many responses")
+    parser.add_argument("--force", action="store_true", help="Re-score responses already in the output file")
+    args = parser.parse_args()
+    
+    # Imported here so the module stays light for callers that only read records
+    from .tasks.homebase import COMPANY_CONTEXT
+    
+    scorer = MultiJudgeScorer(
+        judge_models=args.judges,
+        company_context=COMPANY_CONTEXT,
+        max_concurrency=args.max_concurrency,
+        judge_cache=args.judge_cache,
+        judge_mode=args.judge_mode
+    )
+    
+    print(f"\n⚖️ Re-scoring stored responses with {len(scorer.judge_models)} judges ({scorer.judge_mode} mode)")
+    stats = asyncio.run(rescore(
+        [Path(source) for source in args.sources],
+        scorer,
+        output_path=Path(args.output),
+        max_responses=args.max_responses,
+        limit=args.limit,
+        force=args.force
+    ))
+    
+    print(f"\n📊 Rescored {stats['rescored']}, skipped {stats['skipped']} already done, {stats['failed']} failed")
+    if stats["without_tool_usage"]:
+        print(f"⚠️ {stats['without_tool_usage']} responses had no stored tool usage: judged with verification "
+              f"unknown and marked as not leaderboard eligible")
+    print(f"💰 Judge cost: ${get_telemetry().summary()['total']['cost']:.4f}")
+    print(f"💾 Results appended to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
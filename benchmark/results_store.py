@@ -0,0 +1,360 @@
+"""
+Results Store - Append-only SQLite store of evaluation results
+
+Every evaluation is appended as one row keyed by model, task, prompt hash and
+timestamp; nothing is ever rewritten, so any number of concurrent runs can
+record results safely (SQLite WAL mode). A leaderboard is generated from
+the store into results/generated/; the committed results/leaderboard.json and
+results/leaderboard.md are curated by hand and never overwritten.
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import sqlite_journal_mode
+
+RESULTS_DIR = Path(__file__).parent.parent / "results"
+DEFAULT_STORE_PATH = RESULTS_DIR / "results.sqlite"
+
+# Generated leaderboard files (gitignored)
+GENERATED_DIR = RESULTS_DIR / "generated"
+GENERATED_LEADERBOARD_JSON = GENERATED_DIR / "leaderboard.json"
+GENERATED_LEADERBOARD_MD = GENERATED_DIR / "leaderboard.md"
+
+# Prompt hash of results imported from files written before hashes were recorded
+IMPORTED_PROMPT_HASH = "imported"
+
+# A prompt run by fewer models than this is not ranked on its own
+MIN_RANKED_MODELS = 2
+
+# Display names for the provider segment of "openrouter/<provider>/<model>"
+PROVIDER_NAMES = {
+    "anthropic": "Anthropic",
+    "openai": "OpenAI",
+    "google": "Google",
+    "x-ai": "X-AI",
+    "z-ai": "Z-AI",
+    "moonshotai": "Moonshot",
+    "qwen": "Qwen",
+    "deepseek": "DeepSeek",
+    "perplexity": "Perplexity",
+    "ai21": "AI21",
+    "mistralai": "Mistral",
+    "meta-llama": "Meta",
+    "cohere": "Cohere",
+}
+
+
+class ResultsStore:
+    """Append-only, indexed store of evaluation results"""
+    
+    def __init__(self, path: Path = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA journal_mode={sqlite_journal_mode()}")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " model TEXT NOT NULL,"
+                " task TEXT NOT NULL,"
+                " prompt_hash TEXT NOT NULL,"
+                " timestamp TEXT NOT NULL,"
+                " score REAL NOT NULL,"
+                " cost REAL NOT NULL DEFAULT 0,"
+                " status TEXT NOT NULL DEFAULT 'success',"
+                " metadata TEXT)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_task_model ON results (task, model, timestamp)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_prompt ON results (prompt_hash)"
+            )
+    
+    def record(
+        self,
+        model: str,
+        task: str,
+        score: float,
+        cost: float = 0.0,
+        prompt_hash: str = "",
+        timestamp: Optional[str] = None,
+        status: str = "success",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Append one evaluation result and return its row id"""
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO results (model, task, prompt_hash, timestamp, score, cost, status, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    model,
+                    task,
+                    prompt_hash,
+                    timestamp or datetime.now().isoformat(),
+                    float(score),
+                    float(cost),
+                    status,
+                    json.dumps(metadata) if metadata else None
+                )
+            )
+        return cursor.lastrowid
+    
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def latest(self, task: str = "homebase", prompt_hash: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent successful result per model for a task"""
+        query = (
+            "SELECT * FROM results r WHERE r.id = ("
+            " SELECT id FROM results"
+            " WHERE task = r.task AND model = r.model AND status = 'success'"
+            + (" AND prompt_hash = :prompt_hash" if prompt_hash else "") +
+            " ORDER BY timestamp DESC, id DESC LIMIT 1"
+            ") AND r.task = :task"
+        )
+        rows = self._conn.execute(query, {"task": task, "prompt_hash": prompt_hash}).fetchall()
+        return [dict(row) for row in rows]
+    
+    def current_prompt_hash(self, task: str = "homebase") -> Optional[str]:
+        """Prompt hash of the most recent successful run, preferring real runs over imported results"""
+        row = self._conn.execute(
+            "SELECT prompt_hash FROM results WHERE task = ? AND status = 'success'"
+            " ORDER BY prompt_hash = ?, timestamp DESC, id DESC LIMIT 1",
+            (task, IMPORTED_PROMPT_HASH)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def history(self, model: str, task: str = "homebase") -> List[Dict[str, Any]]:
+        """Every recorded result for one model, oldest first"""
+        rows = self._conn.execute(
+            "SELECT * FROM results WHERE task = ? AND model = ? ORDER BY timestamp, id",
+            (task, model)
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def import_json(self, path: Path, task: str = "homebase") -> int:
+        """Seed the store from leaderboard.json (either schema) or an outputs/*.json list"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        
+        if isinstance(data, list):
+            # Rescored rows judged without tool usage score too low to rank
+            entries = [
+                (e.get("full_model") or e["model"], float(e["score"]), float(e.get("cost", 0)), e.get("timestamp"))
+                for e in data if e.get("leaderboard_eligible", True)
+            ]
+        elif "leaderboard" in data:
+            entries = [
+                (e.get("full_model") or e["model"], e["score"], e.get("cost_per_eval", 0), e.get("timestamp"))
+                for e in data["leaderboard"]
+            ]
+        else:
+            entries = [
+                (model, e.get("score", 0), e.get("cost", 0), e.get("timestamp"))
+                for model, e in data.get("models", {}).items()
+            ]
+        
+        for model, score, cost, timestamp in entries:
+            self.record(model, task, score, cost, prompt_hash=IMPORTED_PROMPT_HASH, timestamp=timestamp)
+        return len(entries)
+    
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _round_cost(cost: float) -> float:
+    return round(cost, 2) if cost >= 0.01 else round(cost, 3)
+
+
+def build_leaderboard(
+    rows: List[Dict[str, Any]],
+    version: str = "0.1.0",
+    prompt_hash: Optional[str] = None
+) -> Dict[str, Any]:
+    """Leaderboard document in the results/leaderboard.json schema"""
+    
+    rows = sorted(rows, key=lambda r: r["score"], reverse=True)
+    leaderboard = []
+    for rank, row in enumerate(rows, start=1):
+        cost = row["cost"]
+        leaderboard.append({
+            "rank": rank,
+            "model": row["model"].split("/")[-1],
+            "full_model": row["model"],
+            "score": round(row["score"], 3),
+            "cost_per_eval": _round_cost(cost),
+            "performance_per_dollar": round(row["score"] / cost, 2) if cost > 0 else 0.0,
+            "timestamp": row["timestamp"]
+        })
+        metadata = json.loads(row["metadata"]) if row.get("metadata") else {}
+        if "ci" in metadata:
+            # Multi-epoch results carry a bootstrap confidence interval
+            leaderboard[-1]["ci"] = [round(bound, 3) for bound in metadata["ci"]]
+            leaderboard[-1]["epochs"] = metadata.get("epochs")
+    
+    scores = [e["score"] for e in leaderboard]
+    total_cost = sum(row["cost"] for row in rows)
+    priced = [e for e in leaderboard if e["performance_per_dollar"] > 0]
+    by_cost = sorted(leaderboard, key=lambda e: e["cost_per_eval"])
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    return {
+        "metadata": {
+            "version": version,
+            "updated": today,
+            "total_models": len(leaderboard),
+            "total_cost": round(total_cost, 2),
+            "evaluation_date": max((r["timestamp"] for r in rows), default=today)[:10],
+            "prompt_hash": prompt_hash,
+            "imported": prompt_hash == IMPORTED_PROMPT_HASH
+        },
+        "leaderboard": leaderboard,
+        "summary": {
+            "best_overall": leaderboard[0]["model"] if leaderboard else None,
+            "best_value": max(priced, key=lambda e: e["performance_per_dollar"])["model"] if priced else None,
+            "most_expensive": by_cost[-1]["model"] if by_cost else None,
+            "least_expensive": by_cost[0]["model"] if by_cost else None,
+            "average_score": round(statistics.mean(scores), 3) if scores else 0.0,
+            "median_score": round(statistics.median(scores), 3) if scores else 0.0,
+            "total_models_evaluated": len(leaderboard),
+            "models_above_70_percent": sum(1 for s in scores if s >= 0.70),
+            "models_above_50_percent": sum(1 for s in scores if s >= 0.50),
+            "models_that_failed": sum(1 for s in scores if s == 0)
+        }
+    }
+
+
+def render_leaderboard_markdown(leaderboard: Dict[str, Any]) -> str:
+    """Full rankings table for results/leaderboard.md"""
+    
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    lines = [
+        "# Revenue Bench Leaderboard",
+        "",
+        f"*Last Updated: {leaderboard['metadata']['updated']}*",
+        "",
+    ]
+    if leaderboard["metadata"].get("fallback_from"):
+        lines += [f"*Fewer than {MIN_RANKED_MODELS} models have run prompt "
+                  f"`{leaderboard['metadata']['fallback_from']}` so far; showing the imported results.*", ""]
+    elif leaderboard["metadata"].get("imported"):
+        lines += ["*Imported results from runs before prompt hashes were recorded.*", ""]
+    elif leaderboard["metadata"].get("prompt_hash"):
+        lines += [f"*Prompt: `{leaderboard['metadata']['prompt_hash']}` (only results of this prompt are ranked)*", ""]
+    lines += [
+        f"## Full Rankings ({leaderboard['metadata']['total_models']} Models Evaluated)",
+        "",
+        "| Rank | Model | Provider | Score | Cost/Eval | Perf/$ | Status |",
+        "|------|-------|----------|-------|-----------|--------|--------|",
+    ]
+    for entry in leaderboard["leaderboard"]:
+        parts = entry["full_model"].split("/")
+        provider = parts[1] if parts[0] == "openrouter" and len(parts) > 2 else parts[0]
+        status = "✅" if entry["score"] >= 0.05 else ("⚠️" if entry["score"] > 0 else "❌")
+        rank, model, score = entry["rank"], entry["model"], f"{entry['score']:.1%}"
+        if "ci" in entry:
+            score += f" ±{(entry['ci'][1] - entry['ci'][0]) / 2:.1%}"
+        if rank in medals:
+            rank, model, score = f"{medals[rank]} **{rank}**", f"**{model}**", f"**{score}**"
+        lines.append(
+            f"| {rank} | {model} | {PROVIDER_NAMES.get(provider, provider)} | {score} "
+            f"| ${entry['cost_per_eval']} | {entry['performance_per_dollar']:.2f} | {status} |"
+        )
+    
+    if any("ci" in entry for entry in leaderboard["leaderboard"]):
+        lines += [
+            "",
+            "*Scores with ± are means over several epochs, ± half their bootstrap confidence interval.*"
+        ]
+    
+    summary = leaderboard["summary"]
+    lines += [
+        "",
+        "## Summary",
+        "",
+        f"- **Best overall**: {summary['best_overall']}",
+        f"- **Best value**: {summary['best_value']}",
+        f"- **Average score**: {summary['average_score']:.1%} (median {summary['median_score']:.1%})",
+        f"- **Total benchmark cost**: ${leaderboard['metadata']['total_cost']:.2f}",
+        "",
+        "## Status Legend",
+        "",
+        "- ✅ **Success**: Completed task with valid output",
+        "- ⚠️ **Partial**: Generated output but severe quality issues",
+        "- ❌ **Failed**: No valid output or critical errors",
+        "",
+        "---",
+        "",
+        "*For detailed methodology, see [METHODOLOGY.md](../docs/METHODOLOGY.md)*",
+        "*To add your model, see [ADD_MODEL.md](../docs/ADD_MODEL.md)*",
+        ""
+    ]
+    return "\n".join(lines)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write via a temp file so concurrent exporters never leave a torn file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Not mkstemp: its 0600 mode would stick to the published file; "x" gives the umask default
+    tmp_path = path.parent / f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    with open(tmp_path, "x") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def export_leaderboard(
+    store: ResultsStore,
+    task: str = "homebase",
+    json_path: Optional[Path] = GENERATED_LEADERBOARD_JSON,
+    markdown_path: Optional[Path] = None,
+    prompt_hash: Optional[str] = None,
+    min_models: int = MIN_RANKED_MODELS
+) -> Dict[str, Any]:
+    """Regenerate the leaderboard files from the store
+    
+    Only results of one prompt are ranked against each other: ``prompt_hash``,
+    by default that of the most recent run (imported results only when no run
+    has been recorded since). While fewer than ``min_models`` models have run
+    that prompt, the imported results are ranked instead.
+    """
+    prompt_hash = prompt_hash or store.current_prompt_hash(task)
+    rows = store.latest(task, prompt_hash=prompt_hash)
+    fallback_from = None
+    if len(rows) < min_models and prompt_hash != IMPORTED_PROMPT_HASH:
+        imported = store.latest(task, prompt_hash=IMPORTED_PROMPT_HASH)
+        if len(imported) > len(rows):
+            fallback_from, prompt_hash, rows = prompt_hash, IMPORTED_PROMPT_HASH, imported
+    
+    leaderboard = build_leaderboard(rows, prompt_hash=prompt_hash)
+    if fallback_from:
+        leaderboard["metadata"]["fallback_from"] = fallback_from
+    if json_path:
+        _write_atomic(Path(json_path), json.dumps(leaderboard, indent=2))
+    if markdown_path:
+        _write_atomic(Path(markdown_path), render_leaderboard_markdown(leaderboard))
+    return leaderboard
+
+
+def open_results_store(path: Path = DEFAULT_STORE_PATH) -> ResultsStore:
+    """Open the store, seeding it from the committed results on first use
+    
+    The full-precision outputs file is preferred over the rounded leaderboard.
+    """
+    store = ResultsStore(path)
+    if store.count() == 0:
+        for seed in (RESULTS_DIR.parent / "outputs" / "complete_outputs_all.json",
+                     RESULTS_DIR / "leaderboard.json"):
+            if seed.exists():
+                store.import_json(seed)
+                break
+    return store
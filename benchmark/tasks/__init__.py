@@ -2,6 +2,21 @@
 Revenue Bench Tasks - Evaluation tasks for AI models
 """
 
-from .homebase import HomebaseTask, homebase_personalization_optimized
+import importlib
 
-__all__ = ["HomebaseTask", "homebase_personalization_optimized"]
\ No newline at end of file
+# Exports are imported on first access (PEP 562), so importing a light
+# submodule such as benchmark.tasks.prospects does not load inspect_ai
+_EXPORTS = {
+    "HomebaseTask": ".homebase",
+    "homebase_personalization_optimized": ".homebase",
+}
+
+__all__ = ["HomebaseTask", "homebase_personalization_optimized"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
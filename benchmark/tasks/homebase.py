@@ -2,160 +2,396 @@
 Homebase Task - Evaluate AI models on B2B cold outreach personalization
 """
 
-from inspect_ai import Task, task
+from inspect_ai import Task, eval_async, task
 from inspect_ai.dataset import Sample
-from inspect_ai.solver import generate, system_message, use_tools
-import json
+from inspect_ai.solver import Generate, TaskState, generate, solver, system_message, use_tools
+from inspect_ai.util import concurrency
+from inspect_ai.log import transcript
+from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
 import os
 import sys
+import time
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Add repository root to path so `inspect eval benchmark/tasks/homebase.py` works
+# and the tools load as one package (they share a process-wide client pool)
+sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from tools.tavily_search import tavily_search
-from tools.tavily_extract import tavily_extract
-from judges.multi_judge_scorer import multi_judge_scorer_batch_verified
+from benchmark.tools.tavily_search import tavily_search
+from benchmark.tools.tavily_extract import tavily_extract
+from benchmark.tools.http_client import close_client
+from benchmark.tools.compaction import set_focus
+from benchmark.replay import cassette_model, close_cassette
+from benchmark.checkpoints import CHECKPOINT_KEY_METADATA, CheckpointStore, active_checkpoints
+from benchmark.config import get_setting
+from benchmark.telemetry import bind_evaluation, note_queue_wait, span
+from benchmark.judges.multi_judge_scorer import (
+    PROSPECT_NAMES_METADATA,
+    multi_judge_scorer_batch_verified,
+    prompt_cache_enabled,
+)
+from benchmark.tasks.prospects import (
+    DEFAULT_PROSPECTS_PATH,
+    batch_prospects,
+    expected_response,
+    load_prospects,
+    render_prompt,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Generation budget: enough for three prospects, growing with larger batches
+DEFAULT_MAX_TOKENS = 3000
+MAX_TOKENS_PER_PROSPECT = 1000
+
+# Samples (prospect batches) of one evaluation running at once
+DEFAULT_MAX_SAMPLES = 8
+
+
+SYSTEM_MESSAGE = "You are an expert SDR specializing in multi-location SMB outreach."
+
+# Company the candidate writes outreach for, as shown to the judges
+COMPANY_CONTEXT = {
+    "company": "Homebase",
+    "pain_focus": "Ops/Labor Pain Recognition"
+}
+
+
+def prompt_hash(prompt: str) -> str:
+    """Short hash of a task prompt, so results from different prompts are kept apart"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def model_provider(model: str) -> str:
+    """Return the upstream provider of a model id.
+    
+    "openrouter/anthropic/claude-opus-4.1" -> "anthropic", "openai/gpt-4o" -> "openai"
+    """
+    parts = model.split("/")
+    if parts[0] == "openrouter" and len(parts) > 2:
+        return parts[1]
+    return parts[0]
+
+
+def run_eval(tasks, **eval_args):
+    """Run inspect_ai evaluations, closing the shared Tavily client and cassette when they end"""
+    
+    async def run():
+        try:
+            return await eval_async(tasks, **eval_args)
+        finally:
+            await close_client()
+            close_cassette()
+    
+    return asyncio.run(run())
+
+
+def generation_usage(model: str, state: TaskState) -> List[Any]:
+    """Usage of every call the candidate model made for this sample (the whole tool loop)"""
+    try:
+        usages = [
+            event.output.usage for event in transcript().events
+            if getattr(event, "event", None) == "model" and str(event.model) == model
+            and event.output is not None and event.output.usage is not None
+        ]
+    except Exception:
+        usages = []
+    if not usages and state.output is not None and state.output.usage is not None:
+        usages = [state.output.usage]
+    return usages
+
+
+@solver
+def focus_on_prospects():
+    """Rank the sample's tool results (extracted pages) against its prospects"""
+    
+    async def solve(state: TaskState, generate_fn: Generate) -> TaskState:
+        set_focus(state.metadata.get("prospects"))
+        return state
+    
+    return solve
+
+
+@solver
+def provider_limited_generate(
+    provider: str,
+    limit: Optional[int] = None,
+    max_tokens: int = 3000,
+    temperature: Optional[float] = None,
+    task_name: str = "homebase",
+    epoch_offset: int = 0,
+    evaluation_prompt_hash: str = ""
+):
+    """Generate (with tool loop), holding one of ``limit`` slots for the provider.
+    
+    Slots are process-wide, so a sweep never runs more than ``limit``
+    evaluations against the same provider at once. When checkpointing is on,
+    the finished generation is checkpointed, and a resumed run restores it
+    instead of generating again. Providers are hinted to cache the prompt
+    prefix (tools, system brief and earlier tool-loop turns).
+    
+    ``epoch_offset`` numbers the epochs of a later round of a multi-epoch
+    run after those of earlier rounds, so each epoch has its own checkpoint.
+    ``evaluation_prompt_hash`` (the task's prompt hash) is stored with the
+    checkpoint so it is pruned once the evaluation is complete.
+    """
+    generate_solver = generate(
+        max_tokens=max_tokens, temperature=temperature, cache_prompt=prompt_cache_enabled()
+    )
+    
+    async def solve(state: TaskState, generate_fn: Generate) -> TaskState:
+        model = str(state.model)
+        bind_evaluation(model)
+        set_focus(state.metadata.get("prospects"))
+        
+        epoch = state.epoch + epoch_offset
+        with span("generation", model, sample_id=state.sample_id, epoch=epoch) as generation_span:
+            checkpoints = active_checkpoints()
+            if checkpoints is not None:
+                # Keyed on the whole prompt: system brief and prospect batch
+                checkpoint_key = CheckpointStore.generation_key(
+                    model, task_name, prompt_hash("\n".join(m.text for m in state.messages)),
+                    state.sample_id, epoch
+                )
+                state.metadata[CHECKPOINT_KEY_METADATA] = checkpoint_key
+                if checkpoints.resume and checkpoints.restore_generation(checkpoint_key, state):
+                    generation_span.cached = True
+                    return state
+            
+            if not limit:
+                state = await generate_solver(state, generate_fn)
+            else:
+                wait_start = time.monotonic()
+                async with concurrency(f"provider/{provider}", limit):
+                    note_queue_wait(time.monotonic() - wait_start)
+                    state = await generate_solver(state, generate_fn)
+            
+            for usage in generation_usage(model, state):
+                generation_span.add_usage(model, usage)
+            
+            if checkpoints is not None:
+                checkpoints.save_generation(checkpoint_key, model, task_name, state, evaluation_prompt_hash)
+            return state
+    
+    return solve
 
 
 class HomebaseTask:
-    """Homebase personalization task for evaluating AI models on B2B outreach"""
+    """Homebase personalization task for evaluating AI models on B2B outreach
+    
+    Prospects come from a JSONL or CSV dataset (default: evaluation.dataset
+    in config.yaml) and are split into samples of ``batch_size`` prospects
+    (default: evaluation.batch_size), which run in parallel.
+    
+    The task brief (homebase_prompt.md) is identical for every sample and
+    model, so it goes in the system message, where providers can cache it as
+    a prompt prefix. Each sample's input is only its prospect batch
+    (homebase_batch.md).
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        judge_cache: str = "use",
+        judge_mode: Optional[str] = None,
+        dataset: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_prospects: Optional[int] = None
+    ):
+        self.judge_cache = judge_cache
+        self.judge_mode = judge_mode
         self.prompt_path = Path(__file__).parent / "prompts" / "homebase_prompt.md"
+        self.batch_prompt_path = Path(__file__).parent / "prompts" / "homebase_batch.md"
         self.load_prompt()
+        
+        if dataset is None:
+            # Paths in config.yaml are relative to the repository root
+            configured = get_setting("evaluation.dataset")
+            dataset = REPO_ROOT / configured if configured else DEFAULT_PROSPECTS_PATH
+        self.dataset_path = Path(dataset)
+        self.batch_size = batch_size or get_setting("evaluation.batch_size", 3)
+        self.prospects = load_prospects(self.dataset_path, limit=max_prospects)
+        self.batches = batch_prospects(self.prospects, self.batch_size)
     
     def load_prompt(self):
-        """Load task prompt from file"""
+        """Load the task brief and the prospect batch template from file"""
         with open(self.prompt_path, 'r') as f:
             self.prompt = f.read()
+        with open(self.batch_prompt_path, 'r') as f:
+            self.batch_prompt = f.read()
     
-    def evaluate(self, model: str, verbose: bool = False):
-        """Run evaluation on specified model"""
-        
-        # Expected response format (for reference)
-        expected_response = json.dumps({
-            "prospects": [
-                {
-                    "name": "Matthew Christy",
-                    "first_line": "<personalized message>",
-                    "evidence_url": "https://<source>",
-                    "evidence_quote": "<optional snippet>"
-                },
-                {
-                    "name": "Isaac Reback",
-                    "first_line": "<personalized message>",
-                    "evidence_url": "https://<source>",
-                    "evidence_quote": "<optional snippet>"
-                },
-                {
-                    "name": "Tiffany Porter",
-                    "first_line": "<personalized message>",
-                    "evidence_url": "https://<source>",
-                    "evidence_quote": "<optional snippet>"
-                }
-            ]
-        })
-        
-        # Create dataset with single sample (all 3 prospects)
-        dataset = [
+    @property
+    def system_prompt(self) -> str:
+        """Stable prompt prefix: role and task brief"""
+        return f"{SYSTEM_MESSAGE}\n\n{self.prompt}"
+    
+    @property
+    def temperature(self) -> Optional[float]:
+        """Sampling temperature of the candidate model (None: the provider's default)"""
+        return get_setting("evaluation.temperature")
+    
+    @property
+    def max_tokens(self) -> int:
+        """Generation budget for one sample"""
+        base = get_setting("evaluation.max_tokens", DEFAULT_MAX_TOKENS)
+        return max(base, MAX_TOKENS_PER_PROSPECT * self.batch_size)
+    
+    def samples(self) -> List[Sample]:
+        """One sample per batch of prospects"""
+        return [
             Sample(
-                input=self.prompt,
-                target=expected_response
+                id=number,
+                input=render_prompt(self.batch_prompt, batch),
+                target=expected_response(batch),
+                metadata={
+                    PROSPECT_NAMES_METADATA: [prospect["name"] for prospect in batch],
+                    "prospects": batch
+                }
             )
+            for number, batch in enumerate(self.batches, start=1)
         ]
+    
+    @property
+    def prompt_hash(self) -> str:
+        """Short hash of the rendered prompts, so results from different prompts or datasets are kept apart"""
+        return prompt_hash("\n".join([self.system_prompt] + [sample.input for sample in self.samples()]))
+    
+    def build_task(
+        self,
+        model: Optional[str] = None,
+        provider_limit: Optional[int] = None,
+        epoch_offset: int = 0,
+        sample_ids: Optional[List[Any]] = None
+    ) -> Task:
+        """Build the Inspect task, optionally bound to a model and provider slot limit
         
-        # Create and run task
-        task = Task(
-            dataset=dataset,
+        ``sample_ids`` limits the task to those prospect batches (work queue jobs).
+        """
+        
+        provider = model_provider(model) if model else "default"
+        samples = self.samples()
+        if sample_ids is not None:
+            samples = [sample for sample in samples if sample.id in sample_ids]
+        
+        return Task(
+            dataset=samples,
             solver=[
-                system_message("You are an expert SDR specializing in multi-location SMB outreach."),
+                system_message(self.system_prompt),
                 use_tools([
                     tavily_search(), 
                     tavily_extract()
                 ]),
-                generate(max_tokens=3000)  # Sufficient for 3 responses
+                provider_limited_generate(
+                    provider, provider_limit, max_tokens=self.max_tokens, temperature=self.temperature,
+                    epoch_offset=epoch_offset,
+                    evaluation_prompt_hash=self.prompt_hash
+                )
             ],
             scorer=multi_judge_scorer_batch_verified(
-                company_context={
-                    "company": "Homebase",
-                    "pain_focus": "Ops/Labor Pain Recognition"
-                }
-            )
+                company_context=COMPANY_CONTEXT,
+                judge_cache=self.judge_cache,
+                judge_mode=self.judge_mode
+            ),
+            model=cassette_model(model)
         )
+    
+    def evaluate(self, model: str, verbose: bool = False):
+        """Run evaluation on specified model"""
+        
+        task = self.build_task()
         
         # Run evaluation (implementation depends on Inspect AI setup)
         # This would typically use inspect_ai.eval() or similar
         return self.run_task(task, model, verbose)
     
-    def run_task(self, task, model, verbose):
-        """Execute the task with given model"""
-        # This would integrate with Inspect AI's evaluation framework
-        # Placeholder for actual implementation
-        try:
-            from inspect_ai import eval
-            result = eval(
-                task,
+    def evaluate_many(
+        self,
+        models: List[str],
+        max_concurrency: int = 8,
+        provider_limits: Optional[Dict[str, int]] = None,
+        verbose: bool = False,
+        epochs: int = 1,
+        epoch_offset: int = 0,
+        sample_ids: Optional[Dict[str, List[Any]]] = None
+    ):
+        """Run evaluations for many models in one process
+        
+        At most ``max_concurrency`` evaluations run at once overall, and at
+        most ``provider_limits[provider]`` (or ``provider_limits["default"]``)
+        per upstream provider. Returns one eval log per model, in order.
+        With ``epochs`` > 1 every sample is run that many times; the epochs
+        share the ``evaluation.max_samples`` budget and run concurrently.
+        ``sample_ids`` maps a model to the only samples to run for it.
+        """
+        provider_limits = provider_limits or {}
+        sample_ids = sample_ids or {}
+        tasks = [
+            self.build_task(
                 model=model,
-                log_dir="logs/",
-                log_samples=verbose
+                provider_limit=provider_limits.get(
+                    model_provider(model), provider_limits.get("default")
+                ),
+                epoch_offset=epoch_offset,
+                sample_ids=sample_ids.get(model)
             )
-            return result
-        except ImportError:
-            print("Note: Full Inspect AI integration required for actual evaluation")
-            return None
+            for model in models
+        ]
+        
+        return run_eval(
+            tasks,
+            epochs=epochs,
+            max_tasks=max_concurrency,
+            max_samples=get_setting("evaluation.max_samples", DEFAULT_MAX_SAMPLES),
+            log_dir="logs/",
+            log_samples=True  # Samples feed outputs/evaluations.jsonl
+        )
+    
+    def run_task(self, task, model, verbose):
+        """Execute the task with given model"""
+        return run_eval(
+            task,
+            model=cassette_model(model),
+            max_samples=get_setting("evaluation.max_samples", DEFAULT_MAX_SAMPLES),
+            log_dir="logs/",
+            log_samples=True  # Samples feed outputs/evaluations.jsonl
+        )
 
 
 @task
-def homebase_personalization_optimized():
-    """Homebase personalization task - all prospects in one call
+def homebase_personalization_optimized(
+    judge_cache: str = "use",
+    judge_mode: Optional[str] = None,
+    dataset: Optional[str] = None,
+    batch_size: Optional[int] = None
+):
+    """Homebase personalization task - one sample per batch of prospects
     
     This is the original task function for direct use with Inspect AI CLI.
+    Pass ``-T judge_cache=refresh`` or ``bypass`` to control the judge cache,
+    ``-T judge_mode=escalate`` to call expensive judges only when contested,
+    and ``-T dataset=prospects.csv -T batch_size=5`` to evaluate other prospects.
     """
-    task_instance = HomebaseTask()
-    
-    dataset = [
-        Sample(
-            input=task_instance.prompt,
-            target=json.dumps({
-                "prospects": [
-                    {
-                        "name": "Matthew Christy",
-                        "first_line": "<personalized message>",
-                        "evidence_url": "https://<source>",
-                        "evidence_quote": "<optional snippet>"
-                    },
-                    {
-                        "name": "Isaac Reback",
-                        "first_line": "<personalized message>",
-                        "evidence_url": "https://<source>",
-                        "evidence_quote": "<optional snippet>"
-                    },
-                    {
-                        "name": "Tiffany Porter",
-                        "first_line": "<personalized message>",
-                        "evidence_url": "https://<source>",
-                        "evidence_quote": "<optional snippet>"
-                    }
-                ]
-            })
-        )
-    ]
+    task_instance = HomebaseTask(dataset=dataset, batch_size=batch_size)
     
     return Task(
-        dataset=dataset,
+        dataset=task_instance.samples(),
         solver=[
-            system_message("You are an expert SDR specializing in multi-location SMB outreach."),
+            system_message(task_instance.system_prompt),
             use_tools([
                 tavily_search(), 
                 tavily_extract()
             ]),
-            generate(max_tokens=3000)
+            focus_on_prospects(),
+            generate(
+                max_tokens=task_instance.max_tokens,
+                temperature=task_instance.temperature,
+                cache_prompt=prompt_cache_enabled()
+            )
         ],
         scorer=multi_judge_scorer_batch_verified(
-            company_context={
-                "company": "Homebase",
-                "pain_focus": "Ops/Labor Pain Recognition"
-            }
+            company_context=COMPANY_CONTEXT,
+            judge_cache=judge_cache,
+            judge_mode=judge_mode
         )
-    )
\ No newline at end of file
+    )
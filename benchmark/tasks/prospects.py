@@ -0,0 +1,133 @@
+"""
+Prospect Datasets - Load prospects from JSONL or CSV and batch them into samples
+
+Each prospect is a flat record:
+
+    name             (required)
+    title
+    company
+    linkedin
+    company_context
+
+JSONL files hold one object per line; CSV files need a header row with the
+same column names. Prospects are split into batches of
+``evaluation.batch_size`` (config.yaml), and each batch becomes one sample.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DATASETS_DIR = Path(__file__).parent / "datasets"
+DEFAULT_PROSPECTS_PATH = DATASETS_DIR / "homebase_prospects.jsonl"
+
+PROSPECT_FIELDS = ["name", "title", "company", "linkedin", "company_context"]
+
+# Template of one answer in the output example shown to the candidate
+FIRST_LINE_PLACEHOLDER = "Your personalized first line here (max 35 words)"
+EVIDENCE_URL_PLACEHOLDER = "https://source-where-you-found-the-information.com"
+EVIDENCE_QUOTE_PLACEHOLDER = "Optional: The specific quote or data point you referenced"
+
+
+def _normalize(raw: Dict[str, Any], where: str) -> Dict[str, str]:
+    """Keep the known fields (keys matched case-insensitively) and require a name"""
+    row = {str(key).strip().lower(): value for key, value in raw.items() if key is not None}
+    prospect = {field: str(row.get(field) or "").strip() for field in PROSPECT_FIELDS}
+    if not prospect["name"]:
+        raise ValueError(f"Prospect without a name at {where}")
+    return prospect
+
+
+def load_prospects(path: Optional[Path] = None, limit: Optional[int] = None) -> List[Dict[str, str]]:
+    """Load prospects from a .jsonl or .csv file (at most ``limit``)"""
+    
+    path = Path(path or DEFAULT_PROSPECTS_PATH)
+    prospects = []
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                prospects.append(_normalize(row, f"{path}:{line_number}"))
+                if limit is not None and len(prospects) >= limit:
+                    break
+        else:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                prospects.append(_normalize(json.loads(line), f"{path}:{line_number}"))
+                if limit is not None and len(prospects) >= limit:
+                    break
+    
+    if not prospects:
+        raise ValueError(f"No prospects found in {path}")
+    return prospects
+
+
+def batch_prospects(prospects: List[Dict[str, str]], batch_size: int) -> List[List[Dict[str, str]]]:
+    """Split prospects into consecutive batches of ``batch_size`` (the last may be shorter)"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    return [prospects[start:start + batch_size] for start in range(0, len(prospects), batch_size)]
+
+
+def render_prospects(batch: List[Dict[str, str]]) -> str:
+    """The prospect profiles section of a sample's input"""
+    
+    sections = []
+    for number, prospect in enumerate(batch, start=1):
+        lines = [f"### Prospect {number}: {prospect['name']}"]
+        for field, label in (
+            ("title", "Title"),
+            ("company", "Company"),
+            ("linkedin", "LinkedIn"),
+            ("company_context", "Company Context"),
+        ):
+            if prospect.get(field):
+                lines.append(f"- **{label}**: {prospect[field]}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def output_example(batch: List[Dict[str, str]]) -> str:
+    """The JSON answer skeleton the candidate is asked to fill in"""
+    return json.dumps({
+        "prospects": [
+            {
+                "name": prospect["name"],
+                "first_line": FIRST_LINE_PLACEHOLDER,
+                "evidence_url": EVIDENCE_URL_PLACEHOLDER,
+                "evidence_quote": EVIDENCE_QUOTE_PLACEHOLDER
+            }
+            for prospect in batch
+        ]
+    }, indent=2)
+
+
+def expected_response(batch: List[Dict[str, str]]) -> str:
+    """Sample target: the response shape for this batch (for reference)"""
+    return json.dumps({
+        "prospects": [
+            {
+                "name": prospect["name"],
+                "first_line": "<personalized message>",
+                "evidence_url": "https://<source>",
+                "evidence_quote": "<optional snippet>"
+            }
+            for prospect in batch
+        ]
+    })
+
+
+def render_prompt(template: str, batch: List[Dict[str, str]]) -> str:
+    """Fill the prospect batch template (homebase_batch.md) for one batch
+    
+    The template marks where the batch goes with {prospect_count},
+    {prospect_profiles} and {output_example}. Plain replacement is used rather
+    than str.format so the template's JSON braces need no escaping.
+    """
+    return (
+        template
+        .replace("{prospect_count}", str(len(batch)))
+        .replace("{prospect_profiles}", render_prospects(batch))
+        .replace("{output_example}", output_example(batch))
+    )
@@ -0,0 +1,327 @@
+"""
+Telemetry - Spans for every generation, tool call and judge call in a run
+
+Each unit of work (candidate generation, tavily_search, tavily_extract, judge
+call) is recorded as a span carrying wall time, queue wait (time spent waiting
+for concurrency slots, rate limiter tokens and retry backoff), input/output
+tokens (including prompt-cache reads and writes), computed cost and retry
+count. A generation's wall time includes the
+tool calls made inside its tool loop. Spans are tagged with the evaluation
+(candidate model) they belong to, aggregated per evaluation, and written as a
+JSON run summary plus a Prometheus text-format file:
+
+    results/telemetry/run_<timestamp>.json
+    results/telemetry/run_<timestamp>.prom
+
+Model prices come from ``telemetry.pricing`` in config.yaml (USD per million
+tokens, with optional ``cache_read``/``cache_write`` rates); Tavily cost from
+``telemetry.tavily_credit_usd`` per API credit.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import get_setting
+
+TELEMETRY_DIR = Path(__file__).parent.parent / "results" / "telemetry"
+
+SPAN_KINDS = ("generation", "tool", "judge")
+
+# USD per Tavily API credit (pay-as-you-go rate)
+DEFAULT_TAVILY_CREDIT_USD = 0.008
+
+# Providers whose input_tokens exclude cache reads (OpenAI-compatible APIs,
+# OpenRouter included, count cached tokens inside input_tokens)
+CACHE_READS_SEPARATE = ("anthropic/",)
+
+
+class Span:
+    """One timed unit of work"""
+    
+    def __init__(self, kind: str, name: str, evaluation: Optional[str] = None, **attributes):
+        self.kind = kind
+        self.name = name
+        self.evaluation = evaluation or "unassigned"
+        self.started_at = time.time()
+        self.wall_time = 0.0
+        self.queue_wait = 0.0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.cost = 0.0
+        self.retries = 0
+        self.cached = False
+        self.error: Optional[str] = None
+        self.attributes = attributes
+    
+    def add_usage(self, model: str, usage: Any) -> None:
+        """Add a ModelUsage's tokens and cost (provider-reported cost when given)"""
+        if usage is None:
+            return
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        cache_read = getattr(usage, "input_tokens_cache_read", 0) or 0
+        cache_write = getattr(usage, "input_tokens_cache_write", 0) or 0
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cache_read_tokens += cache_read
+        self.cache_write_tokens += cache_write
+        reported = getattr(usage, "total_cost", None)
+        if reported is None:
+            reported = model_cost(model, input_tokens, output_tokens, cache_read, cache_write)
+        self.cost += reported
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "evaluation": self.evaluation,
+            "started_at": self.started_at,
+            "wall_time": round(self.wall_time, 4),
+            "queue_wait": round(self.queue_wait, 4),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cost": round(self.cost, 6),
+            "retries": self.retries,
+            "cached": self.cached,
+            "error": self.error,
+            **self.attributes
+        }
+
+
+class Telemetry:
+    """Collects finished spans for the process and summarizes them"""
+    
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = []
+    
+    def summary(self) -> Dict[str, Any]:
+        """Totals per evaluation and per (kind, name), plus run-wide totals"""
+        with self._lock:
+            spans = list(self.spans)
+        
+        def aggregate(group: List[Span]) -> Dict[str, Any]:
+            return {
+                "spans": len(group),
+                "wall_time": round(sum(s.wall_time for s in group), 4),
+                "max_wall_time": round(max((s.wall_time for s in group), default=0.0), 4),
+                "queue_wait": round(sum(s.queue_wait for s in group), 4),
+                "input_tokens": sum(s.input_tokens for s in group),
+                "output_tokens": sum(s.output_tokens for s in group),
+                "cache_read_tokens": sum(s.cache_read_tokens for s in group),
+                "cache_write_tokens": sum(s.cache_write_tokens for s in group),
+                "cost": round(sum(s.cost for s in group), 6),
+                "retries": sum(s.retries for s in group),
+                "cached": sum(1 for s in group if s.cached),
+                "errors": sum(1 for s in group if s.error)
+            }
+        
+        by_evaluation: Dict[str, List[Span]] = {}
+        by_operation: Dict[str, List[Span]] = {}
+        for span in spans:
+            by_evaluation.setdefault(span.evaluation, []).append(span)
+            by_operation.setdefault(f"{span.kind}:{span.name}", []).append(span)
+        
+        evaluations = {}
+        for evaluation, group in by_evaluation.items():
+            evaluations[evaluation] = {
+                "total": aggregate(group),
+                **{kind: aggregate([s for s in group if s.kind == kind]) for kind in SPAN_KINDS}
+            }
+        
+        return {
+            "total": aggregate(spans),
+            "evaluations": evaluations,
+            "operations": {operation: aggregate(group) for operation, group in by_operation.items()}
+        }
+    
+    def evaluation_cost(self, evaluation: str, kind: Optional[str] = None) -> float:
+        """Cost recorded for one evaluation (optionally one span kind)"""
+        with self._lock:
+            return sum(
+                s.cost for s in self.spans
+                if s.evaluation == evaluation and (kind is None or s.kind == kind)
+            )
+    
+    def evaluation_costs(self, evaluation: str) -> Dict[str, float]:
+        """Cost of one evaluation per span kind, plus the total over all kinds"""
+        costs = {kind: self.evaluation_cost(evaluation, kind) for kind in SPAN_KINDS}
+        costs["total"] = sum(costs.values())
+        return costs
+    
+    def write_summary(self, directory: Path = TELEMETRY_DIR, run_id: Optional[str] = None) -> Dict[str, Path]:
+        """Write the run summary as JSON and as Prometheus text format"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        run_id = run_id or time.strftime("%Y%m%d_%H%M%S")
+        summary = self.summary()
+        with self._lock:
+            spans = [s.to_dict() for s in self.spans]
+        
+        json_path = directory / f"run_{run_id}.json"
+        with open(json_path, "w") as f:
+            json.dump({"run_id": run_id, **summary, "spans": spans}, f, indent=2)
+        
+        prom_path = directory / f"run_{run_id}.prom"
+        with open(prom_path, "w") as f:
+            f.write(render_prometheus(summary))
+        
+        return {"json": json_path, "prometheus": prom_path}
+
+
+# Prometheus metrics: (name, help, aggregate field)
+PROMETHEUS_METRICS = [
+    ("revenue_bench_spans_total", "Spans recorded", "spans"),
+    ("revenue_bench_wall_seconds_total", "Wall time spent in spans", "wall_time"),
+    ("revenue_bench_queue_wait_seconds_total", "Time spent waiting for slots, tokens and backoff", "queue_wait"),
+    ("revenue_bench_input_tokens_total", "Input tokens", "input_tokens"),
+    ("revenue_bench_output_tokens_total", "Output tokens", "output_tokens"),
+    ("revenue_bench_cache_read_tokens_total", "Input tokens served from the provider prompt cache", "cache_read_tokens"),
+    ("revenue_bench_cache_write_tokens_total", "Input tokens written to the provider prompt cache", "cache_write_tokens"),
+    ("revenue_bench_cost_usd_total", "Computed cost in USD", "cost"),
+    ("revenue_bench_retries_total", "Retries after throttling", "retries"),
+    ("revenue_bench_cache_hits_total", "Spans served from a cache", "cached"),
+    ("revenue_bench_errors_total", "Spans that failed", "errors"),
+]
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(summary: Dict[str, Any]) -> str:
+    """Render a summary in the Prometheus text exposition format"""
+    lines = []
+    for metric, help_text, field in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for operation, totals in sorted(summary["operations"].items()):
+            kind, name = operation.split(":", 1)
+            lines.append(f'{metric}{{kind="{kind}",name="{_label(name)}"}} {totals[field]}')
+    
+    metric = "revenue_bench_evaluation_cost_usd"
+    lines.append(f"# HELP {metric} Computed cost per evaluation by span kind")
+    lines.append(f"# TYPE {metric} gauge")
+    for evaluation, totals in sorted(summary["evaluations"].items()):
+        for kind in SPAN_KINDS:
+            lines.append(f'{metric}{{evaluation="{_label(evaluation)}",kind="{kind}"}} {totals[kind]["cost"]}')
+    
+    metric = "revenue_bench_evaluation_wall_seconds"
+    lines.append(f"# HELP {metric} Wall time per evaluation by span kind")
+    lines.append(f"# TYPE {metric} gauge")
+    for evaluation, totals in sorted(summary["evaluations"].items()):
+        for kind in SPAN_KINDS:
+            lines.append(f'{metric}{{evaluation="{_label(evaluation)}",kind="{kind}"}} {totals[kind]["wall_time"]}')
+    
+    return "\n".join(lines) + "\n"
+
+
+def evaluation_label(model: str) -> str:
+    """'cassette/openrouter/openai/gpt-5' -> 'openai/gpt-5' (also the pricing key)"""
+    for prefix in ("cassette/", "openrouter/"):
+        if model.startswith(prefix):
+            model = model[len(prefix):]
+    return model
+
+
+def model_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0
+) -> float:
+    """USD cost of a model call from telemetry.pricing (0 for unpriced models)
+    
+    Cache reads are billed at the ``cache_read`` rate and cache writes at the
+    ``cache_write`` rate, each falling back to the ``input`` rate.
+    """
+    pricing = get_setting("telemetry.pricing", {}) or {}
+    rates = pricing.get(evaluation_label(model))
+    if not rates:
+        return 0.0
+    
+    uncached = input_tokens
+    provider_model = model[len("cassette/"):] if model.startswith("cassette/") else model
+    if not provider_model.startswith(CACHE_READS_SEPARATE):
+        uncached = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+    input_rate = rates.get("input", 0)
+    return (
+        uncached * input_rate
+        + cache_read_tokens * rates.get("cache_read", input_rate)
+        + cache_write_tokens * rates.get("cache_write", input_rate)
+        + output_tokens * rates.get("output", 0)
+    ) / 1_000_000
+
+
+def tavily_cost(credits: float) -> float:
+    """USD cost of Tavily API credits"""
+    return credits * get_setting("telemetry.tavily_credit_usd", DEFAULT_TAVILY_CREDIT_USD)
+
+
+_telemetry = Telemetry()
+_current_span: ContextVar[Optional[Span]] = ContextVar("revenue_bench_span", default=None)
+_current_evaluation: ContextVar[Optional[str]] = ContextVar("revenue_bench_evaluation", default=None)
+
+
+def get_telemetry() -> Telemetry:
+    """The process-wide span recorder"""
+    return _telemetry
+
+
+def bind_evaluation(evaluation: str) -> None:
+    """Tag every span started later in this task (and its child tasks) with an evaluation"""
+    _current_evaluation.set(evaluation_label(evaluation))
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this task, if any"""
+    return _current_span.get()
+
+
+def note_queue_wait(seconds: float) -> None:
+    """Charge waiting time to the open span (no-op outside a span)"""
+    span = _current_span.get()
+    if span is not None:
+        span.queue_wait += seconds
+
+
+def note_retry() -> None:
+    """Count a retry against the open span (no-op outside a span)"""
+    span = _current_span.get()
+    if span is not None:
+        span.retries += 1
+
+
+@contextmanager
+def span(kind: str, name: str, **attributes) -> Iterator[Span]:
+    """Time a unit of work and record it when it finishes (or fails)"""
+    current = Span(kind, name, _current_evaluation.get(), **attributes)
+    token = _current_span.set(current)
+    start = time.monotonic()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = current.error or type(e).__name__
+        raise
+    finally:
+        current.wall_time = time.monotonic() - start
+        _current_span.reset(token)
+        _telemetry.record(current)
@@ -0,0 +1,198 @@
+"""
+Tool Result Compaction - Keep extracted pages within a token budget
+
+Extracted pages can run to tens of thousands of tokens, all of which the
+candidate pays for again on every later turn of its tool loop. Pages over
+``api.tavily.extract_max_tokens`` are split into passages, the passages are
+ranked against the prospect the page is most about (BM25 over the sample's
+prospect profiles), and the best passages are kept, in page order, up to the
+budget.
+
+The sample's prospects are set once per sample with set_focus(); tool calls
+made by that sample's generation see them through a context variable.
+"""
+
+import math
+import re
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import get_setting
+
+# Roughly four characters per token for English web text
+CHARS_PER_TOKEN = 4
+
+DEFAULT_EXTRACT_MAX_TOKENS = 2000
+DEFAULT_PASSAGE_CHARS = 600
+
+# Marks where passages were dropped between two kept ones
+GAP_MARKER = "\n[...]\n"
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "its", "of", "on", "or", "that", "the", "their", "this",
+    "to", "was", "were", "with", "you", "your",
+}
+
+# Profiles of the prospects in the current sample, one focus string each
+_focus: ContextVar[Optional[List[str]]] = ContextVar("revenue_bench_tool_focus", default=None)
+
+
+def set_focus(prospects: Optional[List[Dict[str, Any]]]) -> None:
+    """Rank later tool results in this task against these prospects"""
+    if not prospects:
+        _focus.set(None)
+        return
+    _focus.set([
+        " ".join(str(prospect.get(field) or "") for field in ("name", "company", "title", "company_context"))
+        for prospect in prospects
+    ])
+
+
+def current_focus() -> List[str]:
+    """Focus strings of the current sample's prospects (empty outside a sample)"""
+    return _focus.get() or []
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer dependency)"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word terms without stopwords"""
+    return [term for term in _WORD.findall(text.lower()) if term not in STOPWORDS]
+
+
+def split_passages(text: str, passage_chars: int = DEFAULT_PASSAGE_CHARS) -> List[str]:
+    """Split text into passages of about ``passage_chars``, on line and then sentence boundaries"""
+    
+    pieces = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) <= passage_chars:
+            pieces.append(line)
+        else:
+            pieces.extend(sentence for sentence in _SENTENCE_END.split(line) if sentence)
+    
+    passages = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) + 1 > passage_chars:
+            passages.append(current)
+            current = piece
+        else:
+            current = f"{current}\n{piece}" if current else piece
+    if current:
+        passages.append(current)
+    return passages
+
+
+def bm25_scores(passages: List[str], query: str) -> List[float]:
+    """BM25 score of each passage for the query"""
+    
+    terms = set(tokenize(query))
+    documents = [Counter(tokenize(passage)) for passage in passages]
+    if not terms or not documents:
+        return [0.0] * len(passages)
+    
+    lengths = [sum(document.values()) for document in documents]
+    average_length = (sum(lengths) / len(lengths)) or 1.0
+    count = len(documents)
+    idf = {}
+    for term in terms:
+        frequency = sum(1 for document in documents if term in document)
+        idf[term] = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+    
+    scores = []
+    for document, length in zip(documents, lengths):
+        score = 0.0
+        for term in terms:
+            tf = document.get(term, 0)
+            if tf:
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                score += idf[term] * tf * (BM25_K1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+def compact_text(
+    text: str,
+    focus: List[str],
+    max_tokens: int = DEFAULT_EXTRACT_MAX_TOKENS,
+    passage_chars: int = DEFAULT_PASSAGE_CHARS
+) -> Tuple[str, bool]:
+    """Cut text to ``max_tokens``, keeping the passages most relevant to the focus.
+    
+    The page is matched to whichever focus string (prospect) it scores highest
+    for, and passages are kept best-first under the budget, then put back in
+    page order. Without a focus the page is cut at the budget from the top.
+    Returns the text and whether anything was dropped.
+    """
+    
+    if estimate_tokens(text) <= max_tokens:
+        return text, False
+    
+    passages = split_passages(text, passage_chars)
+    scores = [0.0] * len(passages)
+    for query in focus:
+        query_scores = bm25_scores(passages, query)
+        if sum(query_scores) > sum(scores):
+            scores = query_scores
+    
+    # Best passages first; earlier passages win ties (and everything without a focus)
+    order = sorted(range(len(passages)), key=lambda i: (-scores[i], i))
+    kept = []
+    budget = max_tokens
+    for i in order:
+        cost = estimate_tokens(passages[i]) + estimate_tokens(GAP_MARKER)
+        if cost <= budget:
+            kept.append(i)
+            budget -= cost
+    
+    if not kept:
+        return text[:max_tokens * CHARS_PER_TOKEN], True
+    
+    kept.sort()
+    parts = [GAP_MARKER.lstrip("\n")] if kept[0] != 0 else []
+    parts.append(passages[kept[0]])
+    for previous, i in zip(kept, kept[1:]):
+        parts.append(GAP_MARKER if i != previous + 1 else "\n")
+        parts.append(passages[i])
+    if kept[-1] != len(passages) - 1:
+        parts.append(GAP_MARKER)
+    return "".join(parts), True
+
+
+def compact_extract_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the extract token budget (api.tavily.extract_max_tokens) to a tool result"""
+    
+    content = result.get("content")
+    max_tokens = get_setting("api.tavily.extract_max_tokens", DEFAULT_EXTRACT_MAX_TOKENS)
+    if not result.get("success") or not isinstance(content, str) or not max_tokens:
+        return result
+    
+    compacted, truncated = compact_text(
+        content,
+        current_focus(),
+        max_tokens=max_tokens,
+        passage_chars=get_setting("api.tavily.extract_passage_chars", DEFAULT_PASSAGE_CHARS)
+    )
+    if not truncated:
+        return result
+    return {
+        **result,
+        "content": compacted,
+        "truncated": True,
+        "original_tokens": estimate_tokens(content)
+    }
@@ -0,0 +1,188 @@
+"""
+Extract Batcher - Coalesce concurrent tavily_extract calls into multi-URL requests
+
+The Tavily Extract API accepts a list of URLs. Calls arriving within a short
+window are merged into one request, the per-URL results are split back to
+each caller, and identical URLs already waiting or in flight share a single
+request (single-flight).
+"""
+
+import asyncio
+import os
+import httpx
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit, urlunsplit
+
+from .http_client import tavily_post, tavily_settings
+
+
+def _url_key(url: str) -> str:
+    """Loose key for matching response URLs back to requested URLs
+    
+    Only the scheme and host are case-insensitive; paths and queries keep their case.
+    """
+    url = url.strip()
+    scheme_less = "://" not in url
+    parts = urlsplit("//" + url if scheme_less else url)
+    key = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+    return (key[2:] if scheme_less else key).rstrip("/")
+
+
+def split_extract_response(urls: List[str], data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map a multi-URL Extract response back to one tool result per requested URL"""
+    
+    results_by_key = {}
+    for result in data.get("results", []):
+        results_by_key[_url_key(result.get("url", ""))] = result
+    
+    # failed_results holds {"url", "error"} objects (older responses: bare URLs)
+    failed_keys = set()
+    for failed in data.get("failed_results", []) or []:
+        failed_url = failed.get("url", "") if isinstance(failed, dict) else str(failed)
+        failed_keys.add(_url_key(failed_url))
+    
+    # A lone result for a lone URL belongs to it even if Tavily rewrote the URL
+    if len(urls) == 1 and len(data.get("results", [])) == 1 and not failed_keys:
+        results_by_key[_url_key(urls[0])] = data["results"][0]
+    
+    outcomes = {}
+    for url in urls:
+        key = _url_key(url)
+        if key in failed_keys:
+            outcomes[url] = {
+                "url": url,
+                "success": False,
+                "error": "Failed to extract content from URL"
+            }
+        elif key in results_by_key:
+            content = results_by_key[key].get("raw_content", "")
+            outcomes[url] = {
+                "url": url,
+                "success": True,
+                "content": content,
+                "metadata": {
+                    "response_time": data.get("response_time", 0)
+                }
+            }
+        else:
+            outcomes[url] = {
+                "url": url,
+                "success": False,
+                "error": "No content extracted"
+            }
+    return outcomes
+
+
+async def request_extract(urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Send one Extract request for several URLs; errors apply to every URL"""
+    
+    payload = {
+        "api_key": os.getenv("TAVILY_API_KEY"),
+        "urls": urls,
+        "include_images": False,
+        "include_favicon": False,
+        "extract_depth": "basic",  # Use basic for cost savings
+        "format": "text"  # Plain text for easier claim verification
+    }
+    
+    try:
+        response = await tavily_post("extract", payload)
+        
+        if response.status_code == 200:
+            return split_extract_response(urls, response.json())
+        elif response.status_code == 401:
+            error = {"error": "Invalid Tavily API key"}
+        elif response.status_code == 429:
+            error = {"error": "Rate limit exceeded"}
+        elif response.status_code == 432:
+            error = {"error": "Plan limit exceeded"}
+        else:
+            error = {"error": f"Extract failed: {response.status_code}"}
+            
+    except httpx.TimeoutException:
+        error = {"error": "Extract request timed out"}
+    except Exception as e:
+        error = {"error": f"Extract error: {str(e)}"}
+    
+    return {url: dict(error) for url in urls}
+
+
+class ExtractBatcher:
+    """Merge extract calls made within ``window_ms`` into one multi-URL request"""
+    
+    def __init__(self, window_ms: float = 20.0, max_batch_size: int = 20):
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.requests_sent = 0
+        self.urls_requested = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def extract(self, url: str) -> Dict[str, Any]:
+        """Extract one URL, sharing the request with concurrent callers"""
+        
+        future = self._pending.get(url) or self._in_flight.get(url)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[url] = future
+            self.urls_requested += 1
+            
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        # Shield so one cancelled caller does not cancel the shared request
+        result = await asyncio.shield(future)
+        return dict(result)
+    
+    def _flush(self) -> None:
+        """Send everything waiting as one request"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        
+        self._in_flight.update(batch)
+        self.requests_sent += 1
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: Dict[str, asyncio.Future]) -> None:
+        urls = list(batch)
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        try:
+            outcomes = await request_extract(urls)
+        finally:
+            for url in urls:
+                self._in_flight.pop(url, None)
+            for url, future in batch.items():
+                if not future.done():
+                    future.set_result(outcomes.get(url, {"error": "Extract failed"}))
+
+
+# One batcher per event loop, like the shared client
+_batcher: Optional[ExtractBatcher] = None
+_batcher_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_extract_batcher() -> ExtractBatcher:
+    """Return the process-wide extract batcher"""
+    global _batcher, _batcher_loop
+    
+    loop = asyncio.get_running_loop()
+    if _batcher is None or _batcher_loop is not loop:
+        settings = tavily_settings()
+        _batcher = ExtractBatcher(
+            window_ms=settings.get("extract_batch_window_ms", 20),
+            max_batch_size=settings.get("extract_max_batch_size", 20)
+        )
+        _batcher_loop = loop
+    return _batcher
@@ -0,0 +1,99 @@
+"""
+Shared HTTP Client - Pooled, keep-alive connections for the Tavily tools
+"""
+
+import asyncio
+import httpx
+from typing import Any, Dict, Optional
+
+from ..config import get_setting
+from ..ratelimit import call_with_backoff, get_rate_limiter, response_throttle
+
+
+# One client per process (re-created if the event loop changes between evals)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+DEFAULT_TAVILY_BASE_URL = "https://api.tavily.com"
+
+
+def tavily_settings() -> Dict[str, Any]:
+    """Return the api.tavily section of config.yaml"""
+    return get_setting("api.tavily", {}) or {}
+
+
+def tavily_url(endpoint: str) -> str:
+    """Full URL of a Tavily endpoint under api.tavily.base_url (e.g. a local mock server)"""
+    base_url = tavily_settings().get("base_url") or DEFAULT_TAVILY_BASE_URL
+    return f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create a pooled client from the api.tavily settings"""
+    settings = tavily_settings()
+    
+    http2 = bool(settings.get("http2", False))
+    if http2 and not _http2_available():
+        print("Warning: api.tavily.http2 is enabled but h2 is not installed. Using HTTP/1.1.")
+        http2 = False
+    
+    limits = httpx.Limits(
+        max_connections=settings.get("max_connections", 20),
+        max_keepalive_connections=settings.get("max_keepalive_connections", 10),
+        keepalive_expiry=settings.get("keepalive_expiry", 30.0)
+    )
+    transport = httpx.AsyncHTTPTransport(
+        retries=settings.get("max_retries", 2),  # Retries connection failures only
+        http2=http2,
+        limits=limits
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(settings.get("timeout", 30.0)),
+        headers={"Content-Type": "application/json"}
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use"""
+    global _client, _client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # A client from a finished event loop cannot be reused or closed
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def tavily_post(endpoint: str, payload: Dict[str, Any]) -> httpx.Response:
+    """POST to a Tavily endpoint through the shared client and Tavily rate limiter
+    
+    429 responses are retried with backoff (honoring Retry-After) instead of
+    being returned to the model; the final response is returned as-is.
+    """
+    client = get_client()
+    url = tavily_url(endpoint)
+    return await call_with_backoff(
+        get_rate_limiter("tavily"),
+        lambda: client.post(url, json=payload),
+        response_throttle
+    )
+
+
+async def close_client() -> None:
+    """Close the shared client; call once when the evaluation ends"""
+    global _client, _client_loop
+    
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
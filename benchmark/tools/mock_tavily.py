@@ -0,0 +1,315 @@
+"""
+Mock Tavily Server - Scripted local stand-in for the Tavily Search and Extract APIs
+
+Serves ``POST /search`` and ``POST /extract`` over HTTP/1.1 (keep-alive) with
+configurable latency, failure rates and payload sizes, so the tool layer can
+be load tested without spending Tavily credits. Point the tools at it with
+``api.tavily.base_url`` in config.yaml:
+
+    python -m benchmark.tools.mock_tavily --port 8765 --latency-ms 200 --rate-limit-rate 0.05
+    # config.yaml: api.tavily.base_url: "http://127.0.0.1:8765"
+
+Each request is answered, in this order of checks, with 401 (no api_key),
+429 (``rate_limit_rate``, with Retry-After), 432 (``plan_limit_rate``), 500
+(``error_rate``) or 200. Extract URLs fail individually (listed under
+``failed_results``) with ``extract_failure_rate``. Only the standard library
+is used.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+    432: "Plan Limit Exceeded",
+    500: "Internal Server Error",
+}
+
+FILLER_SENTENCE = (
+    "The company reported steady growth across its locations this year, "
+    "hiring hourly staff in several new markets while managing schedules and payroll. "
+)
+
+
+class MockTavilyServer:
+    """Local HTTP server answering like Tavily, with scripted latency and failures"""
+    
+    def __init__(
+        self,
+        latency_ms: float = 100.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        plan_limit_rate: float = 0.0,
+        extract_failure_rate: float = 0.0,
+        retry_after: float = 1.0,
+        content_chars: int = 4000,
+        snippet_chars: int = 500,
+        max_results: int = 5,
+        seed: Optional[int] = None
+    ):
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.plan_limit_rate = plan_limit_rate
+        self.extract_failure_rate = extract_failure_rate
+        self.retry_after = retry_after
+        self.content_chars = content_chars
+        self.snippet_chars = snippet_chars
+        self.max_results = max_results
+        self.random = random.Random(seed)
+        
+        self.host: Optional[str] = None
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: set = set()
+        self.reset_stats()
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def reset_stats(self) -> None:
+        """Zero the request and connection counters"""
+        self.connections_opened = 0
+        self.open_connections = 0
+        self.peak_connections = 0
+        self.requests = 0
+        self.urls_extracted = 0
+        self.bytes_sent = 0
+        self.status_counts: Dict[int, int] = {}
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections_opened": self.connections_opened,
+            "peak_connections": self.peak_connections,
+            "requests": self.requests,
+            "urls_extracted": self.urls_extracted,
+            "bytes_sent": self.bytes_sent,
+            "status_counts": dict(sorted(self.status_counts.items()))
+        }
+    
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening (port 0 picks a free port) and return the base URL"""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.base_url
+    
+    async def close(self) -> None:
+        """Stop listening and drop open keep-alive connections"""
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+    
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+    
+    # --- HTTP handling ---
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections_opened += 1
+        self.open_connections += 1
+        self.peak_connections = max(self.peak_connections, self.open_connections)
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload, extra_headers = await self.respond(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, payload, extra_headers, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.open_connections -= 1
+            self._writers.discard(writer)
+            writer.close()
+    
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """Read one request (request line, headers, Content-Length body); None at EOF"""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        
+        length = int(headers.get("content-length", 0) or 0)
+        body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body
+    
+    def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Dict[str, Any],
+        extra_headers: Dict[str, str],
+        keep_alive: bool
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **extra_headers
+        }
+        head = f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        
+        self.requests += 1
+        self.bytes_sent += len(body)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+    
+    # --- Scripted behaviour ---
+    
+    async def respond(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Status, JSON payload and extra headers for one request"""
+        
+        started = time.monotonic()
+        delay = self.latency + (self.random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        endpoint = path.split("?", 1)[0].strip("/")
+        if method != "POST" or endpoint not in ("search", "extract"):
+            return 404, {"detail": {"error": f"Not found: {method} {path}"}}, {}
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"detail": {"error": "Invalid JSON body"}}, {}
+        if not request.get("api_key"):
+            return 401, {"detail": {"error": "Unauthorized: missing or invalid API key"}}, {}
+        
+        roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return 429, {"detail": {"error": "Rate limit exceeded"}}, {"Retry-After": f"{self.retry_after:g}"}
+        roll -= self.rate_limit_rate
+        if roll < self.plan_limit_rate:
+            return 432, {"detail": {"error": "Plan usage limit exceeded"}}, {}
+        roll -= self.plan_limit_rate
+        if roll < self.error_rate:
+            return 500, {"detail": {"error": "Internal server error"}}, {}
+        
+        response_time = round(time.monotonic() - started, 3)
+        if endpoint == "search":
+            return 200, self.search_payload(request, response_time), {}
+        return 200, self.extract_payload(request, response_time), {}
+    
+    def page_text(self, url: str, chars: int) -> str:
+        """Deterministic filler page of ``chars`` characters for a URL"""
+        text = f"{url}\n" + FILLER_SENTENCE * (chars // len(FILLER_SENTENCE) + 1)
+        return text[:chars]
+    
+    def search_payload(self, request: Dict[str, Any], response_time: float) -> Dict[str, Any]:
+        query = str(request.get("query", ""))
+        slug = "-".join(query.lower().split())[:60] or "result"
+        count = min(int(request.get("max_results", self.max_results) or self.max_results), self.max_results)
+        
+        results = []
+        for rank in range(count):
+            url = f"https://example.com/{slug}/{rank}"
+            result = {
+                "url": url,
+                "title": f"{query} - result {rank + 1}",
+                "content": self.page_text(url, self.snippet_chars),
+                "score": round(1.0 - rank * 0.1, 2)
+            }
+            if request.get("include_raw_content"):
+                result["raw_content"] = self.page_text(url, self.content_chars)
+            results.append(result)
+        
+        return {
+            "query": query,
+            "answer": f"Mock answer for: {query}" if request.get("include_answer") else None,
+            "results": results,
+            "response_time": response_time
+        }
+    
+    def extract_payload(self, request: Dict[str, Any], response_time: float) -> Dict[str, Any]:
+        urls = request.get("urls") or []
+        if isinstance(urls, str):
+            urls = [urls]
+        
+        results: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        for url in urls:
+            if self.random.random() < self.extract_failure_rate:
+                failed.append({"url": url, "error": "Failed to fetch url"})
+            else:
+                results.append({"url": url, "raw_content": self.page_text(url, self.content_chars)})
+        self.urls_extracted += len(urls)
+        
+        return {"results": results, "failed_results": failed, "response_time": response_time}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock of the Tavily Search and Extract APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Base response latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--plan-limit-rate", type=float, default=0.0, help="Share of requests answered with 432")
+    parser.add_argument("--extract-failure-rate", type=float, default=0.0,
+                        help="Share of extract URLs returned under failed_results")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--content-chars", type=int, default=4000, help="Size of each extracted page")
+    parser.add_argument("--snippet-chars", type=int, default=500, help="Size of each search result snippet")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible failures")
+    args = parser.parse_args()
+    
+    server = MockTavilyServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        plan_limit_rate=args.plan_limit_rate,
+        extract_failure_rate=args.extract_failure_rate,
+        retry_after=args.retry_after,
+        content_chars=args.content_chars,
+        snippet_chars=args.snippet_chars,
+        seed=args.seed
+    )
+    
+    async def run():
+        base_url = await server.start(args.host, args.port)
+        print(f"🧪 Mock Tavily listening on {base_url} (set api.tavily.base_url to use it)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+    
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(server.stats())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,13 @@ Tavily Extract Tool - Extract and verify content from URLs
 
 from inspect_ai.tool import tool
 import os
-import httpx
 from typing import Dict, Any
 
+from ..replay import active_cassette
+from ..telemetry import span, tavily_cost
+from .compaction import compact_extract_result
+from .extract_batcher import get_extract_batcher
+
 
 @tool
 def tavily_extract():
@@ -15,7 +19,8 @@ def tavily_extract():
     
     This tool allows models to verify claims by extracting actual content
     from web pages. It's essential for fact-checking and ensuring accurate
-    personalization in outreach messages.
+    personalization in outreach messages. Long pages are cut to the passages
+    most relevant to the sample's prospects (see compaction.py).
     
     Args:
         url: URL to extract content from
@@ -32,81 +37,34 @@ def tavily_extract():
             url: The URL to extract content from
         """
         
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            return {"error": "TAVILY_API_KEY not found in environment"}
-        
-        # Validate URL
-        if not url or not url.startswith(('http://', 'https://')):
-            return {"error": f"Invalid URL: {url}"}
-        
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "api_key": api_key,
-            "urls": [url],  # Extract API accepts multiple URLs
-            "include_images": False,
-            "include_favicon": False,
-            "extract_depth": "basic",  # Use basic for cost savings
-            "format": "text"  # Plain text for easier claim verification
-        }
-        
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.tavily.com/extract",
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check if extraction was successful
-                    if "results" in data and len(data["results"]) > 0:
-                        result = data["results"][0]
-                        
-                        # Check for failed extractions
-                        if "failed_results" in data and url in data.get("failed_results", []):
-                            return {
-                                "url": url,
-                                "success": False,
-                                "error": "Failed to extract content from URL"
-                            }
-                        
-                        # Return extracted content
-                        content = result.get("raw_content", "")
-                        return {
-                            "url": url,
-                            "success": True,
-                            "content": content,
-                            "text": content,
-                            "metadata": {
-                                "response_time": data.get("response_time", 0)
-                            }
-                        }
-                    else:
-                        return {
-                            "url": url,
-                            "success": False,
-                            "error": "No content extracted"
-                        }
-                        
-                elif response.status_code == 401:
-                    return {"error": "Invalid Tavily API key"}
-                elif response.status_code == 429:
-                    return {"error": "Rate limit exceeded"}
-                elif response.status_code == 432:
-                    return {"error": "Plan limit exceeded"}
-                else:
-                    return {"error": f"Extract failed: {response.status_code}"}
-                    
-        except httpx.TimeoutException:
-            return {"error": "Extract request timed out"}
-        except Exception as e:
-            return {"error": f"Extract error: {str(e)}"}
+        with span("tool", "tavily_extract") as extract_span:
+            # Record or replay the result when a cassette is active
+            cassette = active_cassette()
+            if cassette is not None and cassette.replaying:
+                extract_span.cached = True
+                return cassette.replay("tavily_extract", {"url": url})
+            
+            api_key = os.getenv("TAVILY_API_KEY")
+            if not api_key:
+                return {"error": "TAVILY_API_KEY not found in environment"}
+            
+            # Validate URL
+            if not url or not url.startswith(('http://', 'https://')):
+                return {"error": f"Invalid URL: {url}"}
+            
+            # Concurrent extracts are merged into multi-URL requests, and the
+            # same URL already in flight is fetched only once
+            result = await get_extract_batcher().extract(url)
+            if result.get("success"):
+                # Basic extraction costs 1 API credit per 5 successful URLs
+                extract_span.cost = tavily_cost(0.2)
+                result = compact_extract_result(result)
+                if result.get("truncated"):
+                    extract_span.attributes["original_tokens"] = result["original_tokens"]
+            else:
+                extract_span.error = result.get("error", "extraction failed")
+            if cassette is not None:
+                cassette.record("tavily_extract", {"url": url}, result)
+            return result
     
-    return execute
\ No newline at end of file
+    return execute
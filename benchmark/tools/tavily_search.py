@@ -7,6 +7,100 @@ import os
 import httpx
 from typing import Dict, Any, List, Optional
 
+from ..cache import DiskCache, open_cache
+from ..replay import active_cassette
+from ..telemetry import current_span, span, tavily_cost
+from .http_client import tavily_post
+
+
+def search_cache_key(
+    query: str,
+    include_domains: Optional[List[str]],
+    search_depth: str
+) -> str:
+    """Cache key for a search: case- and whitespace-insensitive query, unordered domains"""
+    normalized_query = " ".join(query.lower().split())
+    normalized_domains = sorted({d.strip().lower() for d in include_domains or [] if d.strip()})
+    return DiskCache.make_key("tavily_search", normalized_query, normalized_domains, search_depth)
+
+
+async def search(
+    query: str,
+    include_domains: Optional[List[str]] = None,
+    search_depth: str = "basic"
+) -> Dict[str, Any]:
+    """Call the Tavily Search API (through the persistent search cache)"""
+    
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key:
+        return {"error": "TAVILY_API_KEY not found in environment"}
+    
+    # Validate search_depth parameter
+    if search_depth not in ["basic", "advanced"]:
+        search_depth = "basic"
+    
+    payload = {
+        "api_key": api_key,  # API key goes in payload
+        "query": query,
+        "search_depth": search_depth,
+        "max_results": 5,
+        "include_answer": True,
+        "include_raw_content": False,  # Only the snippet is returned to the model
+        "topic": "general"
+    }
+    
+    if include_domains:
+        payload["include_domains"] = include_domains
+    
+    # Serve repeated searches from the persistent cache
+    cache = open_cache("tavily_search")
+    cache_key = search_cache_key(query, include_domains, search_depth)
+    if cache is not None:
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            search_span = current_span()
+            if search_span is not None:
+                search_span.cached = True
+            return {**cached, "query": query}
+    
+    try:
+        response = await tavily_post("search", payload)
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            # Format results for model consumption
+            results = []
+            for result in data.get("results", []):
+                results.append({
+                    "url": result.get("url", ""),
+                    "title": result.get("title", ""),
+                    "content": result.get("content", "")[:500],  # Truncate for readability
+                    "score": result.get("score", 0)
+                })
+            
+            search_result = {
+                "answer": data.get("answer", ""),
+                "results": results,
+                "query": query
+            }
+            if cache is not None:
+                await cache.aset(cache_key, search_result)
+            return search_result
+        elif response.status_code == 401:
+            return {"error": "Invalid API key - check TAVILY_API_KEY"}
+        elif response.status_code == 429:
+            return {"error": "Rate limit exceeded"}
+        elif response.status_code == 432:
+            return {"error": "Plan limit exceeded"}
+        else:
+            return {"error": f"Search failed: {response.status_code}"}
+            
+    except httpx.TimeoutException:
+        return {"error": "Search request timed out"}
+    except Exception as e:
+        return {"error": f"Search error: {str(e)}"}
+
 
 @tool
 def tavily_search():
@@ -38,70 +132,22 @@ def tavily_search():
             search_depth: "basic" (1 credit) or "advanced" (2 credits)
         """
         
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            return {"error": "TAVILY_API_KEY not found in environment"}
-        
-        # Validate search_depth parameter
-        if search_depth not in ["basic", "advanced"]:
-            search_depth = "basic"
-        
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "api_key": api_key,  # API key goes in payload
-            "query": query,
-            "search_depth": search_depth,
-            "max_results": 5,
-            "include_answer": True,
-            "include_raw_content": True,
-            "topic": "general"
-        }
-        
-        if include_domains:
-            payload["include_domains"] = include_domains
-        
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Format results for model consumption
-                    results = []
-                    for result in data.get("results", []):
-                        results.append({
-                            "url": result.get("url", ""),
-                            "title": result.get("title", ""),
-                            "content": result.get("content", "")[:500],  # Truncate for readability
-                            "score": result.get("score", 0)
-                        })
-                    
-                    return {
-                        "answer": data.get("answer", ""),
-                        "results": results,
-                        "query": query
-                    }
-                elif response.status_code == 401:
-                    return {"error": "Invalid API key - check TAVILY_API_KEY"}
-                elif response.status_code == 429:
-                    return {"error": "Rate limit exceeded"}
-                elif response.status_code == 432:
-                    return {"error": "Plan limit exceeded"}
-                else:
-                    return {"error": f"Search failed: {response.status_code}"}
-                    
-        except httpx.TimeoutException:
-            return {"error": "Search request timed out"}
-        except Exception as e:
-            return {"error": f"Search error: {str(e)}"}
+        with span("tool", "tavily_search", search_depth=search_depth) as search_span:
+            # Record or replay the result when a cassette is active
+            request = {"query": query, "include_domains": include_domains, "search_depth": search_depth}
+            cassette = active_cassette()
+            if cassette is not None and cassette.replaying:
+                search_span.cached = True
+                return cassette.replay("tavily_search", request)
+            
+            result = await search(query, include_domains, search_depth)
+            if "error" in result:
+                search_span.error = result["error"]
+            elif not search_span.cached:
+                # Basic searches cost 1 API credit, advanced searches 2
+                search_span.cost = tavily_cost(2 if search_depth == "advanced" else 1)
+            if cassette is not None:
+                cassette.record("tavily_search", request, result)
+            return result
     
     return execute
\ No newline at end of file
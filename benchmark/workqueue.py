@@ -0,0 +1,380 @@
+"""
+Work Queue - Durable SQLite queue of (model, task, sample) jobs shared by worker processes
+
+``run_evaluation.py --enqueue`` splits a sweep into one job per model and
+prospect batch (sample). Any number of ``run_evaluation.py --worker``
+processes, on one host or on several hosts sharing the repository over a
+network filesystem, claim jobs from the queue, run them and write to the
+common results store. Each worker has its own event loop, rate limiters and
+API keys, so throughput grows with the number of workers (and keys).
+
+Jobs are leased: a worker claims a job for ``queue.lease_seconds`` and a
+heartbeat thread extends the lease while it runs. When a worker dies its
+heartbeats stop, the lease runs out and the next worker asking for work
+claims the job again (finished generations are restored from the shared
+checkpoint store). A failed job is retried after ``queue.retry_delay_seconds``
+(doubling per attempt) until it has been attempted ``queue.max_attempts``
+times.
+
+Once every job of an evaluation is done or has failed for good, exactly one
+worker claims the evaluation and records it: its sample results are combined
+into one outputs record and one results store entry.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import get_setting, sqlite_journal_mode
+
+DEFAULT_QUEUE_PATH = Path(__file__).parent.parent / "results" / "queue.sqlite"
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_HEARTBEAT_SECONDS = 30
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY_SECONDS = 30
+DEFAULT_POLL_SECONDS = 5
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+JOB_STATUSES = [PENDING, LEASED, DONE, FAILED]
+
+
+def worker_id() -> str:
+    """Name of this worker process: host and pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """SQLite queue of leased evaluation jobs"""
+    
+    def __init__(self, path: Path = DEFAULT_QUEUE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: claims run in explicit BEGIN IMMEDIATE transactions
+        self._conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA journal_mode={sqlite_journal_mode()}")
+        with self._transaction():
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                " key TEXT PRIMARY KEY, model TEXT NOT NULL, task TEXT NOT NULL,"
+                " prompt_hash TEXT NOT NULL, params TEXT NOT NULL, created_at REAL NOT NULL,"
+                " finalized_at REAL, finalized_by TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " evaluation_key TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " task TEXT NOT NULL,"
+                " sample_id INTEGER NOT NULL,"
+                " status TEXT NOT NULL DEFAULT 'pending',"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " max_attempts INTEGER NOT NULL,"
+                " worker TEXT,"
+                " lease_expires REAL,"
+                " not_before REAL NOT NULL DEFAULT 0,"
+                " result TEXT,"
+                " error TEXT,"
+                " updated_at REAL NOT NULL,"
+                " UNIQUE (evaluation_key, sample_id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, not_before, id)"
+            )
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database lock up front"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def enqueue(
+        self,
+        key: str,
+        model: str,
+        task: str,
+        prompt_hash: str,
+        params: Dict[str, Any],
+        sample_ids: List[int],
+        max_attempts: Optional[int] = None
+    ) -> int:
+        """Add an evaluation's jobs; returns how many were added or put back
+        
+        Enqueueing an evaluation again adds nothing for jobs that are pending,
+        running or done, and retries its failed jobs.
+        """
+        max_attempts = max_attempts or get_setting("queue.max_attempts", DEFAULT_MAX_ATTEMPTS)
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO evaluations (key, model, task, prompt_hash, params, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, task, prompt_hash, json.dumps(params), now)
+            )
+            added = 0
+            for sample_id in sample_ids:
+                added += conn.execute(
+                    "INSERT OR IGNORE INTO jobs"
+                    " (evaluation_key, model, task, sample_id, max_attempts, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, task, sample_id, max_attempts, now)
+                ).rowcount
+            retried = conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, max_attempts = ?, worker = NULL,"
+                " not_before = 0, error = NULL, updated_at = ?"
+                " WHERE evaluation_key = ? AND status = ?",
+                (PENDING, max_attempts, now, key, FAILED)
+            ).rowcount
+            if added or retried:
+                conn.execute(
+                    "UPDATE evaluations SET finalized_at = NULL, finalized_by = NULL WHERE key = ?", (key,)
+                )
+        return added + retried
+    
+    def claim(self, worker: str, limit: int = 1, lease_seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Lease up to ``limit`` runnable jobs, first taking back leases that ran out"""
+        lease_seconds = lease_seconds or get_setting("queue.lease_seconds", DEFAULT_LEASE_SECONDS)
+        now = time.time()
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, now)
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? AND not_before <= ? ORDER BY id LIMIT ?",
+                (PENDING, now, limit)
+            ).fetchall()
+            for row in rows:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1,"
+                    " lease_expires = ?, updated_at = ? WHERE id = ?",
+                    (LEASED, worker, now + lease_seconds, now, row["id"])
+                )
+        return [
+            {**dict(row), "status": LEASED, "worker": worker, "attempts": row["attempts"] + 1}
+            for row in rows
+        ]
+    
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        """Put jobs whose worker stopped heartbeating back in the queue (or fail them)"""
+        conn.execute(
+            "UPDATE jobs SET status = ?, error = 'lease expired on ' || worker,"
+            " worker = NULL, lease_expires = NULL, updated_at = ?"
+            " WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+            (FAILED, now, LEASED, now)
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, error = 'lease expired on ' || worker,"
+            " worker = NULL, lease_expires = NULL, not_before = 0, updated_at = ?"
+            " WHERE status = ? AND lease_expires < ?",
+            (PENDING, now, LEASED, now)
+        )
+    
+    def heartbeat(self, worker: str, job_ids: List[int], lease_seconds: Optional[float] = None) -> int:
+        """Extend the leases a worker still holds; returns how many it holds"""
+        if not job_ids:
+            return 0
+        lease_seconds = lease_seconds or get_setting("queue.lease_seconds", DEFAULT_LEASE_SECONDS)
+        now = time.time()
+        placeholders = ",".join("?" * len(job_ids))
+        with self._transaction() as conn:
+            return conn.execute(
+                f"UPDATE jobs SET lease_expires = ?, updated_at = ?"
+                f" WHERE worker = ? AND status = ? AND id IN ({placeholders})",
+                (now + lease_seconds, now, worker, LEASED, *job_ids)
+            ).rowcount
+    
+    def complete(self, job_id: int, worker: str, result: Dict[str, Any]) -> bool:
+        """Store a job's result; False if the worker no longer holds its lease"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, lease_expires = NULL, updated_at = ?"
+                " WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, json.dumps(result, ensure_ascii=False), time.time(), job_id, worker, LEASED)
+            ).rowcount == 1
+    
+    def fail(
+        self,
+        job_id: int,
+        worker: str,
+        error: str,
+        retry: bool = True,
+        retry_delay: Optional[float] = None
+    ) -> Optional[str]:
+        """Record a failed attempt; returns the job's new status (None if the lease was lost)
+        
+        The job is retried after ``retry_delay`` seconds, doubling per attempt,
+        until it has been attempted max_attempts times.
+        """
+        if retry_delay is None:
+            retry_delay = get_setting("queue.retry_delay_seconds", DEFAULT_RETRY_DELAY_SECONDS)
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker = ? AND status = ?",
+                (job_id, worker, LEASED)
+            ).fetchone()
+            if row is None:
+                return None
+            status = PENDING if retry and row["attempts"] < row["max_attempts"] else FAILED
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, worker = NULL, lease_expires = NULL,"
+                " not_before = ?, updated_at = ? WHERE id = ?",
+                (status, error[:2000], now + retry_delay * 2 ** (row["attempts"] - 1), now, job_id)
+            )
+        return status
+    
+    def release(self, worker: str, job_ids: List[int]) -> int:
+        """Hand back leased jobs unfinished (worker shutting down) without using up an attempt"""
+        if not job_ids:
+            return 0
+        placeholders = ",".join("?" * len(job_ids))
+        with self._transaction() as conn:
+            return conn.execute(
+                f"UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), worker = NULL,"
+                f" lease_expires = NULL, not_before = 0, updated_at = ?"
+                f" WHERE worker = ? AND status = ? AND id IN ({placeholders})",
+                (PENDING, time.time(), worker, LEASED, *job_ids)
+            ).rowcount
+    
+    def evaluation(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT * FROM evaluations WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        evaluation = dict(row)
+        evaluation["params"] = json.loads(evaluation["params"])
+        return evaluation
+    
+    def claim_finished(self, worker: str) -> List[Dict[str, Any]]:
+        """Claim evaluations whose jobs have all finished, with their sample results
+        
+        Each finished evaluation is handed to exactly one worker, which records it.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            keys = [row["key"] for row in conn.execute(
+                "SELECT key FROM evaluations e WHERE finalized_at IS NULL AND NOT EXISTS ("
+                " SELECT 1 FROM jobs WHERE evaluation_key = e.key AND status IN (?, ?))",
+                (PENDING, LEASED)
+            ).fetchall()]
+            for key in keys:
+                conn.execute(
+                    "UPDATE evaluations SET finalized_at = ?, finalized_by = ? WHERE key = ?",
+                    (now, worker, key)
+                )
+        
+        finished = []
+        for key in keys:
+            evaluation = self.evaluation(key)
+            jobs = self._conn.execute(
+                "SELECT sample_id, status, result, error FROM jobs WHERE evaluation_key = ? ORDER BY sample_id",
+                (key,)
+            ).fetchall()
+            evaluation["results"] = [json.loads(job["result"]) for job in jobs if job["status"] == DONE]
+            evaluation["errors"] = {job["sample_id"]: job["error"] for job in jobs if job["status"] == FAILED}
+            finished.append(evaluation)
+        return finished
+    
+    def has_open_jobs(self) -> bool:
+        """Whether any job is still waiting or running"""
+        return self._conn.execute(
+            "SELECT 1 FROM jobs WHERE status IN (?, ?) LIMIT 1", (PENDING, LEASED)
+        ).fetchone() is not None
+    
+    def stats(self) -> Dict[str, int]:
+        """Job counts by status"""
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for row in self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+    
+    def evaluation_stats(self) -> List[Dict[str, Any]]:
+        """Per-evaluation job counts by status, oldest evaluation first"""
+        rows = self._conn.execute(
+            "SELECT e.key, e.model, e.task, e.finalized_at,"
+            " SUM(j.status = 'pending') AS pending, SUM(j.status = 'leased') AS leased,"
+            " SUM(j.status = 'done') AS done, SUM(j.status = 'failed') AS failed"
+            " FROM evaluations e JOIN jobs j ON j.evaluation_key = e.key"
+            " GROUP BY e.key ORDER BY e.created_at, e.key"
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def workers(self) -> List[Dict[str, Any]]:
+        """Workers holding leases, with their job count and latest lease expiry"""
+        rows = self._conn.execute(
+            "SELECT worker, COUNT(*) AS jobs, MAX(lease_expires) AS lease_expires"
+            " FROM jobs WHERE status = ? GROUP BY worker ORDER BY worker",
+            (LEASED,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def close(self) -> None:
+        self._conn.close()
+
+
+class Heartbeat:
+    """Background thread extending a worker's leases while its jobs run
+    
+    Uses its own connection, so heartbeats continue while the worker's event
+    loop is busy. ``lost`` is set when some lease was taken back (a heartbeat
+    came too late), in which case that job's result is discarded.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        worker: str,
+        job_ids: List[int],
+        lease_seconds: Optional[float] = None,
+        interval: Optional[float] = None
+    ):
+        self.path = Path(path)
+        self.worker = worker
+        self.job_ids = list(job_ids)
+        self.lease_seconds = lease_seconds or get_setting("queue.lease_seconds", DEFAULT_LEASE_SECONDS)
+        self.interval = interval or get_setting("queue.heartbeat_seconds", DEFAULT_HEARTBEAT_SECONDS)
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="queue-heartbeat", daemon=True)
+    
+    def _run(self) -> None:
+        queue = WorkQueue(self.path)
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    held = queue.heartbeat(self.worker, self.job_ids, self.lease_seconds)
+                except sqlite3.Error as e:
+                    print(f"⚠️ Work queue heartbeat failed: {e}")
+                    continue
+                if held < len(self.job_ids):
+                    self.lost = True
+        finally:
+            queue.close()
+    
+    def __enter__(self) -> "Heartbeat":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def open_work_queue(path: Optional[Path] = None) -> WorkQueue:
+    """Open the work queue (default: queue.path, relative to the repository root)"""
+    if path is None:
+        configured = get_setting("queue.path")
+        path = Path(__file__).parent.parent / configured if configured else DEFAULT_QUEUE_PATH
+    return WorkQueue(Path(path))
@@ -4,8 +4,14 @@ Example: Compare multiple models
 """
 
 import json
+import sys
 from pathlib import Path
 
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmark.outputs import get_output, iter_outputs
+
 
 def main():
     # Load leaderboard
@@ -71,6 +77,28 @@ def main():
     for e in sorted_by_value[:5]:
         print(f"  • {e['model']}: {e['performance_per_dollar']:.1f} "
               f"(Score: {e['score']:.1%}, Cost: ${e['cost_per_eval']:.3f})")
+    
+    # Token usage, streamed from outputs/evaluations.jsonl one record at a time
+    print("\n🔢 Token Usage")
+    print("-" * 40)
+    
+    token_counts = [r['total_tokens'] for r in iter_outputs() if r.get('total_tokens')]
+    if token_counts:
+        print(f"Average Tokens per Eval: {sum(token_counts) / len(token_counts):,.0f}")
+        print(f"Max Tokens per Eval: {max(token_counts):,}")
+    
+    # Sample outputs, looked up per model via the outputs index
+    print("\n📄 Sample First Lines (Top 3)")
+    print("-" * 40)
+    
+    for e in data['leaderboard'][:3]:
+        record = get_output(e['full_model'])
+        response = record.get('model_response') if record else None
+        if not isinstance(response, dict) or not response.get('prospects'):
+            continue
+        prospect = response['prospects'][0]
+        print(f"  • {e['model']} → {prospect.get('name', '')}:")
+        print(f"    \"{prospect.get('first_line', '')}\"")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+JSON Extraction Benchmark - Regex cascade vs single-pass scanner on large completions
+
+Usage:
+    python perf/bench_json_extract.py [--sizes 10000 100000 1000000] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark.jsonscan import extract_json_object
+
+
+PAYLOAD = {
+    "prospects": [
+        {
+            "name": "Matthew Christy",
+            "first_line": "Saw Bluestone Lane opened 5 new cafes {this quarter} - \"scheduling\" must be fun.",
+            "evidence_url": "https://example.com/bluestone",
+            "evidence_quote": "five new locations"
+        },
+        {
+            "name": "Isaac Reback",
+            "first_line": "sweetgreen's suburban push means more hourly hiring across states.",
+            "evidence_url": "https://example.com/sweetgreen",
+            "evidence_quote": ""
+        },
+        {
+            "name": "Tiffany Porter",
+            "first_line": "Massage Envy's 1,000+ franchises make compliance a moving target.",
+            "evidence_url": "https://example.com/massage-envy",
+            "evidence_quote": ""
+        }
+    ]
+}
+
+
+def legacy_extract_json(text: str) -> Dict[str, Any]:
+    """The regex cascade extract_json used before the scanner (baseline)"""
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except:
+        pass
+    patterns = [
+        r'```json\s*(.*?)\s*```',
+        r'```\s*(.*?)\s*```',
+        r'\{.*\}',
+    ]
+    for pattern in patterns:
+        matches = re.findall(pattern, text, re.DOTALL)
+        for match in matches:
+            try:
+                return json.loads(match)
+            except:
+                continue
+    return None
+
+
+def reasoning_completion(size: int) -> str:
+    """Reasoning-model style: brace-heavy scratch work, then a fenced answer"""
+    chunk = (
+        "Thinking about {prospect} and the {company} context; maybe set {x: 1, y: 2} "
+        "or a template like {{first_line}} - don't forget \"quotes\" and {nested {braces}}.\n"
+    )
+    body = chunk * max(1, size // len(chunk))
+    return body + "\n```json\n" + json.dumps(PAYLOAD, indent=2) + "\n```\n"
+
+
+def bare_completion(size: int) -> str:
+    """Brace-heavy scratch work followed by an unfenced answer"""
+    chunk = "Option {a} vs {b}: weigh {cost, speed} before writing the {first_line}.\n"
+    body = chunk * max(1, size // len(chunk))
+    return body + "\nFinal answer: " + json.dumps(PAYLOAD)
+
+
+def unclosed_completion(size: int) -> str:
+    """Unfenced answer followed by notes full of braces that never close"""
+    chunk = "todo: fill { placeholder, { maybe later ... "
+    body = chunk * max(1, size // len(chunk))
+    return json.dumps(PAYLOAD) + "\nNotes: " + body
+
+
+def leading_completion(size: int) -> str:
+    """Answer first, then brace-heavy commentary: the scanner's worst case"""
+    chunk = "Note on {prospect}: the {company} line uses {x: 1} and {\"k\": [1, {2}]}.\n"
+    body = chunk * max(1, size // len(chunk))
+    return json.dumps(PAYLOAD) + "\n" + body
+
+
+def deep_completion(size: int) -> str:
+    """Answer, then notes nesting objects far past the JSON parser's recursion limit"""
+    depth = max(1, size // 7)
+    return json.dumps(PAYLOAD) + '\nNotes: ' + '{"a": ' * depth + "1" + "}" * depth
+
+
+def time_call(fn: Callable[[str], Any], text: str, repeat: int) -> float:
+    """Best wall time of repeat calls, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction from completions")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Approximate completion sizes in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per case (best is kept)")
+    parser.add_argument("--legacy-max-size", type=int, default=100_000,
+                        help="Skip the regex baseline above this size on the quadratic case")
+    args = parser.parse_args()
+
+    scanner = lambda text: extract_json_object(text, prefer_key="prospects")
+    cases = [
+        ("fenced", reasoning_completion),
+        ("bare", bare_completion),
+        ("unclosed", unclosed_completion),
+        ("leading", leading_completion),
+        ("deep", deep_completion),
+    ]
+
+    print(f"{'case':<10} {'size':>10} {'regex ms':>12} {'scanner ms':>12} {'speedup':>9}  found")
+    print("-" * 66)
+    for name, build in cases:
+        for size in args.sizes:
+            text = build(size)
+            found = scanner(text) == PAYLOAD
+
+            if name == "unclosed" and size > args.legacy_max_size:
+                legacy_ms = None
+            else:
+                legacy_ms = time_call(legacy_extract_json, text, args.repeat)
+                legacy_found = legacy_extract_json(text) == PAYLOAD
+            scanner_ms = time_call(scanner, text, args.repeat)
+
+            legacy_col = f"{legacy_ms:12.2f}" if legacy_ms is not None else f"{'skipped':>12}"
+            speedup = f"{legacy_ms / scanner_ms:8.1f}x" if legacy_ms is not None else f"{'-':>9}"
+            status = "✅" if found else "❌"
+            if legacy_ms is not None and not legacy_found:
+                status += " (regex missed it)"
+            print(f"{name:<10} {len(text):>10} {legacy_col} {scanner_ms:12.2f} {speedup}  {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Scorer Hot Path Benchmark - Per-sample scoring overhead outside the judge calls
+
+Times the work the multi-judge scorer does for every sample, on fixtures built
+from the stored responses in outputs/model_responses/ plus synthetic scale-ups
+(long reasoning completions, long tool-call histories, large prospect batches):
+
+    extract_json                    answer JSON from the candidate's completion
+    extract_tool_usage_from_state   tool calls from the message history
+    check_url_verified              evidence URLs against the visited-page index
+    parse_judge_scores              a judge's JSON reply
+    median aggregation              prospect_totals + median over the panel
+    judge prompt rendering          rubric, prompt template and output schema
+    score_response                  the whole scorer, with instant fake judges
+
+Each run can be appended to perf/results/bench_scorer.jsonl (--save) and is
+compared with the last saved run from the same host (hostname, CPU and
+Python version); cases slower by more than --tolerance are reported as
+regressions. The history is machine-specific, so it is not committed.
+
+Usage:
+    python perf/bench_scorer.py [--quick] [--save] [--tolerance 0.3] [--fail-on-regression]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmark.judges import multi_judge_scorer as mj
+
+FIXTURES_DIR = ROOT / "outputs" / "model_responses"
+RESULTS_PATH = Path(__file__).parent / "results" / "bench_scorer.jsonl"
+
+COMPANY_CONTEXT = {"company": "Homebase", "pain_focus": "Pain Recognition"}
+JUDGE_PANEL = ["judge/a", "judge/b", "judge/c", "judge/d", "judge/e"]
+
+
+# --- Fixtures ---
+
+def load_fixture_prospects() -> List[Dict[str, Any]]:
+    """Every prospect answer stored in outputs/model_responses/"""
+    prospects = []
+    for path in sorted(FIXTURES_DIR.glob("*.json")):
+        with open(path, "r") as f:
+            record = json.load(f)
+        response = record.get("response")
+        if isinstance(response, dict):
+            prospects.extend(p for p in response.get("prospects", []) if isinstance(p, dict))
+    if not prospects:
+        raise SystemExit(f"No stored responses found in {FIXTURES_DIR}")
+    return prospects
+
+
+def scaled_prospects(fixtures: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """``count`` prospects cycled from the fixtures, with distinct names"""
+    return [
+        {**fixtures[i % len(fixtures)], "name": f"{fixtures[i % len(fixtures)].get('name', 'Prospect')} #{i + 1}"}
+        for i in range(count)
+    ]
+
+
+def completion_text(prospects: List[Dict[str, Any]], reasoning_chars: int) -> str:
+    """A candidate completion: brace-heavy reasoning, then the fenced answer"""
+    chunk = "Checking {prospect} against the {company} context - maybe {x: 1}; \"quotes\" too.\n"
+    reasoning = chunk * (reasoning_chars // len(chunk))
+    return reasoning + "\n```json\n" + json.dumps({"prospects": prospects}, indent=2) + "\n```\n"
+
+
+def message_history(prospects: List[Dict[str, Any]], tool_calls: int) -> SimpleNamespace:
+    """A TaskState-like object whose messages hold ``tool_calls`` searches and extracts"""
+    messages = [SimpleNamespace(role="system", tool_calls=None), SimpleNamespace(role="user", tool_calls=None)]
+    for i in range(tool_calls):
+        prospect = prospects[i % len(prospects)]
+        if i % 2 == 0:
+            call = SimpleNamespace(function="tavily_search", arguments={"query": f"{prospect.get('name')} news {i}"})
+        else:
+            url = prospect.get("evidence_url") or f"https://example.com/{i}"
+            call = SimpleNamespace(function="tavily_extract", arguments={"url": f"{url}?utm_source=x&page={i}"})
+        messages.append(SimpleNamespace(role="assistant", tool_calls=[call]))
+        messages.append(SimpleNamespace(role="tool", tool_calls=None))
+    return SimpleNamespace(messages=messages)
+
+
+def judge_reply(prospects: List[Dict[str, Any]]) -> str:
+    """A judge's reply as models write it: a sentence, then fenced JSON"""
+    scores = {
+        "prospects": [
+            {
+                "name": prospect.get("name", ""),
+                "pain_score": 8,
+                "insight_score": 7,
+                "fit_score": 6,
+                "reply_score": 5,
+                "total": 26,
+                "rationale": "Specific, verified detail tied to scheduling pain; the ask could be sharper."
+            }
+            for prospect in prospects
+        ]
+    }
+    return "Here are my scores.\n\n```json\n" + json.dumps(scores, indent=2) + "\n```"
+
+
+def judge_results(prospect_count: int) -> List[Dict[str, Any]]:
+    """Parsed panel results as run_judge returns them"""
+    return [
+        {
+            "model": judge,
+            "scores": {"prospects": [{"total": 20 + (j + i) % 15} for i in range(prospect_count)]}
+        }
+        for j, judge in enumerate(JUDGE_PANEL)
+    ]
+
+
+def render_judge_prompt(prospects: List[Dict[str, Any]]) -> str:
+    """The rubric and judge prompt for a batch, rendered as score_response does"""
+    rubric = mj.JUDGE_RUBRIC_TEMPLATE.format(
+        company=COMPANY_CONTEXT["company"],
+        pain_recognition=COMPANY_CONTEXT["pain_focus"]
+    )
+    report = "\n".join(f"✅ {p.get('name')}: URL VERIFIED (model used tavily_extract on {p.get('evidence_url')})"
+                       for p in prospects)
+    details = "".join(
+        f"\nProspect {i + 1}: {p.get('name')}\nFirst Line: {p.get('first_line')}\n"
+        f"Evidence URL: {p.get('evidence_url')}\nVERIFICATION: ✅ VERIFIED\n\n"
+        for i, p in enumerate(prospects)
+    )
+    prompt = mj.JUDGE_PROMPT_TEMPLATE.format(
+        verification_report=report,
+        prospects_details=details,
+        prospect_count=len(prospects),
+        output_schema=mj.judge_output_schema([p.get("name", "") for p in prospects])
+    )
+    return rubric + prompt
+
+
+async def fake_run_judge(judge_model: str, judge_prompt: str, verification_results: List[Dict[str, Any]], **kwargs):
+    """Stands in for run_judge: an instant, already parsed reply"""
+    return {
+        "model": judge_model,
+        "scores": {"prospects": [{"total": 26} for _ in verification_results]},
+        "verification_penalties_applied": 0
+    }
+
+
+# --- Timing ---
+
+def time_case(fn: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, float]:
+    """Median and best per-call time in microseconds, with loops sized to ``min_time`` seconds"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_call.append((time.perf_counter() - start) / loops * 1e6)
+    return {"median_us": round(statistics.median(per_call), 3), "best_us": round(min(per_call), 3), "loops": loops}
+
+
+def build_cases(fixtures: List[Dict[str, Any]], quick: bool) -> Dict[str, Callable[[], Any]]:
+    """Benchmark name -> zero-argument callable"""
+    sizes = [3, 100] if quick else [3, 100, 1000]
+    histories = [20, 500] if quick else [20, 500, 5000]
+    reasoning = [0, 100_000] if quick else [0, 100_000, 1_000_000]
+    loop = asyncio.new_event_loop()
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    stored = fixtures[:3]
+    for chars in reasoning:
+        text = completion_text(stored, chars)
+        cases[f"extract_json/stored/reasoning={chars}"] = lambda text=text: mj.extract_json(text)
+    for count in sizes[1:]:
+        text = completion_text(scaled_prospects(fixtures, count), 10_000)
+        cases[f"extract_json/prospects={count}"] = lambda text=text: mj.extract_json(text)
+
+    for calls in histories:
+        state = message_history(fixtures, calls)
+        cases[f"extract_tool_usage_from_state/tool_calls={calls}"] = (
+            lambda state=state: mj.extract_tool_usage_from_state(state)
+        )
+
+    evidence = [p.get("evidence_url", "") for p in fixtures]
+    for visited_count in histories:
+        index = mj.extract_tool_usage_from_state(message_history(fixtures, visited_count))["verification_index"]
+        cases[f"check_url_verified/visited={len(index)}/urls={len(evidence)}"] = (
+            lambda index=index: [mj.check_url_verified(url, index) for url in evidence]
+        )
+
+    for count in sizes:
+        reply = judge_reply(scaled_prospects(fixtures, count))
+        cases[f"parse_judge_scores/prospects={count}"] = lambda reply=reply: mj.parse_judge_scores(reply)
+
+        results = judge_results(count)
+        cases[f"median_aggregation/judges={len(JUDGE_PANEL)}/prospects={count}"] = (
+            lambda results=results, count=count: [
+                mj.median(totals) for totals in mj.prospect_totals(results, count)
+            ]
+        )
+
+        prospects = scaled_prospects(fixtures, count)
+        cases[f"judge_prompt_render/prospects={count}"] = lambda prospects=prospects: render_judge_prompt(prospects)
+
+    for count in sizes:
+        prospects = scaled_prospects(fixtures, count)
+        text = completion_text(prospects, 10_000)
+        names = [p["name"] for p in prospects]
+        state = message_history(prospects, max(20, count))
+
+        def score_sample(text=text, names=names, state=state):
+            tool_usage = mj.extract_tool_usage_from_state(state)
+            return loop.run_until_complete(mj.score_response(
+                text, tool_usage, judge_models=JUDGE_PANEL, company_context=COMPANY_CONTEXT,
+                judge_mode="panel", expected_names=names
+            ))
+
+        cases[f"score_response/prospects={count}"] = score_sample
+    return cases
+
+
+# --- Stored results ---
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def host_id() -> str:
+    """Identity of the machine timings are comparable on: hostname, CPU and Python version"""
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}cpu/py{platform.python_version()}"
+
+
+def last_run(path: Path, host: str) -> Optional[Dict[str, Any]]:
+    """The most recent saved run from this host (runs from any other host are ignored)"""
+    if not path.exists():
+        return None
+    previous = None
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                run = json.loads(line)
+            except ValueError:
+                continue
+            if run.get("host") == host:
+                previous = run
+    return previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scorer's per-sample hot paths")
+    parser.add_argument("--quick", action="store_true", help="Skip the largest scale-ups")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats per case (median is kept)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds per timed repeat")
+    parser.add_argument("--filter", help="Only run cases whose name contains this text")
+    parser.add_argument("--results", default=str(RESULTS_PATH), help="JSONL history of saved runs")
+    parser.add_argument("--save", action="store_true", help="Append this run to the results history")
+    parser.add_argument("--tolerance", type=float, default=0.3,
+                        help="Slowdown against the last saved run reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    # Judges answer instantly, so score_response times only the scorer's own work
+    mj.run_judge = fake_run_judge
+
+    fixtures = load_fixture_prospects()
+    cases = build_cases(fixtures, args.quick)
+    if args.filter:
+        cases = {name: fn for name, fn in cases.items() if args.filter in name}
+
+    host = host_id()
+    results_path = Path(args.results)
+    previous = last_run(results_path, host)
+    baseline = (previous or {}).get("results", {})
+
+    print(f"🧪 {len(fixtures)} stored prospect answers from {FIXTURES_DIR.relative_to(ROOT)}")
+    if previous:
+        print(f"📏 Comparing with run {previous.get('commit') or '?'} from {previous.get('timestamp')} on {host}")
+    else:
+        print(f"📏 No saved run from {host} yet - use --save to record a baseline")
+    print(f"{'case':<58} {'median us':>12} {'best us':>12} {'vs last':>9}")
+    print("-" * 94)
+
+    results = {}
+    regressions = []
+    for name, fn in cases.items():
+        timing = time_case(fn, args.repeat, args.min_time)
+        results[name] = timing
+        change = ""
+        if name in baseline and baseline[name].get("median_us"):
+            ratio = timing["median_us"] / baseline[name]["median_us"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio > 1 + args.tolerance:
+                regressions.append((name, ratio))
+                change += " ⚠️"
+        print(f"{name:<58} {timing['median_us']:>12.1f} {timing['best_us']:>12.1f} {change:>9}")
+
+    if regressions:
+        print(f"\n⚠️ {len(regressions)} cases slower than the last run by more than {args.tolerance:.0%}:")
+        for name, ratio in regressions:
+            print(f"   {name}: {ratio:.2f}x")
+    elif baseline:
+        print(f"\n✅ No case slower than the last run by more than {args.tolerance:.0%}")
+
+    if args.save:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        run = {
+            "timestamp": datetime.now().isoformat(),
+            "commit": git_commit(),
+            "host": host,
+            "python": platform.python_version(),
+            "quick": args.quick,
+            "results": results
+        }
+        with open(results_path, "a") as f:
+            f.write(json.dumps(run) + "\n")
+        print(f"💾 Run saved to: {results_path}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark - Time and imports of run_evaluation.py paths that never run an evaluation
+
+Runs run_evaluation.py in fresh interpreters for paths such as --list-models,
+--help and a missing API key, and reports the median time above a bare
+interpreter start. Fails (exit status 1) when a path takes longer than
+--budget-ms or loads a heavy dependency (inspect_ai, httpx, pydantic, ...),
+which only the evaluation paths should import.
+
+Usage:
+    python perf/bench_startup.py [--runs 10] [--budget-ms 150] [--explain]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+SCRIPT = ROOT / "run_evaluation.py"
+
+# Top-level packages the non-evaluation paths must not import
+HEAVY_MODULES = ["inspect_ai", "httpx", "pydantic", "pandas", "openai", "anthropic", "numpy"]
+
+MODULES_MARKER = "BENCH_STARTUP_MODULES="
+
+# Runs the CLI, then reports which heavy packages ended up in sys.modules
+RUNNER = f"""
+import atexit, json, runpy, sys
+def _report():
+    loaded = sorted({{name.split('.')[0] for name in sys.modules}} & set({HEAVY_MODULES!r}))
+    sys.stderr.write("\\n{MODULES_MARKER}" + json.dumps(loaded) + "\\n")
+atexit.register(_report)
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+CASES = [
+    ("no arguments", [], {}),
+    ("--help", ["--help"], {}),
+    ("--list-models", ["--list-models"], {}),
+    # An empty key in the environment is not replaced by .env, so this stops at the key check
+    ("missing API key", ["--model", "openrouter/openai/gpt-5"], {"OPENROUTER_API_KEY": ""}),
+]
+
+
+def run_once(args: List[str], env: Dict[str, str]) -> Tuple[float, List[str], int]:
+    """Wall time of one CLI run, the heavy packages it imported and its exit status"""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", RUNNER, str(SCRIPT), *args],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    elapsed = time.perf_counter() - start
+
+    loaded: List[str] = []
+    for line in completed.stderr.splitlines():
+        if line.startswith(MODULES_MARKER):
+            loaded = json.loads(line[len(MODULES_MARKER):])
+    return elapsed, loaded, completed.returncode
+
+
+def bare_startup(runs: int) -> float:
+    """Median time of an interpreter that does nothing"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], capture_output=True, timeout=60)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def slowest_imports(args: List[str], env: Dict[str, str], top: int = 10) -> List[Tuple[int, str]]:
+    """Largest cumulative import times (microseconds) from -X importtime"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, str(SCRIPT), *args],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            imports.append((int(cumulative), name.rstrip()))
+        except ValueError:
+            continue
+    return sorted(imports, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark run_evaluation.py startup on non-evaluation paths")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per case (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Allowed median time above a bare interpreter start")
+    parser.add_argument("--explain", action="store_true", help="Show the slowest imports of each case")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    bare = bare_startup(args.runs)
+    print(f"🐍 Bare interpreter start: {bare * 1000:.1f} ms (subtracted below)")
+    print(f"{'case':<20} {'median ms':>10} {'max ms':>10}  heavy imports")
+    print("-" * 70)
+
+    results = []
+    failures = []
+    for name, cli_args, env_overrides in CASES:
+        env = {**os.environ, **env_overrides}
+        times = []
+        loaded: List[str] = []
+        status_code = 0
+        for _ in range(args.runs):
+            elapsed, loaded, status_code = run_once(cli_args, env)
+            times.append(elapsed - bare)
+        median_ms = statistics.median(times) * 1000
+        max_ms = max(times) * 1000
+
+        problems = []
+        if median_ms > args.budget_ms:
+            problems.append(f"over the {args.budget_ms:.0f} ms budget")
+        if loaded:
+            problems.append(f"imported {', '.join(loaded)}")
+        if status_code != 0:
+            problems.append(f"exited with status {status_code}")
+        status = "✅" if not problems else "❌"
+        print(f"{name:<20} {median_ms:>10.1f} {max_ms:>10.1f}  {status} {', '.join(loaded) or 'none'}")
+
+        if problems:
+            failures.append((name, problems))
+        if args.explain or problems:
+            for cumulative, module in slowest_imports(cli_args, env):
+                print(f"{'':<20} {cumulative / 1000:>10.1f}   {module.strip()}")
+        results.append({"case": name, "median_ms": round(median_ms, 1), "max_ms": round(max_ms, 1),
+                        "heavy_imports": loaded, "exit_status": status_code})
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"bare_ms": round(bare * 1000, 1), "budget_ms": args.budget_ms, "cases": results}, f, indent=2)
+        print(f"💾 Results written to: {args.json}")
+
+    if failures:
+        print(f"\n❌ {len(failures)} startup path(s) failed:")
+        for name, problems in failures:
+            print(f"   {name}: {'; '.join(problems)}")
+        sys.exit(1)
+    print(f"\n✅ Every path starts within {args.budget_ms:.0f} ms without heavy imports")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tool Layer Load Benchmark - tavily_search/tavily_extract throughput and latency under concurrency
+
+Drives the real tool layer (shared client, rate limiter, extract batcher,
+compaction) against the mock Tavily server at increasing concurrency and
+reports tool calls per second, p50/p95/p99 latency, errors, and the HTTP
+requests and connections the server saw. No Tavily credits are spent.
+
+Usage:
+    python perf/bench_tool_load.py [--concurrency 1 4 16 64] [--calls 200] [--latency-ms 150]
+    python perf/bench_tool_load.py --rate-limit-rate 0.05 --plan-limit-rate 0.01
+    python perf/bench_tool_load.py --server http://127.0.0.1:8765  # an already running mock
+
+By default the configured Tavily rate limiter (rate_limits.tavily) applies, so
+the numbers show what a sweep would get; --no-rate-limit measures the client
+and batching alone.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark import ratelimit
+from benchmark.config import load_config
+from benchmark.tools import extract_batcher
+from benchmark.tools.http_client import close_client
+from benchmark.tools.mock_tavily import MockTavilyServer
+from benchmark.tools.tavily_extract import tavily_extract
+from benchmark.tools.tavily_search import tavily_search
+
+
+def start_server_thread(server: MockTavilyServer) -> str:
+    """Run the mock server on its own event loop so it does not compete with the client"""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return server.base_url
+
+
+def configure(base_url: str, rate_limited: bool) -> None:
+    """Point the tools at the mock server, without the search cache"""
+    config = load_config()
+    config.setdefault("api", {}).setdefault("tavily", {})["base_url"] = base_url
+    config.setdefault("cache", {}).setdefault("tavily_search", {})["enabled"] = False
+    if not rate_limited:
+        config.setdefault("rate_limits", {})["tavily"] = {"max_concurrency": 1_000_000}
+    os.environ.setdefault("TAVILY_API_KEY", "mock-key")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_level(
+    concurrency: int,
+    calls: int,
+    search_share: float,
+    distinct_urls: int,
+    server: Optional[MockTavilyServer]
+) -> Dict[str, Any]:
+    """Make ``calls`` tool calls with ``concurrency`` callers and measure them"""
+
+    # Fresh client, limiter and batcher so each level starts cold
+    await close_client()
+    ratelimit._limiters.clear()
+    extract_batcher._batcher = None
+    await asyncio.sleep(0.05)
+    if server is not None:
+        server.reset_stats()
+
+    search_tool = tavily_search()
+    extract_tool = tavily_extract()
+    chooser = random.Random(concurrency)
+    plan = [
+        ("search", f"hourly scheduling news {concurrency}-{i}") if chooser.random() < search_share
+        else ("extract", f"https://example.com/page/{chooser.randrange(distinct_urls)}")
+        for i in range(calls)
+    ]
+
+    latencies = {"search": [], "extract": []}
+    errors: Dict[str, int] = {}
+    next_call = iter(plan)
+
+    async def caller():
+        for kind, argument in next_call:
+            start = time.perf_counter()
+            if kind == "search":
+                result = await search_tool(query=argument)
+            else:
+                result = await extract_tool(url=argument)
+            latencies[kind].append(time.perf_counter() - start)
+            error = result.get("error")
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[caller() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    all_latencies = sorted(latencies["search"] + latencies["extract"])
+    level = {
+        "concurrency": concurrency,
+        "calls": calls,
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(calls / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(all_latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(all_latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(all_latencies, 99) * 1000, 1),
+        "search_p95_ms": round(percentile(sorted(latencies["search"]), 95) * 1000, 1),
+        "extract_p95_ms": round(percentile(sorted(latencies["extract"]), 95) * 1000, 1),
+        "errors": sum(errors.values()),
+        "error_kinds": errors,
+        "rate_limiter": ratelimit.rate_limit_stats().get("tavily", {})
+    }
+    if server is not None:
+        level["server"] = server.stats()
+    return level
+
+
+async def run_levels(args, server: Optional[MockTavilyServer]) -> List[Dict[str, Any]]:
+    levels = []
+    try:
+        for concurrency in args.concurrency:
+            levels.append(await run_level(concurrency, args.calls, args.search_share, args.distinct_urls, server))
+            print_level(levels[-1])
+    finally:
+        await close_client()
+    return levels
+
+
+def print_level(level: Dict[str, Any]) -> None:
+    server = level.get("server") or {}
+    requests = server.get("requests", "-")
+    opened = server.get("connections_opened", "-")
+    peak = server.get("peak_connections", "-")
+    print(f"{level['concurrency']:>6} {level['calls']:>6} {level['calls_per_second']:>9.1f} "
+          f"{level['p50_ms']:>9.1f} {level['p95_ms']:>9.1f} {level['p99_ms']:>9.1f} "
+          f"{level['errors']:>7} {requests:>9} {opened:>7} {peak:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Tavily tool layer against a mock server")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64],
+                        help="Concurrent tool callers per level")
+    parser.add_argument("--calls", type=int, default=200, help="Tool calls per level")
+    parser.add_argument("--search-share", type=float, default=0.5,
+                        help="Share of calls that are searches (the rest are extracts)")
+    parser.add_argument("--distinct-urls", type=int, default=1000,
+                        help="Extract URLs are drawn from this many pages (fewer means more sharing)")
+    parser.add_argument("--server", help="Base URL of a running mock server (default: start one in-process)")
+    parser.add_argument("--no-rate-limit", action="store_true",
+                        help="Bypass rate_limits.tavily to measure the client and batching alone")
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--plan-limit-rate", type=float, default=0.0)
+    parser.add_argument("--extract-failure-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--content-chars", type=int, default=20_000, help="Size of each extracted page")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    server = None
+    if args.server:
+        base_url = args.server
+    else:
+        server = MockTavilyServer(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            plan_limit_rate=args.plan_limit_rate,
+            extract_failure_rate=args.extract_failure_rate,
+            retry_after=args.retry_after,
+            content_chars=args.content_chars,
+            seed=args.seed
+        )
+        base_url = start_server_thread(server)
+    configure(base_url, rate_limited=not args.no_rate_limit)
+
+    limiter = "off" if args.no_rate_limit else "rate_limits.tavily"
+    print(f"🧪 Mock Tavily at {base_url} (rate limiter: {limiter})")
+    print(f"{'conc':>6} {'calls':>6} {'calls/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'errors':>7} {'requests':>9} {'conns':>7} {'peak':>6}")
+    print("-" * 86)
+    levels = asyncio.run(run_levels(args, server))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"base_url": base_url, "rate_limited": not args.no_rate_limit, "levels": levels}, f, indent=2)
+        print(f"💾 Results written to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Work Queue Benchmark - Job throughput with 1..N worker processes, and recovery from a dead worker
+
+Fills a scratch work queue with simulated (model, task, sample) jobs and
+drains it with worker processes that claim, heartbeat and complete them like
+``run_evaluation.py --worker`` does, sleeping for each job instead of calling
+models. Reports jobs per second and the speed-up over one worker, so queue
+overhead shows up as lost scaling. A second scenario kills a worker in the
+middle of its jobs and checks that every job is still completed exactly once
+after its lease runs out.
+
+Usage:
+    python perf/bench_workqueue.py [--workers 1 2 4 8] [--jobs 200] [--job-ms 50]
+    python perf/bench_workqueue.py --job-ms 0      # queue overhead only
+    python perf/bench_workqueue.py --journal-mode DELETE
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark.config import load_config
+from benchmark.workqueue import DONE, Heartbeat, WorkQueue
+
+
+def fill_queue(path: Path, jobs: int, models: int) -> None:
+    """Enqueue ``jobs`` jobs spread over ``models`` evaluations"""
+    queue = WorkQueue(path)
+    per_model = max(1, jobs // models)
+    for number in range(models):
+        model = f"mock/model-{number}"
+        queue.enqueue(f"key-{number}", model, "homebase", "hash", {}, list(range(1, per_model + 1)))
+    queue.close()
+
+
+def worker_process(path: str, name: str, jobs_per_claim: int, job_seconds: float, lease_seconds: float,
+                   journal_mode: str, die_after: int = 0) -> None:
+    """Claim, heartbeat and complete jobs until none are left (or exit abruptly after ``die_after``)"""
+    load_config().setdefault("storage", {})["journal_mode"] = journal_mode
+    queue = WorkQueue(Path(path))
+    completed = 0
+    while True:
+        jobs = queue.claim(name, jobs_per_claim, lease_seconds=lease_seconds)
+        if not jobs:
+            if not queue.has_open_jobs():
+                break
+            time.sleep(0.05)
+            continue
+        with Heartbeat(queue.path, name, [job["id"] for job in jobs], lease_seconds, interval=lease_seconds / 3):
+            if die_after and completed + len(jobs) > die_after:
+                os._exit(1)  # Killed mid-job: no release, no further heartbeats
+            time.sleep(job_seconds * len(jobs) / jobs_per_claim)
+        for job in jobs:
+            queue.complete(job["id"], name, {"score": 1.0, "worker": name})
+            completed += 1
+        queue.claim_finished(name)
+    queue.close()
+
+
+def run_workers(path: Path, workers: int, args, die_after: int = 0) -> float:
+    """Drain the queue with ``workers`` processes; returns the wall time"""
+    processes = [
+        multiprocessing.Process(
+            target=worker_process,
+            args=(str(path), f"worker-{number}", args.jobs_per_claim, args.job_ms / 1000,
+                  args.lease_seconds, args.journal_mode, die_after if number == 0 else 0)
+        )
+        for number in range(workers)
+    ]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - start
+
+
+def check_queue(path: Path) -> Dict[str, Any]:
+    """Job counts, and whether every job finished exactly once"""
+    queue = WorkQueue(path)
+    stats = queue.stats()
+    evaluations = queue.evaluation_stats()
+    queue.close()
+    return {
+        **stats,
+        "all_done": stats["pending"] == 0 and stats["leased"] == 0 and stats["failed"] == 0,
+        "evaluations_recorded": sum(1 for e in evaluations if e["finalized_at"])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark work queue throughput and dead-worker recovery")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker process counts")
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs per level")
+    parser.add_argument("--models", type=int, default=10, help="Evaluations the jobs are spread over")
+    parser.add_argument("--job-ms", type=float, default=50.0, help="Simulated time per job (0: queue overhead only)")
+    parser.add_argument("--jobs-per-claim", type=int, default=1, help="Jobs a worker claims at once")
+    parser.add_argument("--lease-seconds", type=float, default=1.0, help="Lease length (short, so recovery is quick)")
+    parser.add_argument("--journal-mode", default="WAL", help="SQLite journal mode (DELETE for network filesystems)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    load_config().setdefault("storage", {})["journal_mode"] = args.journal_mode
+    scratch = Path(tempfile.mkdtemp(prefix="bench_workqueue_"))
+
+    print(f"🧪 {args.jobs} jobs of {args.job_ms:g} ms, {args.jobs_per_claim} per claim, journal {args.journal_mode}")
+    print(f"{'workers':>8} {'seconds':>9} {'jobs/s':>9} {'speed-up':>9} {'efficiency':>11}  complete")
+    print("-" * 60)
+
+    levels = []
+    baseline = None
+    for workers in args.workers:
+        path = scratch / f"queue_{workers}.sqlite"
+        fill_queue(path, args.jobs, args.models)
+        elapsed = run_workers(path, workers, args)
+        check = check_queue(path)
+        rate = check[DONE] / elapsed if elapsed else 0.0
+        baseline = baseline or rate / workers
+        speedup = rate / baseline if baseline else 0.0
+        status = "✅" if check["all_done"] else "❌"
+        print(f"{workers:>8} {elapsed:>9.2f} {rate:>9.1f} {speedup:>8.2f}x {speedup / workers:>10.0%}  {status}")
+        levels.append({"workers": workers, "seconds": round(elapsed, 3), "jobs_per_second": round(rate, 1),
+                       "speedup": round(speedup, 2), **check})
+
+    # One of the workers dies a few jobs in; its leased jobs must be reclaimed
+    workers = max(2, min(args.workers[-1], 4))
+    path = scratch / "queue_recovery.sqlite"
+    fill_queue(path, args.jobs, args.models)
+    elapsed = run_workers(path, workers, args, die_after=max(1, args.jobs // (workers * 4)))
+    recovery = {"workers": workers, "seconds": round(elapsed, 3), **check_queue(path)}
+    status = "✅" if recovery["all_done"] and recovery["evaluations_recorded"] == args.models else "❌"
+    print(f"\n💀 Dead worker ({workers} workers, one killed mid-job): {recovery[DONE]} jobs done, "
+          f"{recovery['evaluations_recorded']}/{args.models} evaluations recorded in {elapsed:.2f}s {status}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "levels": levels, "recovery": recovery}, f, indent=2)
+        print(f"💾 Results written to: {args.json}")
+
+    if status != "✅" or not all(level["all_done"] for level in levels):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
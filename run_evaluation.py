@@ -8,28 +8,87 @@ import argparse
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add benchmark to path
 sys.path.append(str(Path(__file__).parent))
 
-from benchmark.tasks.homebase import HomebaseTask
-from benchmark.judges.multi_judge_scorer import MultiJudgeScorer
+# Only light modules at import time: inspect_ai, httpx and the scorer stack are
+# imported inside the functions that run evaluations, so --list-models, --help,
+# --export-leaderboard and configuration errors return without loading them
+# (perf/bench_startup.py enforces this)
+from benchmark.cache import cache_stats
+from benchmark.config import get_setting, load_config
+from benchmark.epochs import EpochTracker, epoch_scores, leaderboard_intervals
+from benchmark.results_store import (
+    GENERATED_LEADERBOARD_JSON as LEADERBOARD_JSON,
+    GENERATED_LEADERBOARD_MD as LEADERBOARD_MD,
+    MIN_RANKED_MODELS,
+    export_leaderboard,
+    open_results_store,
+)
+from benchmark.outputs import (
+    DEFAULT_OUTPUTS_PATH,
+    add_sample_records,
+    append_output,
+    record_from_eval_log,
+    sample_record,
+)
+from benchmark.telemetry import evaluation_label, get_telemetry
+
+REPO_ROOT = Path(__file__).parent
+
+
+def resolve_models(specs, config):
+    """Expand --models entries, turning config groups like 'models.all' into model ids"""
+    models = []
+    for spec in specs:
+        for item in spec.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            if item.startswith('models.'):
+                group = config.get('models', {}).get(item.split('.', 1)[1])
+                if group is None:
+                    raise ValueError(f"Unknown model group in config.yaml: {item}")
+                models.extend(group)
+            else:
+                models.append(item)
+    
+    # Drop duplicates, keeping first occurrence
+    return list(dict.fromkeys(models))
 
 
-def load_config():
-    """Load configuration from config.yaml"""
-    config_path = Path(__file__).parent / 'config.yaml'
-    if config_path.exists():
-        import yaml
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    return {}
+def summarize_log(log):
+    """Pull the headline score out of an Inspect eval log"""
+    summary = {'status': getattr(log, 'status', 'unknown'), 'final_score': 0.0, 'cost': 0.0}
+    results = getattr(log, 'results', None)
+    if results and results.scores:
+        metrics = results.scores[0].metrics
+        if 'accuracy' in metrics:
+            summary['final_score'] = metrics['accuracy'].value
+    error = getattr(log, 'error', None)
+    if error:
+        summary['error'] = getattr(error, 'message', str(error))
+    return summary
+
+
+def checkpoint_evaluation_key(args, task, model, epochs=1):
+    """Checkpoint key of one model's evaluation under this run's prompt, judge panel and judge mode"""
+    from benchmark.checkpoints import CheckpointStore
+    from benchmark.judges.multi_judge_scorer import DEFAULT_JUDGE_MODELS, resolve_judging
+    judge_mode = resolve_judging(judge_mode=args.judge_mode)['judge_mode']
+    return CheckpointStore.evaluation_key(
+        model, args.task, task.prompt_hash, DEFAULT_JUDGE_MODELS, judge_mode, epochs=epochs
+    )
+
+
+def evaluation_costs(model):
+    """Cost of a model's evaluation over generation, judge and tool spans, and the split by kind"""
+    costs = get_telemetry().evaluation_costs(evaluation_label(model))
+    return {'cost': costs.pop('total'), 'cost_breakdown': costs}
 
 
 def main():
@@ -40,18 +99,80 @@ def main():
 Examples:
   python run_evaluation.py --model openrouter/openai/gpt-5
   python run_evaluation.py --model openrouter/anthropic/claude-opus-4.1 --task homebase
+  python run_evaluation.py --models openrouter/openai/gpt-5 openrouter/openai/gpt-5-mini
+  python run_evaluation.py --models models.all --max-concurrency 8
+  python run_evaluation.py --models models.all --resume
+  python run_evaluation.py --models models.recommended --epochs 10
+  python run_evaluation.py --model openrouter/openai/gpt-5 --record cassettes/gpt-5.jsonl.gz
+  python run_evaluation.py --model openrouter/openai/gpt-5 --replay cassettes/gpt-5.jsonl.gz
+  python run_evaluation.py --models models.all --enqueue
+  python run_evaluation.py --worker
+  python run_evaluation.py --queue-status
   python run_evaluation.py --list-models
+  python run_evaluation.py --export-leaderboard
         """
     )
     
     parser.add_argument('--model', help='Model to evaluate (e.g., openrouter/openai/gpt-5)')
+    parser.add_argument('--models', nargs='+', help='Sweep several models in one process '
+                        '(model ids, comma lists, or config groups such as models.all)')
+    parser.add_argument('--max-concurrency', type=int, default=None,
+                        help='Max evaluations running at once in a sweep (default: sweep.max_concurrency)')
     parser.add_argument('--task', default='homebase', help='Task to run (default: homebase)')
     parser.add_argument('--output', default='results/', help='Output directory')
+    parser.add_argument('--dataset', help='JSONL or CSV file of prospects (default: evaluation.dataset)')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='Prospects per sample (default: evaluation.batch_size)')
+    parser.add_argument('--max-prospects', type=int, default=None,
+                        help='Only evaluate the first N prospects of the dataset')
+    parser.add_argument('--epochs', type=int, default=None,
+                        help='Run each model up to N times and report bootstrap confidence intervals; '
+                        'models stop early once their interval is narrow or clear of their neighbours')
+    parser.add_argument('--no-early-stop', action='store_true',
+                        help='With --epochs, run every model for all N epochs')
+    parser.add_argument('--judge-cache', choices=['use', 'refresh', 'bypass'], default='use',
+                        help='Judge response cache: use (default), refresh (re-call and overwrite) or bypass')
+    parser.add_argument('--judge-mode', choices=['panel', 'escalate'], default=None,
+                        help='panel: every judge scores every sample; escalate: cheap judges first, '
+                        'expensive judges only when contested (default: judging.mode)')
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument('--record', metavar='CASSETTE',
+                                help='Record all model, judge and Tavily traffic to a cassette (.jsonl.gz)')
+    cassette_group.add_argument('--replay', metavar='CASSETTE',
+                                help='Replay traffic from a recorded cassette, offline')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume an interrupted run: skip completed evaluations and reuse '
+                        'checkpointed generations and judge calls')
+    queue_group = parser.add_argument_group('work queue (several worker processes or hosts)')
+    queue_group.add_argument('--enqueue', action='store_true',
+                             help='Add one job per model and prospect batch to the work queue instead of running them '
+                             '(enqueueing again retries failed jobs)')
+    queue_group.add_argument('--worker', action='store_true',
+                             help='Run jobs from the work queue until it is drained')
+    queue_group.add_argument('--worker-jobs', type=int, default=None,
+                             help='Jobs a worker runs at once (default: queue.worker_jobs)')
+    queue_group.add_argument('--wait', action='store_true',
+                             help='With --worker, keep polling for new jobs once the queue is drained')
+    queue_group.add_argument('--queue-status', action='store_true', help='Show work queue progress')
+    queue_group.add_argument('--queue', metavar='PATH',
+                             help='Work queue database (default: queue.path)')
     parser.add_argument('--list-models', action='store_true', help='List available models')
+    parser.add_argument('--export-leaderboard', action='store_true',
+                        help='Generate results/generated/leaderboard.json and .md from the results store '
+                        '(the committed results/leaderboard.* files are never overwritten)')
+    parser.add_argument('--prompt-hash', default=None,
+                        help="With --export-leaderboard, rank results of this prompt hash "
+                        "(default: the most recently run prompt; 'imported' for the legacy results)")
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     
     args = parser.parse_args()
     
+    # Nothing to do: show help without loading anything
+    if not (args.model or args.models or args.list_models or args.export_leaderboard
+            or args.worker or args.queue_status):
+        parser.print_help()
+        return
+    
     # Load configuration
     config = load_config()
     
@@ -66,38 +187,99 @@ Examples:
             print(f"  • {model}")
         return
     
-    # Check if model is provided
-    if not args.model:
-        parser.print_help()
+    # Regenerate leaderboard files if requested
+    if args.export_leaderboard:
+        store = open_results_store()
+        try:
+            leaderboard = export_leaderboard(
+                store, task=args.task, json_path=LEADERBOARD_JSON, markdown_path=LEADERBOARD_MD,
+                prompt_hash=args.prompt_hash, min_models=1 if args.prompt_hash else MIN_RANKED_MODELS
+            )
+        finally:
+            store.close()
+        print(f"✅ Exported {len(leaderboard['leaderboard'])} models to {LEADERBOARD_JSON} and {LEADERBOARD_MD}")
         return
     
-    # Check API keys
-    if not os.getenv('OPENROUTER_API_KEY'):
+    if args.queue_status:
+        report_queue_status(args)
+        return
+    
+    # Enqueueing only splits the sweep into jobs: no API keys needed on this host
+    if args.enqueue:
+        run_enqueue(args, config)
+        return
+    
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Record/replay traffic through a cassette
+    if args.record or args.replay:
+        from benchmark.replay import configure_cassette
+        try:
+            configure_cassette(args.record or args.replay, 'record' if args.record else 'replay')
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            return
+    
+    # Check API keys (not needed when replaying a cassette)
+    if not args.replay and not os.getenv('OPENROUTER_API_KEY'):
         print("❌ Error: OPENROUTER_API_KEY not set in environment")
         print("   Get your key at: https://openrouter.ai/keys")
         print("   Then add to .env file or export OPENROUTER_API_KEY=your_key")
         return
     
-    if not os.getenv('TAVILY_API_KEY'):
+    if not args.replay and not os.getenv('TAVILY_API_KEY'):
         print("❌ Error: TAVILY_API_KEY not set in environment")
         print("   Get your key at: https://tavily.com")
         print("   Then add to .env file or export TAVILY_API_KEY=your_key")
         return
     
+    # Checkpoint every generation and judge call so an interrupted run can resume
+    from benchmark.checkpoints import configure_checkpoints
+    # Workers always resume: a job reclaimed from a dead worker reuses its finished generations
+    checkpoints = configure_checkpoints(resume=args.resume or args.worker)
+    
+    if args.worker:
+        run_worker(args, config, checkpoints)
+        return
+    
+    if args.epochs and args.epochs > 1:
+        run_epochs(args, config, checkpoints)
+        return
+    
+    if args.models:
+        run_sweep(args, config, checkpoints)
+        return
+    
     print(f"\n🚀 Revenue Bench Evaluation")
     print(f"   Model: {args.model}")
     print(f"   Task: {args.task}")
     print("-" * 50)
     
+    from benchmark.tasks.homebase import HomebaseTask
+    from benchmark.judges.multi_judge_scorer import MultiJudgeScorer
+    
     try:
         # Initialize task
         if args.task == 'homebase':
-            task = HomebaseTask()
+            task = HomebaseTask(
+                judge_cache=args.judge_cache,
+                judge_mode=args.judge_mode,
+                dataset=args.dataset,
+                batch_size=args.batch_size,
+                max_prospects=args.max_prospects
+            )
         else:
             print(f"❌ Unknown task: {args.task}")
             print("   Available tasks: homebase")
             return
         
+        evaluation_key = checkpoint_evaluation_key(args, task, args.model)
+        if args.resume and checkpoints.is_complete(evaluation_key):
+            print(f"\n⏭️ {args.model} already completed for this prompt and judge panel - nothing to resume")
+            return
+        
         # Run evaluation
         print(f"\n📝 Running {args.task} task...")
         result = task.evaluate(args.model, verbose=args.verbose)
@@ -106,17 +288,33 @@ Examples:
             print("❌ Evaluation failed - no result returned")
             return
         
-        # Score with judges
+        # A failed run is not recorded or checkpointed as complete, so --resume retries it
+        status = summarize_log(result[0])
+        if status['status'] != 'success':
+            print(f"❌ Evaluation {status['status']}: {status.get('error', 'no error message')}")
+            print("   Nothing was recorded - rerun with --resume to retry")
+            report_telemetry()
+            return
+        
+        # Stream the evaluation record to outputs/evaluations.jsonl
+        record = record_from_eval_log(
+            args.model, args.task, result[0], task.prompt_hash, datetime.now().isoformat()
+        )
+        append_output(record)
+        
+        # Collect the multi-judge panel's scores from the eval log
         print("\n⚖️ Scoring with multi-judge panel...")
-        scorer = MultiJudgeScorer()
+        scorer = MultiJudgeScorer(judge_cache=args.judge_cache, judge_mode=args.judge_mode)
         scores = scorer.score(result, verbose=args.verbose)
+        scores.update(evaluation_costs(args.model))
         
         # Prepare output
         output_data = {
             'model': args.model,
             'task': args.task,
+            'prompt_hash': task.prompt_hash,
             'timestamp': datetime.now().isoformat(),
-            'result': result,
+            'result': record,
             'scores': scores,
             'metadata': {
                 'version': '0.1.0',
@@ -149,12 +347,17 @@ Examples:
                 print(f"  • {criterion}: {score:.1f}/10")
         
         print(f"\n💾 Results saved to: {output_path}")
+        report_cache_stats()
+        report_telemetry()
         
         # Update leaderboard
         update_leaderboard(output_data)
+        checkpoints.mark_complete(evaluation_key, args.model, args.task, task.prompt_hash)
+        report_checkpoint_stats(checkpoints)
         
     except KeyboardInterrupt:
         print("\n\n⚠️ Evaluation interrupted by user")
+        print("   💾 Finished generations and judge calls are checkpointed - rerun with --resume")
         return
     except Exception as e:
         print(f"\n❌ Error during evaluation: {str(e)}")
@@ -164,32 +367,672 @@ Examples:
         return
 
 
-def update_leaderboard(result_data):
-    """Update the leaderboard with new results"""
-    leaderboard_path = Path('results/leaderboard.json')
+def run_sweep(args, config, checkpoints):
+    """Evaluate many models in one process and write one combined result set"""
+    from benchmark.tasks.homebase import HomebaseTask
+    
+    try:
+        models = resolve_models(args.models, config)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
     
-    # Load existing leaderboard
-    if leaderboard_path.exists():
-        with open(leaderboard_path, 'r') as f:
-            leaderboard = json.load(f)
+    if args.task != 'homebase':
+        print(f"❌ Unknown task: {args.task}")
+        print("   Available tasks: homebase")
+        return
+    
+    task = HomebaseTask(
+        judge_cache=args.judge_cache,
+        judge_mode=args.judge_mode,
+        dataset=args.dataset,
+        batch_size=args.batch_size,
+        max_prospects=args.max_prospects
+    )
+    evaluation_keys = {
+        model: checkpoint_evaluation_key(args, task, model) for model in models
+    }
+    
+    # On resume, models whose evaluation was fully recorded are skipped
+    if args.resume:
+        completed = [model for model in models if checkpoints.is_complete(evaluation_keys[model])]
+        if completed:
+            print(f"\n⏭️ Skipping {len(completed)} completed evaluation(s)")
+            models = [model for model in models if model not in completed]
+        if not models:
+            print("✅ Every evaluation in this sweep is already complete")
+            return
+    
+    sweep_config = config.get('sweep', {})
+    max_concurrency = args.max_concurrency or sweep_config.get('max_concurrency', 8)
+    provider_limits = sweep_config.get('provider_limits', {})
+    
+    print(f"\n🚀 Revenue Bench Sweep")
+    print(f"   Models: {len(models)}")
+    print(f"   Task: {args.task}")
+    print(f"   Concurrency: {max_concurrency} (per provider: {provider_limits or 'unlimited'})")
+    print("-" * 50)
+    
+    try:
+        logs = task.evaluate_many(
+            models,
+            max_concurrency=max_concurrency,
+            provider_limits=provider_limits,
+            verbose=args.verbose
+        )
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Sweep interrupted by user")
+        print("   💾 Finished generations and judge calls are checkpointed - rerun with --resume")
+        return
+    except Exception as e:
+        print(f"\n❌ Error during sweep: {str(e)}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return
+    
+    if not logs:
+        print("❌ Sweep failed - no results returned")
+        return
+    
+    timestamp = datetime.now()
+    entries = []
+    for model, log in zip(models, logs):
+        append_output(record_from_eval_log(model, args.task, log, task.prompt_hash, timestamp.isoformat()))
+        scores = summarize_log(log)
+        scores.update(evaluation_costs(model))
+        entry = {
+            'model': model,
+            'task': args.task,
+            'prompt_hash': task.prompt_hash,
+            'timestamp': timestamp.isoformat(),
+            'scores': scores
+        }
+        entries.append(entry)
+        if scores['status'] == 'success':
+            update_leaderboard(entry)
+            checkpoints.mark_complete(evaluation_keys[model], model, args.task, task.prompt_hash)
+    
+    output_data = {
+        'task': args.task,
+        'timestamp': timestamp.isoformat(),
+        'models': entries,
+        'metadata': {
+            'version': '0.1.0',
+            'judges': config.get('judges', []),
+            'max_concurrency': max_concurrency,
+            'provider_limits': provider_limits
+        }
+    }
+    
+    output_dir = Path(args.output)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    output_path = output_dir / f"sweep_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w') as f:
+        json.dump(output_data, f, indent=2)
+    
+    print("\n" + "=" * 50)
+    print("📊 SWEEP RESULTS")
+    print("=" * 50)
+    for entry in sorted(entries, key=lambda e: e['scores']['final_score'], reverse=True):
+        status = "✅" if entry['scores']['status'] == 'success' else "❌"
+        print(f"{status} {entry['model']:<50} {entry['scores']['final_score']:.1%}")
+    
+    print(f"\n💾 Results saved to: {output_path}")
+    print(f"📄 Outputs appended to: {DEFAULT_OUTPUTS_PATH}")
+    report_cache_stats()
+    report_telemetry()
+    report_checkpoint_stats(checkpoints)
+
+
+def run_epochs(args, config, checkpoints):
+    """Run every model for several epochs, stopping each once its score is settled"""
+    from benchmark.tasks.homebase import HomebaseTask
+    
+    try:
+        models = resolve_models(args.models or [args.model], config)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    if args.task != 'homebase':
+        print(f"❌ Unknown task: {args.task}")
+        print("   Available tasks: homebase")
+        return
+    
+    task = HomebaseTask(
+        judge_cache=args.judge_cache,
+        judge_mode=args.judge_mode,
+        dataset=args.dataset,
+        batch_size=args.batch_size,
+        max_prospects=args.max_prospects
+    )
+    evaluation_keys = {model: checkpoint_evaluation_key(args, task, model, epochs=args.epochs) for model in models}
+    
+    # On resume, models whose multi-epoch evaluation was fully recorded are skipped;
+    # the others restore their finished epochs from the checkpoints
+    if args.resume:
+        completed = [model for model in models if checkpoints.is_complete(evaluation_keys[model])]
+        if completed:
+            print(f"\n⏭️ Skipping {len(completed)} completed evaluation(s)")
+            models = [model for model in models if model not in completed]
+        if not models:
+            print("✅ Nothing left to run")
+            return
+    
+    # Multi-epoch results of this prompt already on the leaderboard are neighbours too
+    store = open_results_store()
+    try:
+        reference = leaderboard_intervals(store.latest(args.task, prompt_hash=task.prompt_hash))
+    finally:
+        store.close()
+    tracker = EpochTracker(
+        models, max_epochs=args.epochs, early_stop=not args.no_early_stop, reference=reference
+    )
+    
+    sweep_config = config.get('sweep', {})
+    max_concurrency = args.max_concurrency or sweep_config.get('max_concurrency', 8)
+    provider_limits = sweep_config.get('provider_limits', {})
+    
+    print(f"\n🚀 Revenue Bench Multi-Epoch Evaluation")
+    print(f"   Models: {len(models)}")
+    print(f"   Task: {args.task}")
+    if tracker.early_stop:
+        print(f"   Epochs: {tracker.min_epochs} to {tracker.max_epochs}, +{tracker.round_epochs} per round, "
+              f"stopping at ±{tracker.target_half_width:.1%} ({tracker.confidence:.0%} CI) or a settled rank")
     else:
-        leaderboard = {'models': {}, 'updated': None}
-    
-    # Add or update model
-    model_name = result_data['model']
-    leaderboard['models'][model_name] = {
-        'score': result_data['scores'].get('final_score', 0),
-        'cost': result_data['scores'].get('cost', 0),
-        'timestamp': result_data['timestamp']
+        print(f"   Epochs: {tracker.max_epochs}")
+    if tracker.reference:
+        print(f"   Leaderboard neighbours: {len(tracker.reference)} multi-epoch result(s) of this prompt")
+    print("-" * 50)
+    
+    try:
+        while True:
+            epochs = tracker.next_round()
+            if not epochs:
+                break
+            active = tracker.active()
+            offset = tracker.epochs_run
+            print(f"\n🔁 Epochs {offset + 1}-{offset + epochs} for {len(active)} model(s)")
+            
+            logs = task.evaluate_many(
+                active,
+                max_concurrency=max_concurrency,
+                provider_limits=provider_limits,
+                verbose=args.verbose,
+                epochs=epochs,
+                epoch_offset=offset
+            ) or []
+            
+            # Each round is its own outputs record, so re-scoring sees every epoch
+            timestamp = datetime.now().isoformat()
+            for model, log in zip(active, logs):
+                append_output(record_from_eval_log(
+                    model, args.task, log, task.prompt_hash, timestamp, epoch_offset=offset
+                ))
+                scores = epoch_scores(log, offset) if getattr(log, 'status', None) == 'success' else {}
+                tracker.add(model, list(scores.values()))
+            for model in active[len(logs):]:
+                tracker.add(model, [])
+            
+            for model, reason in tracker.finish_round(epochs).items():
+                summary = tracker.summary(model)
+                low, high = summary['ci']
+                print(f"  ⏹️ {model}: {summary['final_score']:.1%} [{low:.1%}, {high:.1%}] "
+                      f"after {summary['epochs']} epoch(s) - {reason}")
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Evaluation interrupted by user")
+        print("   💾 Finished generations and judge calls are checkpointed - rerun with --resume")
+        return
+    except Exception as e:
+        print(f"\n❌ Error during evaluation: {str(e)}")
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return
+    
+    timestamp = datetime.now()
+    entries = []
+    for model in models:
+        summary = tracker.summary(model)
+        costs = evaluation_costs(model)
+        total_cost = costs['cost']
+        scores = {
+            'status': 'success' if summary['epochs'] else 'error',
+            **summary,
+            'cost': total_cost / summary['epochs'] if summary['epochs'] else total_cost,  # per epoch
+            'total_cost': total_cost,
+            'cost_breakdown': costs['cost_breakdown']
+        }
+        entry = {
+            'model': model,
+            'task': args.task,
+            'prompt_hash': task.prompt_hash,
+            'timestamp': timestamp.isoformat(),
+            'scores': scores
+        }
+        entries.append(entry)
+        if scores['status'] == 'success':
+            update_leaderboard(entry)
+            checkpoints.mark_complete(evaluation_keys[model], model, args.task, task.prompt_hash)
+    
+    output_data = {
+        'task': args.task,
+        'timestamp': timestamp.isoformat(),
+        'models': entries,
+        'metadata': {
+            'version': '0.1.0',
+            'judges': config.get('judges', []),
+            'temperature': task.temperature,
+            'leaderboard_neighbours': sorted(tracker.reference),
+            'max_epochs': tracker.max_epochs,
+            'min_epochs': tracker.min_epochs,
+            'round_epochs': tracker.round_epochs,
+            'confidence': tracker.confidence,
+            'target_half_width': tracker.target_half_width,
+            'early_stop': tracker.early_stop
+        }
+    }
+    
+    output_dir = Path(args.output)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    output_path = output_dir / f"epochs_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w') as f:
+        json.dump(output_data, f, indent=2)
+    
+    print("\n" + "=" * 50)
+    print(f"📊 RESULTS ({tracker.confidence:.0%} bootstrap intervals)")
+    print("=" * 50)
+    for entry in sorted(entries, key=lambda e: e['scores']['final_score'], reverse=True):
+        scores = entry['scores']
+        status = "✅" if scores['status'] == 'success' else "❌"
+        low, high = scores['ci']
+        print(f"{status} {entry['model']:<50} {scores['final_score']:.1%} [{low:.1%}, {high:.1%}] "
+              f"{scores['epochs']} epoch(s)")
+    
+    epochs_run = sum(entry['scores']['epochs'] for entry in entries)
+    fixed = tracker.max_epochs * len(models)
+    if epochs_run < fixed:
+        print(f"\n⏩ Early stopping ran {epochs_run} of {fixed} epochs ({1 - epochs_run / fixed:.0%} saved)")
+    
+    print(f"\n💾 Results saved to: {output_path}")
+    print(f"📄 Outputs appended to: {DEFAULT_OUTPUTS_PATH}")
+    report_cache_stats()
+    report_telemetry()
+    report_checkpoint_stats(checkpoints)
+
+
+def queue_task_params(args, task):
+    """Task parameters stored with queued evaluations, so every worker builds the same task"""
+    dataset = task.dataset_path.resolve()
+    try:
+        # Relative to the repository, so hosts may mount it at different paths
+        dataset = dataset.relative_to(REPO_ROOT.resolve())
+    except ValueError:
+        pass
+    return {
+        'dataset': str(dataset),
+        'batch_size': task.batch_size,
+        'max_prospects': args.max_prospects,
+        'judge_cache': args.judge_cache,
+        'judge_mode': args.judge_mode
     }
-    leaderboard['updated'] = datetime.now().isoformat()
+
+
+def queued_task(params, tasks):
+    """HomebaseTask for a queued evaluation's parameters (built once per worker)"""
+    from benchmark.tasks.homebase import HomebaseTask
+    
+    key = json.dumps(params, sort_keys=True)
+    if key not in tasks:
+        dataset = Path(params['dataset'])
+        tasks[key] = HomebaseTask(
+            judge_cache=params['judge_cache'],
+            judge_mode=params['judge_mode'],
+            dataset=dataset if dataset.is_absolute() else REPO_ROOT / dataset,
+            batch_size=params['batch_size'],
+            max_prospects=params['max_prospects']
+        )
+    return tasks[key]
+
+
+def run_enqueue(args, config):
+    """Split a sweep into (model, task, sample) jobs on the work queue"""
+    from benchmark.tasks.homebase import HomebaseTask
+    from benchmark.workqueue import open_work_queue
+    
+    try:
+        models = resolve_models(args.models or [args.model], config)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    if args.task != 'homebase':
+        print(f"❌ Unknown task: {args.task}")
+        print("   Available tasks: homebase")
+        return
+    
+    if args.epochs and args.epochs > 1:
+        print("❌ --epochs is not supported with the work queue")
+        return
+    
+    task = HomebaseTask(
+        judge_cache=args.judge_cache,
+        judge_mode=args.judge_mode,
+        dataset=args.dataset,
+        batch_size=args.batch_size,
+        max_prospects=args.max_prospects
+    )
+    params = queue_task_params(args, task)
+    sample_ids = [sample.id for sample in task.samples()]
+    
+    queue = open_work_queue(Path(args.queue) if args.queue else None)
+    try:
+        print(f"\n📋 Enqueueing {len(models)} model(s) x {len(sample_ids)} prospect batch(es)")
+        for model in models:
+            key = checkpoint_evaluation_key(args, task, model)
+            added = queue.enqueue(key, model, args.task, task.prompt_hash, params, sample_ids)
+            print(f"  • {model}: {added} job(s) added" if added else f"  • {model}: already queued")
+        stats = queue.stats()
+    finally:
+        queue.close()
+    
+    print(f"\n✅ Queue {queue.path}: {stats['pending']} pending, {stats['leased']} running, "
+          f"{stats['done']} done, {stats['failed']} failed")
+    print("   Start workers (any number, on any host sharing this directory) with:")
+    print("   python run_evaluation.py --worker")
+
+
+def run_worker(args, config, checkpoints):
+    """Claim and run jobs from the work queue until it is drained"""
+    from benchmark.workqueue import DEFAULT_POLL_SECONDS, open_work_queue, worker_id
+    
+    queue = open_work_queue(Path(args.queue) if args.queue else None)
+    worker = worker_id()
+    jobs_per_claim = args.worker_jobs or get_setting('queue.worker_jobs', 4)
+    poll_seconds = get_setting('queue.poll_seconds', DEFAULT_POLL_SECONDS)
     
-    # Save updated leaderboard
-    leaderboard_path.parent.mkdir(exist_ok=True, parents=True)
-    with open(leaderboard_path, 'w') as f:
-        json.dump(leaderboard, f, indent=2)
+    print(f"\n👷 Revenue Bench Worker {worker}")
+    print(f"   Queue: {queue.path}")
+    print(f"   Jobs at once: {jobs_per_claim}")
+    print("-" * 50)
+    
+    tasks = {}
+    totals = {'done': 0, 'failed': 0, 'evaluations': 0}
+    jobs = []
+    try:
+        while True:
+            jobs = queue.claim(worker, jobs_per_claim)
+            claimed = bool(jobs)
+            if jobs:
+                run_jobs(queue, worker, jobs, tasks, config, args, totals)
+                jobs = []
+            totals['evaluations'] += finalize_evaluations(queue, worker, checkpoints)
+            if claimed:
+                continue
+            # Jobs still running elsewhere may come back if their worker dies
+            if not args.wait and not queue.has_open_jobs():
+                break
+            time.sleep(poll_seconds)
+    except KeyboardInterrupt:
+        released = queue.release(worker, [job['id'] for job in jobs])
+        print(f"\n\n⚠️ Worker interrupted by user - {released} unfinished job(s) returned to the queue")
+        return
+    finally:
+        queue.close()
+    
+    print(f"\n✅ Queue drained: this worker finished {totals['done']} job(s) "
+          f"({totals['failed']} failed attempt(s)) and recorded {totals['evaluations']} evaluation(s)")
+    report_cache_stats()
+    report_telemetry()
+    report_checkpoint_stats(checkpoints)
+
+
+def run_jobs(queue, worker, jobs, tasks, config, args, totals):
+    """Run claimed jobs (one Inspect run per task configuration) and store their results"""
+    from benchmark.workqueue import PENDING, Heartbeat
+    
+    provider_limits = config.get('sweep', {}).get('provider_limits', {})
+    
+    # Jobs with the same task parameters run together, one Inspect task per model
+    groups = {}
+    for job in jobs:
+        evaluation = queue.evaluation(job['evaluation_key'])
+        try:
+            task = queued_task(evaluation['params'], tasks)
+        except Exception as e:
+            queue.fail(job['id'], worker, f"Could not load the task: {e}", retry=False)
+            totals['failed'] += 1
+            continue
+        if task.prompt_hash != evaluation['prompt_hash']:
+            # This host has different prompts or prospects: retrying here cannot help
+            queue.fail(job['id'], worker, "Prompt or dataset differs from the enqueued evaluation", retry=False)
+            totals['failed'] += 1
+            continue
+        groups.setdefault(id(task), (task, []))[1].append(job)
+    
+    telemetry = get_telemetry()
+    for task, group in groups.values():
+        by_model = {}
+        for job in group:
+            by_model.setdefault(job['model'], []).append(job)
+        models = list(by_model)
+        print(f"\n🔧 Running {len(group)} job(s): " + ", ".join(
+            f"{model} #{','.join(str(job['sample_id']) for job in model_jobs)}"
+            for model, model_jobs in by_model.items()
+        ))
+        
+        cost_before = {
+            model: telemetry.evaluation_cost(evaluation_label(model)) for model in models
+        }
+        try:
+            with Heartbeat(queue.path, worker, [job['id'] for job in group]) as heartbeat:
+                logs = task.evaluate_many(
+                    models,
+                    max_concurrency=len(models),
+                    provider_limits=provider_limits,
+                    verbose=args.verbose,
+                    sample_ids={model: [job['sample_id'] for job in model_jobs]
+                                for model, model_jobs in by_model.items()}
+                ) or []
+        except Exception as e:
+            logs = []
+            run_error = str(e)
+            if args.verbose:
+                import traceback
+                traceback.print_exc()
+        else:
+            run_error = 'evaluation returned no log'
+            if heartbeat.lost:
+                print("  ⚠️ Some leases ran out while running - those jobs belong to another worker now")
+        
+        logs_by_model = dict(zip(models, logs))
+        for model, model_jobs in by_model.items():
+            log = logs_by_model.get(model)
+            cost = telemetry.evaluation_cost(evaluation_label(model)) - cost_before[model]
+            samples = {sample.id: sample for sample in getattr(log, 'samples', None) or []}
+            for job in model_jobs:
+                sample = samples.get(job['sample_id'])
+                error = None
+                if log is None:
+                    error = run_error
+                elif sample is None or not sample.scores or getattr(sample, 'error', None):
+                    error = getattr(sample, 'error', None) or getattr(log, 'error', None) or 'sample was not scored'
+                    error = getattr(error, 'message', None) or str(error)
+                
+                if error:
+                    status = queue.fail(job['id'], worker, error)
+                    totals['failed'] += 1
+                    outcome = 'will retry' if status == PENDING else 'giving up' if status else 'lease lost'
+                    print(f"  ❌ {model} #{job['sample_id']} (attempt {job['attempts']}): {error} - {outcome}")
+                    continue
+                
+                result = sample_record(sample)
+                result['cost'] = cost / len(model_jobs)
+                if queue.complete(job['id'], worker, result):
+                    totals['done'] += 1
+                    print(f"  ✅ {model} #{job['sample_id']}: {result['score']}")
+                else:
+                    print(f"  ⚠️ {model} #{job['sample_id']}: lease lost, result discarded")
+
+
+def finalize_evaluations(queue, worker, checkpoints):
+    """Record evaluations whose jobs have all finished; returns how many this worker recorded"""
+    finished = queue.claim_finished(worker)
+    for evaluation in finished:
+        model, task, results = evaluation['model'], evaluation['task'], evaluation['results']
+        scores = [r['score'] for r in results if isinstance(r['score'], (int, float))]
+        score = sum(scores) / len(scores) if scores else 0.0
+        cost = sum(r.get('cost', 0.0) for r in results)
+        status = 'success' if results and not evaluation['errors'] else 'error'
+        timestamp = datetime.now().isoformat()
+        
+        record = add_sample_records({
+            'model': model.split('/')[-1],
+            'full_model': model,
+            'task': task,
+            'prompt_hash': evaluation['prompt_hash'],
+            'timestamp': timestamp,
+            'status': status,
+            'score': score,
+            'cost': cost
+        }, results)
+        if evaluation['errors']:
+            record['errors'] = {str(sample_id): error for sample_id, error in evaluation['errors'].items()}
+        append_output(record)
+        
+        if status == 'success':
+            print(f"\n🏁 {model}: {score:.1%} over {len(results)} prospect batch(es), ${cost:.4f}")
+            update_leaderboard({
+                'model': model,
+                'task': task,
+                'prompt_hash': evaluation['prompt_hash'],
+                'timestamp': timestamp,
+                'scores': {'final_score': score, 'cost': cost}
+            })
+            checkpoints.mark_complete(evaluation['key'], model, task, evaluation['prompt_hash'])
+        else:
+            print(f"\n❌ {model}: {len(evaluation['errors'])} job(s) failed for good "
+                  f"- run --enqueue again to retry them")
+    return len(finished)
+
+
+def report_queue_status(args):
+    """Print work queue progress per evaluation and the workers holding jobs"""
+    from benchmark.workqueue import open_work_queue
+    
+    queue = open_work_queue(Path(args.queue) if args.queue else None)
+    try:
+        stats = queue.stats()
+        evaluations = queue.evaluation_stats()
+        workers = queue.workers()
+    finally:
+        queue.close()
+    
+    print(f"\n📋 Work Queue: {queue.path}")
+    print(f"   {stats['pending']} pending, {stats['leased']} running, {stats['done']} done, {stats['failed']} failed")
+    
+    if evaluations:
+        print(f"\n   {'model':<50} {'done':>6} {'running':>8} {'pending':>8} {'failed':>7}")
+        for evaluation in evaluations:
+            if evaluation['finalized_at']:
+                status = "❌" if evaluation['failed'] else "✅"
+            else:
+                status = "⏳"
+            print(f"{status} {evaluation['model']:<50} {evaluation['done']:>6} {evaluation['leased']:>8} "
+                  f"{evaluation['pending']:>8} {evaluation['failed']:>7}")
+    
+    if workers:
+        print("\n👷 Workers:")
+        for worker in workers:
+            remaining = worker['lease_expires'] - time.time()
+            state = f"lease expires in {remaining:.0f}s" if remaining > 0 else "lease expired (to be reclaimed)"
+            print(f"  • {worker['worker']}: {worker['jobs']} job(s), {state}")
+
+
+def report_telemetry():
+    """Print where time and money went, and write the run's telemetry files"""
+    telemetry = get_telemetry()
+    summary = telemetry.summary()
+    if not summary['total']['spans']:
+        return
+    
+    print("\n⏱️ Time and Cost Breakdown:")
+    for operation, totals in sorted(summary['operations'].items(), key=lambda item: -item[1]['wall_time']):
+        print(f"  • {operation}: {totals['spans']} calls, {totals['wall_time']:.1f}s "
+              f"(max {totals['max_wall_time']:.1f}s, {totals['queue_wait']:.1f}s queued), "
+              f"{totals['input_tokens'] + totals['output_tokens']} tokens, ${totals['cost']:.4f}"
+              + (f", {totals['cache_read_tokens']} cache-read tokens" if totals['cache_read_tokens'] else "")
+              + (f", {totals['retries']} retries" if totals['retries'] else ""))
+    total = summary['total']
+    print(f"  Total cost: ${total['cost']:.4f}")
+    if total['input_tokens']:
+        print(f"  Prompt cache: {total['cache_read_tokens']} of {total['input_tokens']} input tokens read from cache "
+              f"({total['cache_read_tokens'] / total['input_tokens']:.0%})")
+    
+    if get_setting('telemetry.enabled', True):
+        paths = telemetry.write_summary()
+        print(f"📈 Telemetry written to: {paths['json']} and {paths['prometheus']}")
+
+
+def report_cache_stats():
+    """Print hit/miss statistics for the persistent caches used in this run"""
+    from benchmark.ratelimit import rate_limit_stats  # imports asyncio
+    
+    stats = cache_stats()
+    if stats:
+        print("\n📦 Cache Statistics:")
+        for name, cache in stats.items():
+            print(f"  • {name}: {cache['hits']} hits / {cache['misses']} misses "
+                  f"({cache['hit_rate']:.1%} hit rate), {cache['entries']} entries, "
+                  f"{cache['evictions']} evicted")
+    
+    throttling = {name: s for name, s in rate_limit_stats().items() if s['throttled']}
+    if throttling:
+        print("\n🚦 Rate Limiting:")
+        for name, limiter in throttling.items():
+            print(f"  • {name}: throttled {limiter['throttled']}x, {limiter['retries']} retries, "
+                  f"concurrency now {limiter['concurrency_limit']}")
+
+
+def report_checkpoint_stats(checkpoints):
+    """Print how much work a resumed run restored from checkpoints"""
+    stats = checkpoints.stats()
+    if stats['restored_generations'] or stats['restored_judgements']:
+        print(f"\n💾 Resumed from checkpoints: {stats['restored_generations']} generation(s), "
+              f"{stats['restored_judgements']} judge call(s)")
+
+
+def update_leaderboard(result_data):
+    """Record a result in the results store and regenerate the generated leaderboard"""
+    scores = result_data['scores']
+    metadata = None
+    if 'ci' in scores:
+        # Multi-epoch result: keep its interval for the leaderboard
+        metadata = {'epochs': scores['epochs'], 'ci': scores['ci'], 'confidence': scores['confidence']}
+    
+    store = open_results_store()
+    try:
+        store.record(
+            model=result_data['model'],
+            task=result_data['task'],
+            score=scores.get('final_score', 0),
+            cost=scores.get('cost', 0),
+            prompt_hash=result_data.get('prompt_hash', ''),
+            timestamp=result_data['timestamp'],
+            metadata=metadata
+        )
+        export_leaderboard(
+            store,
+            task=result_data['task'],
+            json_path=LEADERBOARD_JSON,
+            markdown_path=LEADERBOARD_MD,
+            prompt_hash=result_data.get('prompt_hash') or None
+        )
+    finally:
+        store.close()
     
-    print(f"✅ Leaderboard updated: {leaderboard_path}")
+    print(f"✅ Leaderboard updated: {LEADERBOARD_JSON} and {LEADERBOARD_MD}")
 
 
 if __name__ == '__main__':